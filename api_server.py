@@ -0,0 +1,420 @@
+"""
+Availability API Server
+
+A small asyncio HTTP server over availability.AvailabilityIndex, so clients
+can ask for the rooms that match instead of downloading all of
+classrooms.json and filtering it in the browser.
+
+    GET /free?day=Monday&start=10:00AM&end=11:00AM&min_cap=30&max_cap=100
+             &building=BOELTER&feature=Air+Conditioning&limit=50
+        Rooms free for the whole window, ranked as in AvailabilityIndex.free_rooms.
+        day/start default to now, end to start + 60 minutes; feature may repeat.
+        With near=LAT,LON the rooms are ranked by distance instead (nearby.NearbyIndex),
+        each with 'distance' in metres; limit (default 10) is then the k nearest.
+        limit means the same in both modes: a count of rooms, 0 for none, never negative.
+    GET /room/{id}
+        One room record (id as in room_keys.room_id, e.g. boelter-2444) with its
+        free slots per day.
+    GET /buildings
+        Building code -> number of rooms.
+    GET /events
+        Server-sent events: a 'snapshot' of which rooms are busy and free, then a
+        'free' or 'busy' event whenever a class starts or ends (see AvailabilityStream).
+
+Every 200 response carries an ETag (hash of the body) and Cache-Control;
+If-None-Match answers 304. Responses are kept in an LRU cache keyed by path
+and normalized query. The data file is polled for changes and the index is
+rebuilt off the event loop, then swapped in on it; the swap clears the cache.
+
+Usage:
+    python api_server.py [--port=8080] [--host=127.0.0.1] [--data=classrooms.json] [--term=26W]
+"""
+
+import asyncio
+import datetime
+import hashlib
+import heapq
+import json
+import os
+import urllib.parse
+from collections import OrderedDict
+from http import HTTPStatus
+
+from availability import DAYS, AvailabilityIndex, format_time, parse_time
+from nearby import NearbyIndex
+
+DATA_PATH = 'classrooms.json'
+POLL_INTERVAL = 2.0
+CACHE_SIZE = 1024
+# Seconds between SSE keep-alive comments, and events a client may fall behind before it is dropped
+HEARTBEAT = 30
+QUEUE_SIZE = 256
+# Rooms returned by a near= query without a limit
+NEAR_LIMIT = 10
+# Cache-Control max-age per route, in seconds
+MAX_AGE = {'free': 60, 'room': 300, 'buildings': 300}
+
+
+class RequestError(Exception):
+    """A client error returned as a JSON body with the given HTTP status."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def parse_limit(query, default=None):
+    """
+    The limit query parameter as a room count, for both /free modes.
+
+    Args:
+        query: Parsed query string (urllib.parse.parse_qs)
+        default: Returned when limit is missing or empty (None: no limit)
+
+    Returns:
+        An int >= 0, or default
+    """
+    if not query.get('limit'):
+        return default
+    limit = int(query['limit'][0])
+    if limit < 0:
+        raise ValueError(f"limit must not be negative: {limit}")
+    return limit
+
+
+def room_summary(room):
+    record = room.record
+    return {'id': room.id, 'text': record['text'], 'building': record['building'], 'room': record['room'].strip(),
+            'capacity': record.get('capacity'), 'type': record.get('type')}
+
+
+def minute_of(now):
+    return now.hour * 60 + now.minute
+
+
+class AvailabilityStream:
+    """
+    Live free/busy transitions of every room, fanned out to SSE clients from one timer.
+
+    For today, each room's next change (the end of its current class or the start of
+    its next one) sits in a heap. The run() task sleeps until the earliest change, the
+    heartbeat or midnight, applies every change that is due and puts one event per
+    room that flipped on each client's queue. A new day or a reloaded index is diffed
+    against the previous states. Clients more than QUEUE_SIZE events behind are dropped.
+
+    Args:
+        api: AvailabilityAPI whose index to follow
+        clock: Returns the current local datetime (replaceable for testing)
+    """
+
+    def __init__(self, api, clock=datetime.datetime.now, heartbeat=HEARTBEAT):
+        self.api = api
+        self.clock = clock
+        self.heartbeat = heartbeat
+        self.clients = set()
+        self.index = None
+        self.day = None
+        self.busy = {}
+        self.heap = []
+        self.wakeup = asyncio.Event()
+
+    def _event(self, rid, busy, minute, change):
+        until = format_time(change) if change is not None else None
+        return ('busy' if busy else 'free', {'id': rid, 'at': format_time(minute), 'until': until})
+
+    def advance(self, now):
+        """Apply every change due at `now` and return the (event name, data) pairs to send."""
+        day, minute = DAYS[now.weekday()], minute_of(now)
+        events = []
+        if self.index is not self.api.index or self.day != day:
+            previous = self.busy
+            self.index, self.day, self.busy, self.heap = self.api.index, day, {}, []
+            for rid, room in self.index.rooms.items():
+                busy, change = room.next_change(day, minute)
+                self.busy[rid] = busy
+                if change is not None:
+                    self.heap.append((change, rid))
+                if previous and previous.get(rid, False) != busy:
+                    events.append(self._event(rid, busy, minute, change))
+            heapq.heapify(self.heap)
+            return events
+
+        while self.heap and self.heap[0][0] <= minute:
+            _, rid = heapq.heappop(self.heap)
+            busy, change = self.index.rooms[rid].next_change(day, minute)
+            if change is not None:
+                heapq.heappush(self.heap, (change, rid))
+            if busy != self.busy[rid]:
+                self.busy[rid] = busy
+                events.append(self._event(rid, busy, minute, change))
+        return events
+
+    def snapshot(self, now):
+        return {'day': self.day, 'time': format_time(minute_of(now)),
+                'busy': sorted(rid for rid, busy in self.busy.items() if busy),
+                'free': sorted(rid for rid, busy in self.busy.items() if not busy)}
+
+    @staticmethod
+    def format(name, data):
+        return f"event: {name}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n".encode()
+
+    def broadcast(self, message):
+        for queue in list(self.clients):
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # Too slow: replace its backlog with the end-of-stream marker
+                self.clients.discard(queue)
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(None)
+
+    def sync(self):
+        """Bring the states up to the current time and send any changes; returns the time used."""
+        now = self.clock()
+        for name, data in self.advance(now):
+            self.broadcast(self.format(name, data))
+        return now
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        last_heartbeat = loop.time()
+        while True:
+            now = self.sync()
+            seconds = now.hour * 3600 + now.minute * 60 + now.second + now.microsecond / 1e6
+            delay = min(self.heartbeat, 24 * 3600 - seconds)
+            if self.heap:
+                delay = min(delay, self.heap[0][0] * 60 - seconds)
+            try:
+                await asyncio.wait_for(self.wakeup.wait(), max(delay, 0.05))
+            except asyncio.TimeoutError:
+                pass
+            self.wakeup.clear()
+            if loop.time() - last_heartbeat >= self.heartbeat:
+                self.broadcast(b": keep-alive\n\n")
+                last_heartbeat = loop.time()
+
+    async def serve_client(self, writer):
+        """Stream events to one client until it disconnects or falls too far behind."""
+        queue = asyncio.Queue(QUEUE_SIZE)
+        now = self.sync()
+        self.clients.add(queue)
+        try:
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nCache-Control: no-cache\r\n"
+                         b"Access-Control-Allow-Origin: *\r\nConnection: close\r\n\r\n")
+            writer.write(self.format('snapshot', self.snapshot(now)))
+            await writer.drain()
+            while True:
+                message = await queue.get()
+                if message is None:
+                    break
+                writer.write(message)
+                await writer.drain()
+        finally:
+            self.clients.discard(queue)
+
+
+class AvailabilityAPI:
+    """
+    Routes, response cache and hot reload around one AvailabilityIndex.
+
+    Args:
+        path: classrooms.json to serve
+        term: Term whose schedules to index (default: each room's primary term)
+        poll_interval: Seconds between checks of the data file's modification time
+        cache_size: Responses kept in the LRU cache
+    """
+
+    def __init__(self, path=DATA_PATH, term=None, poll_interval=POLL_INTERVAL, cache_size=CACHE_SIZE):
+        self.path = path
+        self.term = term
+        self.poll_interval = poll_interval
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.index = None
+        self.nearby = None
+        self.mtime = None
+        self.install(*self.build())
+        self.stream = AvailabilityStream(self)
+
+    def build(self):
+        """
+        Build the indexes from the data file without touching the served ones, so it
+        can run in a worker thread.
+
+        Returns:
+            (AvailabilityIndex, NearbyIndex, data file mtime)
+        """
+        mtime = os.stat(self.path).st_mtime_ns
+        index = AvailabilityIndex.from_file(self.path, term=self.term)
+        return index, NearbyIndex(index), mtime
+
+    def install(self, index, nearby, mtime):
+        """Swap in indexes from build() and clear the cache; only call on the event loop's thread."""
+        self.index, self.nearby, self.mtime = index, nearby, mtime
+        self.cache.clear()
+        print(f"Loaded {len(index.rooms)} rooms from {self.path}")
+
+    async def watch(self):
+        """Reload whenever the data file's modification time changes."""
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                if os.stat(self.path).st_mtime_ns != self.mtime:
+                    # get() reads the index and cache on this thread, so the swap happens here too
+                    self.install(*await loop.run_in_executor(None, self.build))
+                    self.stream.wakeup.set()
+            except (OSError, ValueError) as e:
+                # Half-written file or bad JSON: keep serving the old index and retry next poll
+                print(f"WARNING: reload of {self.path} failed: {e}")
+
+    def free(self, query):
+        now = datetime.datetime.now()
+        day = (query.get('day', [None])[0] or DAYS[now.weekday()]).capitalize()
+        if day not in DAYS:
+            raise RequestError(HTTPStatus.BAD_REQUEST, f"Unknown day: {day}")
+        try:
+            start = parse_time(query['start'][0]) if query.get('start') else now.hour * 60 + now.minute
+            end = parse_time(query['end'][0]) if query.get('end') else start + 60
+            min_cap = int(query['min_cap'][0]) if query.get('min_cap') else None
+            max_cap = int(query['max_cap'][0]) if query.get('max_cap') else None
+            near = [float(value) for value in query['near'][0].split(',')] if query.get('near') else None
+            limit = parse_limit(query, NEAR_LIMIT if near is not None else None)
+        except ValueError as e:
+            raise RequestError(HTTPStatus.BAD_REQUEST, str(e))
+        if end <= start:
+            raise RequestError(HTTPStatus.BAD_REQUEST, "end must be after start")
+
+        if near is not None:
+            if len(near) != 2:
+                raise RequestError(HTTPStatus.BAD_REQUEST, "near must be LAT,LON")
+            results = self.nearby.nearest_free(near[0], near[1], day, start, end, limit,
+                                               min_cap, max_cap, (query.get('building') or [None])[0],
+                                               query.get('feature', []))
+            rooms = [dict(room_summary(self.index.rooms[r['id']]), free_until=format_time(r['free_until']),
+                          distance=r['distance']) for r in results]
+            return {'day': day, 'start': format_time(start), 'end': format_time(end), 'count': len(rooms),
+                    'rooms': rooms}
+
+        results = self.index.free_rooms(day, start, end, min_cap, max_cap,
+                                        (query.get('building') or [None])[0], query.get('feature', []))
+        rooms = [dict(room_summary(self.index.rooms[r['id']]), free_until=format_time(r['free_until']))
+                 for r in results[:limit]]
+        return {'day': day, 'start': format_time(start), 'end': format_time(end), 'count': len(results), 'rooms': rooms}
+
+    def room(self, rid):
+        room = self.index.rooms.get(rid)
+        if room is None:
+            raise RequestError(HTTPStatus.NOT_FOUND, f"Unknown room: {rid}")
+        free_slots = {day: [[format_time(start), format_time(end)] for start, end in room.free_slots(day)]
+                      for day in DAYS}
+        return dict(room.record, id=room.id, free_slots=free_slots)
+
+    def route(self, path, query):
+        """Return (route name, body object) for a GET, or raise RequestError."""
+        parts = [part for part in path.split('/') if part]
+        if parts == ['free']:
+            return 'free', self.free(query)
+        if len(parts) == 2 and parts[0] == 'room':
+            return 'room', self.room(urllib.parse.unquote(parts[1]))
+        if parts == ['buildings']:
+            return 'buildings', self.index.buildings()
+        raise RequestError(HTTPStatus.NOT_FOUND, f"No route for {path}")
+
+    def get(self, target):
+        """
+        Serve a GET request target from the cache or the index.
+
+        Returns:
+            (status, body bytes, etag or None, max_age)
+        """
+        parsed = urllib.parse.urlsplit(target)
+        query = urllib.parse.parse_qs(parsed.query)
+        key = (parsed.path.rstrip('/'), tuple(sorted((name, tuple(values)) for name, values in query.items())))
+        # Queries defaulting to "now" change every minute, so they are not cached
+        cacheable = parsed.path.rstrip('/') != '/free' or ('day' in query and 'start' in query)
+        if cacheable and key in self.cache:
+            self.cache.move_to_end(key)
+            return self.cache[key]
+
+        try:
+            name, data = self.route(parsed.path, query)
+        except RequestError as e:
+            return e.status, json.dumps({'error': str(e)}).encode(), None, 0
+        body = json.dumps(data, separators=(',', ':')).encode()
+        response = (HTTPStatus.OK, body, f'"{hashlib.sha1(body).hexdigest()[:20]}"', MAX_AGE[name])
+        if cacheable:
+            self.cache[key] = response
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return response
+
+    async def handle(self, reader, writer):
+        """Serve HTTP/1.1 requests on one connection until the client closes it."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    break
+                if method == 'GET' and urllib.parse.urlsplit(target).path.rstrip('/') == '/events':
+                    await self.stream.serve_client(writer)
+                    break
+                if method not in ('GET', 'HEAD'):
+                    status, body, etag, max_age = HTTPStatus.METHOD_NOT_ALLOWED, b'{"error":"GET only"}', None, 0
+                else:
+                    status, body, etag, max_age = self.get(target)
+                if etag and headers.get('if-none-match') == etag:
+                    status, body = HTTPStatus.NOT_MODIFIED, b''
+
+                keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+                response = [f"HTTP/1.1 {status.value} {status.phrase}",
+                            "Content-Type: application/json",
+                            f"Content-Length: {len(body)}",
+                            "Access-Control-Allow-Origin: *",
+                            f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+                if etag:
+                    response += [f"ETag: {etag}", f"Cache-Control: public, max-age={max_age}"]
+                writer.write(('\r\n'.join(response) + '\r\n\r\n').encode('latin-1'))
+                if method != 'HEAD':
+                    writer.write(body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(host='127.0.0.1', port=8080, path=DATA_PATH, term=None):
+    api = AvailabilityAPI(path, term)
+    server = await asyncio.start_server(api.handle, host, port)
+    print(f"Serving availability API on http://{host}:{port}")
+    async with server:
+        await asyncio.gather(server.serve_forever(), api.watch(), api.stream.run())
+
+
+if __name__ == "__main__":
+    import sys
+
+    options = dict(arg.partition('=')[::2] for arg in sys.argv[1:] if arg.startswith('--'))
+    try:
+        asyncio.run(serve(host=options.get('--host') or '127.0.0.1',
+                          port=int(options.get('--port') or 8080),
+                          path=options.get('--data') or DATA_PATH,
+                          term=options.get('--term') or None))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,308 @@
+"""
+Room Availability Index
+
+The Python counterpart of the frontend's isRoomFreeAtTime / getFreeTimes, for
+scripts, bots and the API server. Each room's schedule is loaded once into
+per-day sorted, merged busy intervals (minutes since midnight), so a free
+check is one bisect instead of a scan over the day's classes. Building,
+feature and capacity indexes narrow the candidates before any interval is
+looked at.
+
+Rooms are identified by room_keys.room_id ('boelter-2444'). Like the
+frontend, only offered rooms are loaded by default, a room without a schedule
+for a day is free all day, and free time is reported between DAY_START and
+DAY_END.
+
+Usage:
+    index = AvailabilityIndex.from_file('classrooms.json')
+    index.free_rooms('Monday', '10:00 AM', '11:00 AM', min_cap=30, features=['Air Conditioning'])
+
+    python availability.py Monday 10:00AM 11:00AM [--min-cap=30] [--max-cap=100]
+                           [--building=BOELTER] [--feature="Air Conditioning"] [--term=26W] [--limit=20]
+"""
+
+import json
+import re
+from bisect import bisect_left, bisect_right
+
+from room_keys import canonical_building, room_id
+
+# Same order as scrape.DAYS
+DAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+DAY_START = 8 * 60
+DAY_END = 22 * 60
+
+TIME_RE = re.compile(r'^\s*(\d{1,2}):?(\d{2})\s*([AaPp][Mm])?\s*$')
+
+
+def parse_time(value):
+    """
+    Minutes since midnight for '02:00 PM', '2:00pm', '14:00', '1400' or an int (already minutes).
+    Raises ValueError for anything else, including out-of-range times like '13:00 PM' or '10:99'.
+    """
+    if isinstance(value, int):
+        return value
+    match = TIME_RE.match(value)
+    if not match:
+        raise ValueError(f"Unrecognized time: {value!r}")
+    hours, minutes, meridiem = int(match.group(1)), int(match.group(2)), (match.group(3) or '').upper()
+    if minutes > 59 or hours > (12 if meridiem else 23):
+        raise ValueError(f"Unrecognized time: {value!r}")
+    if meridiem == 'PM' and hours != 12:
+        hours += 12
+    elif meridiem == 'AM' and hours == 12:
+        hours = 0
+    return hours * 60 + minutes
+
+
+def format_time(minutes):
+    """'02:00 PM' style text for minutes since midnight (the format used in classrooms.json)."""
+    hours, minutes = divmod(minutes, 60)
+    meridiem = 'AM' if hours < 12 or hours == 24 else 'PM'
+    return f"{(hours - 1) % 12 + 1:02d}:{minutes:02d} {meridiem}"
+
+
+def schedule_for(room, term=None):
+    """A room's schedule for a term: the primary term's is top-level, others are under 'terms'."""
+    if not term or not room.get('term') or term == room['term']:
+        return room.get('schedule')
+    term_data = (room.get('terms') or {}).get(term)
+    return term_data['schedule'] if term_data else None
+
+
+def store_term_result(classroom, term, schedule, no_calendar, primary):
+    """
+    Store one term's schedule on a classroom record.
+
+    The primary term lives in the top-level 'schedule'/'no_calendar' fields (with
+    its code in 'term') so single-term consumers keep working; other terms go
+    under 'terms' keyed by term code. If the primary term changes, the previous
+    primary schedule is moved under 'terms'.
+    """
+    if primary:
+        previous = classroom.get('term')
+        if previous and previous != term and 'schedule' in classroom:
+            classroom.setdefault('terms', {})[previous] = {
+                'schedule': classroom.get('schedule'),
+                'no_calendar': classroom.get('no_calendar')
+            }
+        classroom['term'] = term
+        classroom['schedule'] = schedule
+        classroom['no_calendar'] = no_calendar
+        if classroom.get('terms'):
+            classroom['terms'].pop(term, None)
+    else:
+        classroom.setdefault('terms', {})[term] = {'schedule': schedule, 'no_calendar': no_calendar}
+
+
+def event_minutes(event):
+    """
+    (start, end) minutes of an event, or None if a time is missing or unreadable or the event
+    does not end after it starts (the scraper writes end_time '' when it cannot read one).
+    """
+    try:
+        start, end = parse_time(event.get('start_time') or ''), parse_time(event.get('end_time') or '')
+    except (TypeError, ValueError):
+        return None
+    return (start, end) if end > start else None
+
+
+def busy_intervals(events):
+    """
+    Sorted (starts, ends) of a day's events, with overlapping or touching events merged.
+    Events without usable times (see event_minutes) are left out.
+    """
+    intervals = sorted(filter(None, map(event_minutes, events)))
+    starts, ends = [], []
+    for start, end in intervals:
+        if starts and start <= ends[-1]:
+            ends[-1] = max(ends[-1], end)
+        else:
+            starts.append(start)
+            ends.append(end)
+    return starts, ends
+
+
+class RoomAvailability:
+    """One room's record and its busy intervals per day."""
+
+    __slots__ = ('id', 'record', 'days', 'skipped')
+
+    def __init__(self, record, term=None):
+        self.id = room_id(record['building'], record['room'])
+        self.record = record
+        schedule = schedule_for(record, term) or {}
+        self.days = {day: busy_intervals(schedule.get(day) or []) for day in DAYS}
+        # Events left out of the intervals because their times could not be used
+        self.skipped = sum(1 for day in DAYS for event in schedule.get(day) or [] if event_minutes(event) is None)
+
+    def is_free(self, day, start, end):
+        """True if no class overlaps [start, end)."""
+        starts, ends = self.days[day]
+        # First interval ending after start; it must not begin before end
+        i = bisect_right(ends, start)
+        return i == len(starts) or starts[i] >= end
+
+    def free_until(self, day, at):
+        """Minute the room's current free stretch ends (next class or DAY_END), or None if busy at `at`."""
+        starts, ends = self.days[day]
+        i = bisect_right(ends, at)
+        if i < len(starts) and starts[i] <= at:
+            return None
+        return starts[i] if i < len(starts) else max(DAY_END, at)
+
+    def next_change(self, day, at):
+        """
+        (busy, minute): whether a class is in progress at `at`, and the minute that changes
+        (the class's end when busy, the next class's start when free), or None if the room
+        stays as it is for the rest of the day.
+        """
+        starts, ends = self.days[day]
+        i = bisect_right(ends, at)
+        if i == len(starts):
+            return False, None
+        if starts[i] <= at:
+            return True, ends[i]
+        return False, starts[i]
+
+    def next_free_slot(self, day, at, duration=1):
+        """
+        Earliest (start, end) free gap of at least `duration` minutes beginning at or after
+        `at` and before DAY_END, or None if there is none left that day.
+        """
+        starts, ends = self.days[day]
+        cursor = at
+        for i in range(bisect_right(ends, at), len(starts)):
+            if starts[i] - cursor >= duration:
+                return cursor, starts[i]
+            cursor = max(cursor, ends[i])
+        return (cursor, DAY_END) if DAY_END - cursor >= duration else None
+
+    def free_slots(self, day, start=DAY_START, end=DAY_END):
+        """Every free (start, end) gap between start and end, like the frontend's getFreeTimes."""
+        starts, ends = self.days[day]
+        slots = []
+        cursor = start
+        for i in range(bisect_right(ends, start), len(starts)):
+            if starts[i] >= end:
+                break
+            if starts[i] > cursor:
+                slots.append((cursor, starts[i]))
+            cursor = max(cursor, ends[i])
+        if cursor < end:
+            slots.append((cursor, end))
+        return slots
+
+
+class AvailabilityIndex:
+    """
+    Interval, building, feature and capacity indexes over a list of room records.
+
+    Args:
+        classrooms: Records as stored in classrooms.json
+        term: Term whose schedules to index (default: each room's primary term)
+        offered_only: Skip rooms that are not offered, as the frontend does
+    """
+
+    def __init__(self, classrooms, term=None, offered_only=True):
+        self.term = term
+        self.rooms = {}
+        self.by_building = {}
+        self.by_feature = {}
+        for record in classrooms:
+            if not record.get('building') or (offered_only and not record.get('offered')):
+                continue
+            room = RoomAvailability(record, term)
+            self.rooms[room.id] = room
+            self.by_building.setdefault(canonical_building(record['building']), set()).add(room.id)
+            for feature in record.get('characteristics') or []:
+                self.by_feature.setdefault(feature, set()).add(room.id)
+        # Capacities sorted for range queries (ids in the same order); rooms without one are kept apart
+        by_capacity = sorted((room.record['capacity'], room.id)
+                             for room in self.rooms.values() if room.record.get('capacity'))
+        self.capacities = [capacity for capacity, _ in by_capacity]
+        self.capacity_ids = [rid for _, rid in by_capacity]
+        self.no_capacity = {room.id for room in self.rooms.values() if not room.record.get('capacity')}
+        skipped = [room.id for room in self.rooms.values() if room.skipped]
+        if skipped:
+            print(f"WARNING: ignored {sum(self.rooms[rid].skipped for rid in skipped)} events without a usable "
+                  f"start/end time in {len(skipped)} rooms ({', '.join(skipped[:5])}{', ...' if len(skipped) > 5 else ''})")
+
+    @classmethod
+    def from_file(cls, path='classrooms.json', **kwargs):
+        with open(path, 'r') as f:
+            return cls(json.load(f), **kwargs)
+
+    def buildings(self):
+        """Building code -> number of rooms."""
+        return {building: len(ids) for building, ids in sorted(self.by_building.items())}
+
+    def candidates(self, min_cap=None, max_cap=None, building=None, features=()):
+        """Ids of rooms passing the non-time filters, using the smallest index first."""
+        sets = []
+        if building:
+            sets.append(self.by_building.get(canonical_building(building), set()))
+        for feature in features or ():
+            sets.append(self.by_feature.get(feature, set()))
+        if min_cap or max_cap:
+            low = bisect_left(self.capacities, min_cap) if min_cap else 0
+            high = bisect_right(self.capacities, max_cap) if max_cap else len(self.capacities)
+            in_range = set(self.capacity_ids[low:high])
+            # Like the frontend, an unknown capacity only fails a minimum
+            sets.append(in_range if min_cap else in_range | self.no_capacity)
+        if not sets:
+            return set(self.rooms)
+        sets.sort(key=len)
+        return set.intersection(*sets)
+
+    def free_rooms(self, day, start, end, min_cap=None, max_cap=None, building=None, features=()):
+        """
+        Rooms free for all of [start, end) on day, ranked by how long they stay free
+        afterwards, then by smallest capacity, then id.
+
+        Returns:
+            List of dicts with 'id', 'room' (the record) and 'free_until' (minutes)
+        """
+        start, end = parse_time(start), parse_time(end)
+        results = []
+        for rid in self.candidates(min_cap, max_cap, building, features):
+            room = self.rooms[rid]
+            if room.is_free(day, start, end):
+                results.append({'id': rid, 'room': room.record, 'free_until': room.free_until(day, start)})
+        results.sort(key=lambda r: (-r['free_until'], r['room'].get('capacity') or 0, r['id']))
+        return results
+
+    def free_until(self, rid, day, at):
+        """See RoomAvailability.free_until; raises KeyError for an unknown room id."""
+        return self.rooms[rid].free_until(day, parse_time(at))
+
+    def next_free_slot(self, rid, day, at, duration=1):
+        """See RoomAvailability.next_free_slot; raises KeyError for an unknown room id."""
+        return self.rooms[rid].next_free_slot(day, parse_time(at), duration)
+
+
+if __name__ == "__main__":
+    import sys
+
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    options = {}
+    for arg in sys.argv[1:]:
+        if arg.startswith('--'):
+            name, _, value = arg.partition('=')
+            options.setdefault(name, []).append(value)
+    if len(args) != 3:
+        print(__doc__)
+        sys.exit(1)
+
+    def option(name, cast=str):
+        return cast(options[name][-1]) if options.get(name) and options[name][-1] else None
+
+    index = AvailabilityIndex.from_file(term=option('--term'))
+    day = args[0].capitalize()
+    results = index.free_rooms(day, args[1], args[2], min_cap=option('--min-cap', int),
+                               max_cap=option('--max-cap', int), building=option('--building'),
+                               features=options.get('--feature', []))
+    for result in results[:option('--limit', int) or 20]:
+        room = result['room']
+        print(f"{room['text']:<24} cap {room.get('capacity') or '?':>4}  free until {format_time(result['free_until'])}")
+    print(f"{len(results)} rooms free on {day} {args[1]}-{args[2]}")
@@ -0,0 +1,123 @@
+"""
+Catalog Data Loader
+
+Reads the versioned data files under data/:
+
+    buildings.json           registrar building code -> {'name', 'aliases', 'location': [lat, lon]}
+    classroom_options.json   ClassroomDetail dropdown snapshot ({'text', 'value'} dicts)
+    offered_rooms/TERM.json  offered rooms for a term ({'building', 'room', 'capacity', 'type'} dicts),
+                             saved by hand from the registrar's (term-less, current) listing
+    images.tsv               DTS classroom photo URL and room name, one per line
+    terms.json               term code -> {'start', 'end', 'holidays'}: dates of instruction (YYYY-MM-DD)
+
+Files are only read when first asked for, never at import time; lookup tables
+built from them (room_keys.building_aliases()) are built on first use too. The
+parsed form of each file is pickled under data/.cache/ keyed by the file's
+SHA-256, so later runs skip parsing until the file itself changes; editing a
+data file needs no code change and no cache cleanup.
+
+Returned objects are shared between callers; copy them before mutating.
+"""
+
+import csv
+import glob
+import hashlib
+import io
+import json
+import os
+import pickle
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+CACHE_DIR = os.path.join(DATA_DIR, '.cache')
+
+_loaded = {}
+
+
+def _parse_images(text):
+    reader = csv.DictReader(io.StringIO(text), delimiter='\t')
+    return {row['name'].strip(): row['url'] for row in reader if row.get('url')}
+
+
+def load_data_file(name, parse=json.loads):
+    """
+    Parsed contents of data/<name>, or None if the file does not exist.
+
+    Args:
+        name: Path relative to DATA_DIR
+        parse: Function from the file's text to its parsed form
+    """
+    path = os.path.join(DATA_DIR, name)
+    try:
+        with open(path, 'rb') as f:
+            raw = f.read()
+    except FileNotFoundError:
+        return None
+
+    digest = hashlib.sha256(raw).hexdigest()
+    if name in _loaded and _loaded[name][0] == digest:
+        return _loaded[name][1]
+
+    cache_stem = os.path.join(CACHE_DIR, name.replace('/', '_'))
+    cache_path = f"{cache_stem}.{digest[:16]}.pickle"
+    data = None
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'rb') as f:
+                data = pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError):
+            data = None
+    if data is None:
+        data = parse(raw.decode('utf-8'))
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            # Parsed forms of earlier versions of this file are never read again
+            for stale in glob.glob(f"{glob.escape(cache_stem)}.*.pickle"):
+                os.remove(stale)
+            with open(cache_path, 'wb') as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass  # Read-only checkout: parse every time
+
+    _loaded[name] = (digest, data)
+    return data
+
+
+def buildings():
+    """Registrar building code -> {'name': full name, 'aliases': [other spellings], 'location': [lat, lon]}."""
+    return load_data_file('buildings.json') or {}
+
+
+def building_name_map():
+    """Full building name (as used in the offered-room listing) -> registrar code."""
+    return {info['name']: code for code, info in buildings().items()}
+
+
+def building_locations():
+    """Registrar building code -> (latitude, longitude) of the building (approximate centre)."""
+    return {code: tuple(info['location']) for code, info in buildings().items() if info.get('location')}
+
+
+def classroom_options():
+    """The ClassroomDetail dropdown snapshot."""
+    return load_data_file('classroom_options.json') or []
+
+
+def offered_rooms(term):
+    """Offered rooms for a term, or [] if there is no file for it."""
+    return load_data_file(f"offered_rooms/{term}.json") or []
+
+
+def offered_terms():
+    """Terms with an offered-room file."""
+    return sorted(os.path.splitext(os.path.basename(path))[0]
+                  for path in glob.glob(os.path.join(DATA_DIR, 'offered_rooms', '*.json')))
+
+
+def term_dates():
+    """Term code -> {'start': first day of instruction, 'end': last day, 'holidays': [dates without classes]}."""
+    return load_data_file('terms.json') or {}
+
+
+def image_urls():
+    """Room name (e.g. 'WG Young CS 24') -> DTS photo URL."""
+    return load_data_file('images.tsv', _parse_images) or {}
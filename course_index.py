@@ -0,0 +1,179 @@
+"""
+Course Index
+
+The reverse of classrooms.json: normalized course code -> its meetings
+(room, day, start, end, section), so "where does COM SCI 31 meet" is one dict
+lookup instead of a scan over every room and day.
+
+Course codes are normalized by upper-casing and collapsing the registrar's
+column padding ('HIST    149A' -> 'HIST 149A'). Prefix search runs on the
+code with the spaces removed as well ('comsci3' finds COM SCI 31, 32, 33...),
+by bisecting a sorted list of those keys.
+
+The index can also tell which rooms free up if a course is cancelled: for
+each meeting, the free gap the room would have without that course's events.
+
+Published form (written by --publish, unchanged files are not rewritten):
+
+    courses/index.json   {'rooms': [room ids], 'shards': {'C': 412, ...}, 'version': HASH}
+    courses/C.json       {'COM SCI 31': [[room, day, start, end, 'LEC 1'], ...], ...}
+
+Shards are keyed by the first character of the code; room is a position in
+index.json's 'rooms', day a position in availability.DAYS, start/end minutes.
+A client loads index.json once, then only the shard for what the user typed.
+
+Usage:
+    courses = CourseIndex(AvailabilityIndex.from_file('classrooms.json'))
+    courses.meetings('com sci 31')
+    courses.search('COM SCI 3')
+    courses.freed_by('COM SCI 31')
+
+    python course_index.py "COM SCI 31" [--cancel] [--term=26W]
+    python course_index.py --publish [--out=courses] [--term=26W]
+"""
+
+import hashlib
+import os
+import re
+from bisect import bisect_left
+
+from availability import DAY_END, DAY_START, DAYS, busy_intervals, event_minutes, schedule_for
+from publish_slots import encode, write_if_changed
+
+OUTPUT_DIR = 'courses'
+SPACE_RE = re.compile(r'\s+')
+
+
+def course_key(course):
+    """'HIST    149A' / 'hist 149a' -> 'HIST 149A'."""
+    return SPACE_RE.sub(' ', course.strip().upper())
+
+
+def search_key(text):
+    """Key used for prefix search: the course key without spaces ('COMSCI31')."""
+    return SPACE_RE.sub('', text.upper())
+
+
+class CourseIndex:
+    """
+    Course code -> meetings, built from the schedules of an AvailabilityIndex.
+
+    Args:
+        index: AvailabilityIndex whose rooms (and term) to invert
+    """
+
+    def __init__(self, index):
+        self.index = index
+        self.courses = {}
+        for rid, room in index.rooms.items():
+            schedule = schedule_for(room.record, index.term) or {}
+            for day in DAYS:
+                for event in schedule.get(day) or []:
+                    minutes = event_minutes(event)
+                    if minutes is None:
+                        continue  # No usable time; see availability.event_minutes
+                    self.courses.setdefault(course_key(event['course']), []).append({
+                        'room': rid, 'day': day, 'start': minutes[0], 'end': minutes[1],
+                        'section': event.get('type') or '',
+                    })
+        for meetings in self.courses.values():
+            meetings.sort(key=lambda m: (DAYS.index(m['day']), m['start'], m['room'], m['section']))
+        self.keys = sorted((search_key(code), code) for code in self.courses)
+
+    def meetings(self, course):
+        """Meetings of a course (any spacing or case), or [] if it has none."""
+        return self.courses.get(course_key(course), [])
+
+    def search(self, prefix, limit=None):
+        """Course codes starting with prefix, ignoring case and spaces, in code order."""
+        prefix = search_key(prefix)
+        results = []
+        for key, code in self.keys[bisect_left(self.keys, (prefix, '')):]:
+            if not key.startswith(prefix) or len(results) == limit:
+                break
+            results.append(code)
+        return results
+
+    def freed_by(self, course):
+        """
+        Rooms that free up if a course is cancelled.
+
+        Returns:
+            One dict per meeting that would leave its room empty: the meeting's
+            'room', 'day', 'start', 'end', 'section', plus 'free_from' / 'free_to',
+            the free gap around it (clipped to DAY_START..DAY_END) once the course's
+            events are gone
+        """
+        code = course_key(course)
+        freed = []
+        for meeting in self.meetings(code):
+            schedule = schedule_for(self.index.rooms[meeting['room']].record, self.index.term) or {}
+            others = [event for event in schedule.get(meeting['day']) or [] if course_key(event['course']) != code]
+            starts, ends = busy_intervals(others)
+            if any(start < meeting['end'] and end > meeting['start'] for start, end in zip(starts, ends)):
+                continue  # Another class (e.g. a cross-listing) still holds the room
+            free_from = max([end for end in ends if end <= meeting['start']] + [DAY_START])
+            free_to = min([start for start in starts if start >= meeting['end']] + [DAY_END])
+            freed.append(dict(meeting, free_from=min(free_from, meeting['start']), free_to=max(free_to, meeting['end'])))
+        return freed
+
+    def publish(self, out_dir=OUTPUT_DIR):
+        """
+        Write index.json and one shard per first character of the course code.
+
+        Returns:
+            (files written, files unchanged)
+        """
+        rooms = sorted(self.index.rooms)
+        positions = {rid: position for position, rid in enumerate(rooms)}
+        shards = {}
+        for code in sorted(self.courses):
+            shards.setdefault(code[0], {})[code] = [
+                [positions[m['room']], DAYS.index(m['day']), m['start'], m['end'], m['section']]
+                for m in self.courses[code]
+            ]
+
+        written = unchanged = 0
+        manifest = {'rooms': rooms, 'shards': {name: len(shard) for name, shard in sorted(shards.items())}}
+        manifest['version'] = hashlib.sha1(encode([manifest, shards])).hexdigest()[:12]
+        files = [('index', manifest)] + sorted(shards.items())
+        for name, data in files:
+            if write_if_changed(os.path.join(out_dir, f"{name}.json"), data):
+                written += 1
+            else:
+                unchanged += 1
+        return written, unchanged
+
+
+if __name__ == "__main__":
+    import sys
+
+    from availability import AvailabilityIndex, format_time
+
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    options = dict(arg.partition('=')[::2] for arg in sys.argv[1:] if arg.startswith('--'))
+    if not args and '--publish' not in options:
+        print(__doc__)
+        sys.exit(1)
+
+    courses = CourseIndex(AvailabilityIndex.from_file(term=options.get('--term') or None))
+    if '--publish' in options:
+        out_dir = options.get('--out') or OUTPUT_DIR
+        written, unchanged = courses.publish(out_dir)
+        print(f"{len(courses.courses)} courses | {sum(len(m) for m in courses.courses.values())} meetings | "
+              f"{out_dir}/ written: {written} | unchanged: {unchanged}")
+        sys.exit(0)
+
+    query = ' '.join(args)
+    codes = [course_key(query)] if courses.meetings(query) else courses.search(query, limit=20)
+    if not codes:
+        print(f"No course matches {query!r}")
+    for code in codes:
+        print(code)
+        if '--cancel' in options:
+            for m in courses.freed_by(code):
+                print(f"  {m['room']:<16} {m['day']:<9} free {format_time(m['free_from'])}-{format_time(m['free_to'])}"
+                      f"  (was {m['section']} {format_time(m['start'])}-{format_time(m['end'])})")
+            continue
+        for m in courses.meetings(code):
+            print(f"  {m['section']:<8} {m['day']:<9} {format_time(m['start'])}-{format_time(m['end'])}  {m['room']}")
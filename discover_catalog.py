@@ -0,0 +1,163 @@
+"""
+Classroom Catalog Discovery
+
+Fetches the two inputs of generate_urls() from the registrar instead of from
+hand-edited literals:
+
+    classroom options - the building/room dropdown on the ClassroomDetail page
+    offered rooms     - the general assignment classroom listing (capacity, type)
+
+The dropdown is fetched per term. The classroom listing has no term: it is the
+registrar's current list, cached once and used for whichever term is built.
+
+Both are cached in catalog_cache.json with the time they were fetched, so a
+rebuild only touches the network when the cache is older than CACHE_TTL (or
+--refresh is given). If discovery fails, a stale cache entry is used, and if
+there is none, the offline snapshot in data/ (read through catalog.py).
+
+Usage:
+    python discover_catalog.py [TERM] [--refresh] [--offered-url=URL]
+"""
+
+import copy
+import json
+import os
+import time
+import urllib.request
+
+from bs4 import BeautifulSoup
+
+import catalog
+from generate_urls import CLASSROOM_DETAIL_URL, DEFAULT_TERM
+
+CACHE_PATH = 'catalog_cache.json'
+CACHE_TTL = 7 * 24 * 3600
+OFFERED_ROOMS_URL = 'https://www.registrar.ucla.edu/faculty-staff/classrooms-and-scheduling/general-assignment-classrooms'
+USER_AGENT = 'StudySpace catalog discovery (educational use)'
+
+
+def fetch_html(url, timeout=30):
+    """GET a page and return its decoded HTML."""
+    request = urllib.request.Request(url, headers={'User-Agent': USER_AGENT})
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return response.read().decode('utf-8', errors='replace')
+
+
+def parse_classroom_options(html):
+    """Extract {'text', 'value'} dicts from the classroom dropdown ('BUILDING | ROOM' values)."""
+    soup = BeautifulSoup(html, 'html.parser')
+    options = []
+    seen = set()
+    for option in soup.find_all('option'):
+        # Keep the raw value: its padding is part of the ClassroomDetail URL
+        value = option.get('value') or ''
+        if '|' not in value or value in seen:
+            continue
+        seen.add(value)
+        options.append({'text': option.get_text().strip(), 'value': value})
+    return options
+
+
+def parse_offered_rooms(html):
+    """Extract {'building', 'room', 'capacity', 'type'} dicts from the offered-room listing table."""
+    soup = BeautifulSoup(html, 'html.parser')
+    rooms = []
+    for row in soup.find_all('tr'):
+        cells = [cell.get_text(' ', strip=True) for cell in row.find_all('td')]
+        if len(cells) < 4 or not cells[2].isdigit():
+            continue
+        rooms.append({'building': cells[0], 'room': cells[1], 'capacity': int(cells[2]), 'type': cells[3]})
+    return rooms
+
+
+def load_cache(path=CACHE_PATH):
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def save_cache(cache, path=CACHE_PATH):
+    with open(path, 'w') as f:
+        json.dump(cache, f, indent=4)
+
+
+def _discover(cache, key, url, parse, refresh, offline, max_age):
+    """
+    Return (data, source) for one cache entry, fetching when it is missing or stale.
+    data is None when there is neither a fresh fetch nor any cached copy.
+    """
+    entry = cache.get(key)
+    age = time.time() - entry['fetched_at'] if entry else None
+
+    if entry and not refresh and age < max_age:
+        return entry['data'], f"cache ({age / 3600:.1f}h old)"
+
+    if not offline:
+        try:
+            data = parse(fetch_html(url))
+            if data:
+                cache[key] = {'fetched_at': time.time(), 'url': url, 'data': data}
+                return data, 'registrar'
+            print(f"WARNING: no entries found at {url}")
+        except Exception as e:
+            print(f"WARNING: discovery failed for {url}: {e}")
+
+    if entry:
+        return entry['data'], f"stale cache ({age / 3600:.1f}h old)"
+    return None, None
+
+
+def load_catalog(term=DEFAULT_TERM, refresh=False, offline=False, max_age=CACHE_TTL,
+                 offered_url=OFFERED_ROOMS_URL, cache_path=CACHE_PATH):
+    """
+    Return (classroom_options, offered_rooms, source) for generate_urls().
+
+    Args:
+        term: Term whose dropdown to use, and whose offered-room snapshot in data/ is the
+            offline fallback (the live listing is the same for every term)
+        refresh: Ignore the cache age and fetch again
+        offline: Never touch the network (cache, then the offline snapshot)
+        max_age: Seconds a cache entry stays fresh
+    """
+    cache = load_cache(cache_path)
+
+    classroom_options, options_source = _discover(
+        cache, f"classroom_options:{term}", f"{CLASSROOM_DETAIL_URL}?term={term}",
+        parse_classroom_options, refresh, offline, max_age)
+    offered_rooms, offered_source = _discover(
+        cache, 'offered_rooms', offered_url,
+        parse_offered_rooms, refresh, offline, max_age)
+
+    if not offline:
+        save_cache(cache, cache_path)
+
+    if classroom_options is None or offered_rooms is None:
+        if classroom_options is None:
+            classroom_options = copy.deepcopy(catalog.classroom_options())
+            options_source = 'offline snapshot'
+        if offered_rooms is None:
+            offered_rooms = copy.deepcopy(catalog.offered_rooms(term))
+            offered_source = 'offline snapshot'
+            if not offered_rooms:
+                print(f"WARNING: no offered-room list for {term}; every room will be marked not offered")
+
+    source = f"options: {options_source}, offered rooms: {offered_source}"
+    return classroom_options, offered_rooms, source
+
+
+if __name__ == "__main__":
+    import sys
+
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    options = dict(arg.partition('=')[::2] for arg in sys.argv[1:] if arg.startswith('--'))
+
+    term = args[0] if args else DEFAULT_TERM
+    classroom_options, offered_rooms, source = load_catalog(
+        term, refresh='--refresh' in options, offered_url=options.get('--offered-url') or OFFERED_ROOMS_URL)
+    print(f"Term: {term}")
+    print(f"Classroom options: {len(classroom_options)} | Offered rooms: {len(offered_rooms)}")
+    print(f"Source: {source}")
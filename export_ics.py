@@ -0,0 +1,258 @@
+"""
+Calendar Export
+
+Writes iCalendar (.ics) feeds of the scraped schedules, for department admins
+and anyone else who wants room bookings in a calendar app:
+
+    calendars/rooms/boelter-2444.ics    one room
+    calendars/buildings/boelter.ics     every room in a building
+    calendars/all.ics                   the whole catalog
+    calendars/index.json                feed path -> SHA-256 of its content
+
+Each section meets on the same days every week, so it becomes one VEVENT
+with a weekly RRULE (BYDAY over its days) from the first day of instruction
+to the last, with EXDATEs for the term's holidays; term dates come from
+data/terms.json. Every scraped term of a room is exported. Rooms whose
+records carry no 'term' are taken to be in the default term.
+
+Feeds are streamed line by line and never held in memory. Each feed is
+hashed first; only if the hash differs from the one recorded in index.json is
+it streamed again into the file, so unchanged feeds keep their bytes and
+timestamps (DTSTAMP is fixed to the term start for the same reason). Feeds of
+rooms that disappeared are deleted.
+
+Usage:
+    python export_ics.py [--out=calendars] [--term=25F] [--all]
+
+    --term   default term for records without a 'term' field (default: newest in data/offered_rooms)
+    --all    include rooms that are not offered
+"""
+
+import datetime
+import hashlib
+import json
+import os
+from zoneinfo import ZoneInfo
+
+import catalog
+from availability import DAYS, event_minutes, schedule_for
+from course_index import course_key
+from room_keys import NON_ALNUM_RE, canonical_building, room_id
+
+OUTPUT_DIR = 'calendars'
+MANIFEST = 'index.json'
+TIMEZONE = 'America/Los_Angeles'
+PRODID = '-//StudySpace//Classroom Schedules//EN'
+BYDAY = {'Monday': 'MO', 'Tuesday': 'TU', 'Wednesday': 'WE', 'Thursday': 'TH',
+         'Friday': 'FR', 'Saturday': 'SA', 'Sunday': 'SU'}
+# Term codes are YY + quarter letter; this orders the quarters within a year
+QUARTERS = 'WS1F'
+
+VTIMEZONE = [
+    'BEGIN:VTIMEZONE', f'TZID:{TIMEZONE}',
+    'BEGIN:DAYLIGHT', 'TZOFFSETFROM:-0800', 'TZOFFSETTO:-0700', 'TZNAME:PDT',
+    'DTSTART:19700308T020000', 'RRULE:FREQ=YEARLY;BYMONTH=3;BYDAY=2SU', 'END:DAYLIGHT',
+    'BEGIN:STANDARD', 'TZOFFSETFROM:-0700', 'TZOFFSETTO:-0800', 'TZNAME:PST',
+    'DTSTART:19701101T020000', 'RRULE:FREQ=YEARLY;BYMONTH=11;BYDAY=1SU', 'END:STANDARD',
+    'END:VTIMEZONE',
+]
+
+
+def newest_term(terms):
+    return max(terms, key=lambda term: (term[:2], QUARTERS.find(term[2:3])), default=None)
+
+
+def escape(text):
+    """Escape a TEXT property value."""
+    return str(text).replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,').replace('\n', '\\n')
+
+
+def fold(line):
+    """Fold a content line at 75 octets (continuation lines start with a space)."""
+    if len(line.encode()) <= 75:
+        return line
+    parts, current, size = [], '', 0
+    for char in line:
+        width = len(char.encode())
+        if size + width > (75 if not parts else 74):
+            parts.append(current)
+            current, size = '', 0
+        current += char
+        size += width
+    parts.append(current)
+    return '\r\n '.join(parts)
+
+
+def local_time(date, minutes):
+    return f"{date:%Y%m%d}T{minutes // 60:02d}{minutes % 60:02d}00"
+
+
+def sections(schedule):
+    """
+    Group a week's events into (course, section, start, end) -> (days, first event).
+    Events without usable times (availability.event_minutes) are left out.
+    """
+    grouped = {}
+    for day in DAYS:
+        for event in schedule.get(day) or []:
+            minutes = event_minutes(event)
+            if minutes is None:
+                continue
+            key = (course_key(event['course']), event.get('type') or '') + minutes
+            grouped.setdefault(key, ([], event))[0].append(day)
+    return grouped
+
+
+def room_events(record, term, dates):
+    """Yield the VEVENT lines of one room's schedule for one term."""
+    schedule = schedule_for(record, term) or {}
+    start_date = datetime.date.fromisoformat(dates['start'])
+    end_date = datetime.date.fromisoformat(dates['end'])
+    holidays = [datetime.date.fromisoformat(day) for day in dates.get('holidays', [])]
+    # RRULE's UNTIL must be UTC when DTSTART has a TZID: the end of the last day, local time
+    until = datetime.datetime.combine(end_date, datetime.time(23, 59, 59), ZoneInfo(TIMEZONE))
+    until = until.astimezone(datetime.timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+    stamp = f"{start_date:%Y%m%d}T000000Z"
+    rid = room_id(record['building'], record['room'])
+    location = ' '.join(record['text'].split())
+
+    for (course, section, start, end), (days, event) in sorted(sections(schedule).items()):
+        weekdays = {DAYS.index(day) for day in days}
+        first = next((start_date + datetime.timedelta(offset) for offset in range(7)
+                      if (start_date + datetime.timedelta(offset)).weekday() in weekdays), None)
+        if first is None or first > end_date:
+            continue
+        excluded = [day for day in holidays if start_date <= day <= end_date and day.weekday() in weekdays]
+        uid = NON_ALNUM_RE.sub('-', f"{term} {rid} {course} {section} {start} {end}".upper()).strip('-').lower()
+        description = f"{event.get('enrolled', '?')}/{event['capacity']} enrolled" if event.get('capacity') else ''
+        yield 'BEGIN:VEVENT'
+        yield f"UID:{uid}@studyspace"
+        yield f"DTSTAMP:{stamp}"
+        yield f"DTSTART;TZID={TIMEZONE}:{local_time(first, start)}"
+        yield f"DTEND;TZID={TIMEZONE}:{local_time(first, end)}"
+        yield f"RRULE:FREQ=WEEKLY;BYDAY={','.join(BYDAY[day] for day in days)};UNTIL={until}"
+        if excluded:
+            yield fold(f"EXDATE;TZID={TIMEZONE}:{','.join(local_time(day, start) for day in excluded)}")
+        yield fold(f"SUMMARY:{escape(f'{course} {section}'.strip())}")
+        yield fold(f"LOCATION:{escape(location)}")
+        if description:
+            yield fold(f"DESCRIPTION:{escape(description)}")
+        yield 'END:VEVENT'
+
+
+def calendar(name, records, terms, default_term):
+    """Yield every line of a VCALENDAR holding all terms' events of records."""
+    yield 'BEGIN:VCALENDAR'
+    yield 'VERSION:2.0'
+    yield f"PRODID:{PRODID}"
+    yield 'CALSCALE:GREGORIAN'
+    yield fold(f"X-WR-CALNAME:{escape(name)}")
+    yield f"X-WR-TIMEZONE:{TIMEZONE}"
+    yield from VTIMEZONE
+    for record in records:
+        record = dict(record, term=record.get('term') or default_term)
+        # The primary term may also be listed under 'terms'; export each term once
+        for term in dict.fromkeys([record['term']] + list(record.get('terms') or {})):
+            if term in terms:
+                yield from room_events(record, term, terms[term])
+    yield 'END:VCALENDAR'
+
+
+def write_feed(path, make_lines, previous):
+    """
+    Stream a feed to path unless its content hash equals previous.
+
+    Args:
+        path: Output file
+        make_lines: Callable returning a fresh iterator of the feed's lines
+        previous: Hash recorded for path by the last run, or None
+
+    Returns:
+        (content hash, True if the file was written)
+    """
+    digest = hashlib.sha256()
+    for line in make_lines():
+        digest.update(line.encode() + b'\r\n')
+    digest = digest.hexdigest()
+    if digest == previous and os.path.exists(path):
+        return digest, False
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path + '.tmp', 'wb') as f:
+        for line in make_lines():
+            f.write(line.encode() + b'\r\n')
+    os.replace(path + '.tmp', path)
+    return digest, True
+
+
+def export_calendars(classrooms, out_dir=OUTPUT_DIR, default_term=None, offered_only=True):
+    """
+    Write room, building and catalog feeds plus index.json.
+
+    Returns:
+        (feeds written, feeds unchanged, stale feeds removed, terms without dates in data/terms.json)
+    """
+    terms = catalog.term_dates()
+    default_term = default_term or newest_term(catalog.offered_terms())
+    records = sorted((record for record in classrooms
+                      if record.get('building') and (record.get('offered') or not offered_only)),
+                     key=lambda record: room_id(record['building'], record['room']))
+    used_terms = {record.get('term') or default_term for record in records}
+    used_terms.update(term for record in records for term in record.get('terms') or {})
+
+    manifest_path = os.path.join(out_dir, MANIFEST)
+    try:
+        with open(manifest_path, 'r') as f:
+            previous = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        previous = {}
+
+    buildings = {}
+    for record in records:
+        buildings.setdefault(canonical_building(record['building']), []).append(record)
+    building_names = catalog.buildings()
+
+    feeds = [('all.ics', 'UCLA classrooms', records)]
+    feeds += [(f"buildings/{NON_ALNUM_RE.sub('-', code).strip('-').lower()}.ics",
+               building_names.get(code, {}).get('name', code), rooms) for code, rooms in sorted(buildings.items())]
+    feeds += [(f"rooms/{room_id(record['building'], record['room'])}.ics", ' '.join(record['text'].split()), [record])
+              for record in records]
+
+    manifest = {}
+    written = unchanged = 0
+    for name, title, feed_records in feeds:
+        manifest[name], changed = write_feed(os.path.join(out_dir, name),
+                                             lambda: calendar(title, feed_records, terms, default_term),
+                                             previous.get(name))
+        if changed:
+            written += 1
+        else:
+            unchanged += 1
+
+    removed = 0
+    for name in set(previous) - set(manifest):
+        try:
+            os.remove(os.path.join(out_dir, name))
+            removed += 1
+        except FileNotFoundError:
+            pass
+    with open(manifest_path, 'w') as f:
+        json.dump(manifest, f, indent=0, sort_keys=True)
+    return written, unchanged, removed, sorted(used_terms - set(terms))
+
+
+def main(out_dir=OUTPUT_DIR, default_term=None, offered_only=True):
+    with open('classrooms.json', 'r') as f:
+        classrooms = json.load(f)
+    written, unchanged, removed, undated = export_calendars(classrooms, out_dir, default_term, offered_only)
+    print(f"{out_dir}/ | Written: {written} | Unchanged: {unchanged} | Removed: {removed}")
+    if undated:
+        print(f"WARNING: no dates in data/terms.json for {', '.join(undated)}; their events were skipped")
+
+
+if __name__ == "__main__":
+    import sys
+
+    options = dict(arg.partition('=')[::2] for arg in sys.argv[1:] if arg.startswith('--'))
+    main(out_dir=options.get('--out') or OUTPUT_DIR, default_term=options.get('--term') or None,
+         offered_only='--all' not in options)
@@ -5,37 +5,42 @@ This script generates URLs for UCLA classroom detail pages from a list of classr
 It parses building and room information and creates properly formatted URLs.
 
 Usage:
-    python generate_urls.py
+    python generate_urls.py [TERM ...] [--refresh] [--offline]
+
+    TERM is a registrar term code such as 25F or 26W (default: 25F). When several
+    terms are given, the first is the primary term used for 'url' and every term's
+    URL is listed under 'urls'.
+
+    The classroom list and offered rooms come from discover_catalog.py (cached in
+    catalog_cache.json). --refresh forces a new fetch; --offline never touches the
+    network and falls back to the snapshot in data/ (see catalog.py).
 
 Output: Creates classrooms.json with building, room, and url fields for each classroom.
 """
 
 import json
+import re
+
+import catalog
+from room_keys import room_key
+
+DEFAULT_TERM = '25F'
+CLASSROOM_DETAIL_URL = 'https://sa.ucla.edu/ro/Public/SOC/Results/ClassroomDetail'
 
-def normalize_room_number(room):
-    """Normalize room number by removing leading zeros and trailing spaces for comparison."""
-    import re
-    # Remove trailing spaces
-    room = room.strip()
-    
-    # Handle different room number formats:
-    # Numeric only: "02444" -> "2444"
-    # Alpha prefix with numbers: "A00002" -> "A2", "CS00024" -> "CS24"
-    # Mixed: "2100A" -> "2100A" (no change needed)
-    
-    # Check if it starts with letters followed by numbers
-    match = re.match(r'^([A-Z]+)0*(\d+\w*)$', room)
-    if match:
-        # Alpha prefix case: remove leading zeros from the numeric part
-        prefix, number = match.groups()
-        return f"{prefix}{number}"
-    elif room and not room[0].isalpha():
-        # Pure numeric case: remove leading zeros
-        room = room.lstrip('0') or '0'
-    
-    return room
 
-def generate_urls(classroom_list, offered_rooms=None, building_name_map=None):
+def classroom_url(value, term=DEFAULT_TERM):
+    """Build the ClassroomDetail URL for a raw 'BUILDING | ROOM' option value and term."""
+    # Encode the value: replace | with %7C and spaces with +
+    encoded_classroom = value.replace('|', '%7C').replace(' ', '+')
+    return f"{CLASSROOM_DETAIL_URL}?term={term}&classroom={encoded_classroom}"
+
+
+def term_url(url, term):
+    """Rewrite the term parameter of an existing ClassroomDetail URL."""
+    return re.sub(r'([?&]term=)[^&]*', lambda match: match.group(1) + term, url, count=1)
+
+
+def generate_urls(classroom_list, offered_rooms=None, building_name_map=None, terms=None):
     """
     Function to generate URLs for each classroom based on building and room.
     URL format: https://sa.ucla.edu/ro/Public/SOC/Results/ClassroomDetail?term=25F&classroom={encoded_value}
@@ -44,20 +49,21 @@ def generate_urls(classroom_list, offered_rooms=None, building_name_map=None):
         classroom_list: List of classroom dictionaries with 'text' and 'value' keys
         offered_rooms: List of offered rooms with capacity and type info
         building_name_map: Dictionary mapping full building names to abbreviated codes
+        terms: List of term codes; the first one is used for 'url' (default: [DEFAULT_TERM])
         
     Returns:
-        List of classroom dictionaries with 'building', 'room', 'url', 'offered', 'capacity', and 'type' keys
+        List of classroom dictionaries with 'building', 'room', 'url', 'offered', 'capacity', and 'type' keys,
+        plus a 'urls' dictionary keyed by term when more than one term is given
     """
+    terms = terms or [DEFAULT_TERM]
     # Create a lookup dictionary for offered rooms (using abbreviated building names and normalized room numbers)
     offered_lookup = {}
     if offered_rooms and building_name_map:
         for room in offered_rooms:
             # Convert full building name to abbreviated code
             building_abbr = building_name_map.get(room['building'], room['building'])
-            # Normalize the room number for comparison
-            normalized_room = normalize_room_number(room['room'])
-            # Create a key using building and normalized room for quick lookup
-            key = f"{building_abbr}|{normalized_room}"
+            # Canonical building|room key (see room_keys.py) for quick lookup
+            key = room_key(building_abbr, room['room'])
             offered_lookup[key] = {
                 'capacity': room['capacity'],
                 'type': room['type']
@@ -73,9 +79,8 @@ def generate_urls(classroom_list, offered_rooms=None, building_name_map=None):
             classroom['building'] = building
             classroom['room'] = room
             
-            # Check if this classroom is in offered_rooms (using normalized room number)
-            normalized_room = normalize_room_number(room)
-            lookup_key = f"{building}|{normalized_room}"
+            # Check if this classroom is in offered_rooms (using the canonical room key)
+            lookup_key = room_key(building, room)
             if lookup_key in offered_lookup:
                 classroom['offered'] = True
                 classroom['capacity'] = offered_lookup[lookup_key]['capacity']
@@ -87,1352 +92,27 @@ def generate_urls(classroom_list, offered_rooms=None, building_name_map=None):
             classroom['room'] = None
             classroom['offered'] = False
             
-        # Encode the value: replace | with %7C and spaces with +
-        encoded_classroom = value.replace('|', '%7C').replace(' ', '+')
-        url = f"https://sa.ucla.edu/ro/Public/SOC/Results/ClassroomDetail?term=25F&classroom={encoded_classroom}"
-        classroom['url'] = url
+        classroom['url'] = classroom_url(value, terms[0])
+        if len(terms) > 1:
+            classroom['urls'] = {term: classroom_url(value, term) for term in terms}
         # Remove the original value
         del classroom['value']
     return classroom_list
 
 
-def main():
+def main(terms=None, refresh=False, offline=False):
     """Main function to generate URLs from classroom data"""
+    from discover_catalog import load_catalog
     
-    # Building name mapping: Full names to abbreviated codes
-    building_name_map = {
-        "Boelter Hall": "BOELTER",
-        "Broad Art Center": "BROAD",
-        "Bunche Hall": "BUNCHE",
-        "Dodd Hall": "DODD",
-        "Fowler Museum": "FOWLER",
-        "Franz Hall": "FRANZ",
-        "Geology Building": "GEOLOGY",
-        "Haines Hall": "HAINES",
-        "Kaplan Hall": "KAPLAN",
-        "Kaufman Hall": "KAUFMAN",
-        "Kinsey Pavilion": "KNSY PV",
-        "La Kretz Hall": "LAKRETZ",
-        "Mathematical Sciences": "MS",
-        "Moore Hall": "MOORE",
-        "Perloff Hall": "PERLOFF",
-        "Physics and Astronomy Building": "PAB",
-        "Public Affairs Building": "PUB AFF",
-        "Rolfe Hall": "ROLFE",
-        "Royce Hall": "ROYCE",
-        "Slichter": "SLICHTR",
-        "Young Hall": "WGYOUNG"
-    }
+    terms = terms or [DEFAULT_TERM]
     
-    # The classroom options data as a list of dictionaries
-    classroom_options = [
-    {"text": "700 WWP  1440", "value": "700 WWP |  01440  "},
-    {"text": "700 WWP  A214", "value": "700 WWP | A00214  "},
-    {"text": "ANDERSON G304", "value": "ANDERSON| G00304  "},
-    {"text": "ANDERSON G305", "value": "ANDERSON| G00305  "},
-    {"text": "ANDERSON G313", "value": "ANDERSON| G00313  "},
-    {"text": "ANDERSON G419", "value": "ANDERSON| G00419  "},
-    {"text": "ANDERSON G503", "value": "ANDERSON| G00503  "},
-    {"text": "AU       3517", "value": "AU      |  03517  "},
-    {"text": "BIO SCI  154", "value": "BIO SCI |  00154  "},
-    {"text": "BIO SCI  210C", "value": "BIO SCI |  00210C "},
-    {"text": "BIO SCI  283", "value": "BIO SCI |  00283  "},
-    {"text": "BIO SCI  301", "value": "BIO SCI |  00301  "},
-    {"text": "BIO SCI  383", "value": "BIO SCI |  00383  "},
-    {"text": "BIO SCI  401", "value": "BIO SCI |  00401  "},
-    {"text": "BIO SCI  483", "value": "BIO SCI |  00483  "},
-    {"text": "BIO SCI  501", "value": "BIO SCI |  00501  "},
-    {"text": "BOELTER  0", "value": "BOELTER |  00000  "},
-    {"text": "BOELTER  1541", "value": "BOELTER |  01541  "},
-    {"text": "BOELTER  1567", "value": "BOELTER |  01567  "},
-    {"text": "BOELTER  1762B", "value": "BOELTER |  01762B "},
-    {"text": "BOELTER  1805", "value": "BOELTER |  01805  "},
-    {"text": "BOELTER  2444", "value": "BOELTER |  02444  "},
-    {"text": "BOELTER  2760", "value": "BOELTER |  02760  "},
-    {"text": "BOELTER  2808", "value": "BOELTER |  02808  "},
-    {"text": "BOELTER  3400", "value": "BOELTER |  03400  "},
-    {"text": "BOELTER  3424", "value": "BOELTER |  03424  "},
-    {"text": "BOELTER  3428", "value": "BOELTER |  03428  "},
-    {"text": "BOELTER  3436", "value": "BOELTER |  03436  "},
-    {"text": "BOELTER  3440", "value": "BOELTER |  03440  "},
-    {"text": "BOELTER  3551", "value": "BOELTER |  03551  "},
-    {"text": "BOELTER  3564", "value": "BOELTER |  03564  "},
-    {"text": "BOELTER  3704", "value": "BOELTER |  03704  "},
-    {"text": "BOELTER  3760", "value": "BOELTER |  03760  "},
-    {"text": "BOELTER  3770", "value": "BOELTER |  03770  "},
-    {"text": "BOELTER  4275", "value": "BOELTER |  04275  "},
-    {"text": "BOELTER  4283", "value": "BOELTER |  04283  "},
-    {"text": "BOELTER  4404", "value": "BOELTER |  04404  "},
-    {"text": "BOELTER  4413", "value": "BOELTER |  04413  "},
-    {"text": "BOELTER  4760", "value": "BOELTER |  04760  "},
-    {"text": "BOELTER  5249", "value": "BOELTER |  05249  "},
-    {"text": "BOELTER  5252", "value": "BOELTER |  05252  "},
-    {"text": "BOELTER  5264", "value": "BOELTER |  05264  "},
-    {"text": "BOELTER  5272", "value": "BOELTER |  05272  "},
-    {"text": "BOELTER  5273", "value": "BOELTER |  05273  "},
-    {"text": "BOELTER  5280", "value": "BOELTER |  05280  "},
-    {"text": "BOELTER  5419", "value": "BOELTER |  05419  "},
-    {"text": "BOELTER  5420", "value": "BOELTER |  05420  "},
-    {"text": "BOELTER  5422", "value": "BOELTER |  05422  "},
-    {"text": "BOELTER  5436", "value": "BOELTER |  05436  "},
-    {"text": "BOELTER  5440", "value": "BOELTER |  05440  "},
-    {"text": "BOELTER  5513", "value": "BOELTER |  05513  "},
-    {"text": "BOELTER  5514", "value": "BOELTER |  05514  "},
-    {"text": "BOELTER  5714", "value": "BOELTER |  05714  "},
-    {"text": "BOELTER  5732K", "value": "BOELTER |  05732K "},
-    {"text": "BOELTER  6288", "value": "BOELTER |  06288  "},
-    {"text": "BOELTER  6541", "value": "BOELTER |  06541  "},
-    {"text": "BOELTER  6750", "value": "BOELTER |  06750  "},
-    {"text": "BOELTER  7702", "value": "BOELTER |  07702  "},
-    {"text": "BOELTER  7718", "value": "BOELTER |  07718  "},
-    {"text": "BOELTER  7730", "value": "BOELTER |  07730  "},
-    {"text": "BOELTER  7731", "value": "BOELTER |  07731  "},
-    {"text": "BOELTER  7732", "value": "BOELTER |  07732  "},
-    {"text": "BOELTER  7736", "value": "BOELTER |  07736  "},
-    {"text": "BOELTER  7737", "value": "BOELTER |  07737  "},
-    {"text": "BOELTER  7738", "value": "BOELTER |  07738  "},
-    {"text": "BOELTER  7745", "value": "BOELTER |  07745  "},
-    {"text": "BOELTER  7750", "value": "BOELTER |  07750  "},
-    {"text": "BOELTER  8251", "value": "BOELTER |  08251  "},
-    {"text": "BOELTER  8270", "value": "BOELTER |  08270  "},
-    {"text": "BOELTER  8436", "value": "BOELTER |  08436  "},
-    {"text": "BOELTER  8437", "value": "BOELTER |  08437  "},
-    {"text": "BOELTER  8500", "value": "BOELTER |  08500  "},
-    {"text": "BOELTER  9413", "value": "BOELTER |  09413  "},
-    {"text": "BOELTER  9436", "value": "BOELTER |  09436  "},
-    {"text": "BOTANY   107", "value": "BOTANY  |  00107  "},
-    {"text": "BOTANY   108", "value": "BOTANY  |  00108  "},
-    {"text": "BOTANY   109", "value": "BOTANY  |  00109  "},
-    {"text": "BOTANY   133", "value": "BOTANY  |  00133  "},
-    {"text": "BOTANY   220", "value": "BOTANY  |  00220  "},
-    {"text": "BOTANY   325", "value": "BOTANY  |  00325  "},
-    {"text": "BOTANY   328", "value": "BOTANY  |  00328  "},
-    {"text": "BOYER    130", "value": "BOYER   |  00130  "},
-    {"text": "BOYER    159", "value": "BOYER   |  00159  "},
-    {"text": "BOYER    244", "value": "BOYER   |  00244  "},
-    {"text": "BOYER    344", "value": "BOYER   |  00344  "},
-    {"text": "BOYER    444", "value": "BOYER   |  00444  "},
-    {"text": "BOYER    529", "value": "BOYER   |  00529  "},
-    {"text": "BOYER    644", "value": "BOYER   |  00644  "},
-    {"text": "BRADLEY  224", "value": "BRADLEY |  00224  "},
-    {"text": "BRADLEY  300", "value": "BRADLEY |  00300  "},
-    {"text": "BRADLEY  OH470", "value": "BRADLEY |OH00470  "},
-    {"text": "BROAD    1131", "value": "BROAD   |  01131  "},
-    {"text": "BROAD    1145", "value": "BROAD   |  01145  "},
-    {"text": "BROAD    1250", "value": "BROAD   |  01250  "},
-    {"text": "BROAD    1256", "value": "BROAD   |  01256  "},
-    {"text": "BROAD    1275", "value": "BROAD   |  01275  "},
-    {"text": "BROAD    2100A", "value": "BROAD   |  02100A "},
-    {"text": "BROAD    2100B", "value": "BROAD   |  02100B "},
-    {"text": "BROAD    2101", "value": "BROAD   |  02101  "},
-    {"text": "BROAD    2122", "value": "BROAD   |  02122  "},
-    {"text": "BROAD    2135", "value": "BROAD   |  02135  "},
-    {"text": "BROAD    2160E", "value": "BROAD   |  02160E "},
-    {"text": "BROAD    2250", "value": "BROAD   |  02250  "},
-    {"text": "BROAD    3246", "value": "BROAD   |  03246  "},
-    {"text": "BROAD    3261", "value": "BROAD   |  03261  "},
-    {"text": "BROAD    4220", "value": "BROAD   |  04220  "},
-    {"text": "BROAD    4230", "value": "BROAD   |  04230  "},
-    {"text": "BROAD    4240", "value": "BROAD   |  04240  "},
-    {"text": "BROAD    4250", "value": "BROAD   |  04250  "},
-    {"text": "BROAD    4258", "value": "BROAD   |  04258  "},
-    {"text": "BROAD    6220", "value": "BROAD   |  06220  "},
-    {"text": "BROAD    6230", "value": "BROAD   |  06230  "},
-    {"text": "BROAD    6250", "value": "BROAD   |  06250  "},
-    {"text": "BROAD    6260", "value": "BROAD   |  06260  "},
-    {"text": "BROAD    7230", "value": "BROAD   |  07230  "},
-    {"text": "BROAD    7240", "value": "BROAD   |  07240  "},
-    {"text": "BROAD    7250", "value": "BROAD   |  07250  "},
-    {"text": "BROAD    7260", "value": "BROAD   |  07260  "},
-    {"text": "BUNCHE   1209B", "value": "BUNCHE  |  01209B "},
-    {"text": "BUNCHE   1221A", "value": "BUNCHE  |  01221A "},
-    {"text": "BUNCHE   1221B", "value": "BUNCHE  |  01221B "},
-    {"text": "BUNCHE   1221D", "value": "BUNCHE  |  01221D "},
-    {"text": "BUNCHE   1261", "value": "BUNCHE  |  01261  "},
-    {"text": "BUNCHE   1265", "value": "BUNCHE  |  01265  "},
-    {"text": "BUNCHE   2121", "value": "BUNCHE  |  02121  "},
-    {"text": "BUNCHE   2150", "value": "BUNCHE  |  02150  "},
-    {"text": "BUNCHE   2156", "value": "BUNCHE  |  02156  "},
-    {"text": "BUNCHE   2160", "value": "BUNCHE  |  02160  "},
-    {"text": "BUNCHE   2168", "value": "BUNCHE  |  02168  "},
-    {"text": "BUNCHE   2173", "value": "BUNCHE  |  02173  "},
-    {"text": "BUNCHE   2174", "value": "BUNCHE  |  02174  "},
-    {"text": "BUNCHE   2178", "value": "BUNCHE  |  02178  "},
-    {"text": "BUNCHE   2181", "value": "BUNCHE  |  02181  "},
-    {"text": "BUNCHE   2209A", "value": "BUNCHE  |  02209A "},
-    {"text": "BUNCHE   2221E", "value": "BUNCHE  |  02221E "},
-    {"text": "BUNCHE   2249", "value": "BUNCHE  |  02249  "},
-    {"text": "BUNCHE   3117", "value": "BUNCHE  |  03117  "},
-    {"text": "BUNCHE   3123", "value": "BUNCHE  |  03123  "},
-    {"text": "BUNCHE   3143", "value": "BUNCHE  |  03143  "},
-    {"text": "BUNCHE   3150", "value": "BUNCHE  |  03150  "},
-    {"text": "BUNCHE   3153", "value": "BUNCHE  |  03153  "},
-    {"text": "BUNCHE   3156", "value": "BUNCHE  |  03156  "},
-    {"text": "BUNCHE   3157", "value": "BUNCHE  |  03157  "},
-    {"text": "BUNCHE   3164", "value": "BUNCHE  |  03164  "},
-    {"text": "BUNCHE   3170", "value": "BUNCHE  |  03170  "},
-    {"text": "BUNCHE   3178", "value": "BUNCHE  |  03178  "},
-    {"text": "BUNCHE   3211", "value": "BUNCHE  |  03211  "},
-    {"text": "BUNCHE   3357", "value": "BUNCHE  |  03357  "},
-    {"text": "BUNCHE   4276", "value": "BUNCHE  |  04276  "},
-    {"text": "BUNCHE   4280", "value": "BUNCHE  |  04280  "},
-    {"text": "BUNCHE   4289A", "value": "BUNCHE  |  04289A "},
-    {"text": "BUNCHE   4357", "value": "BUNCHE  |  04357  "},
-    {"text": "BUNCHE   5288", "value": "BUNCHE  |  05288  "},
-    {"text": "BUNCHE   5391", "value": "BUNCHE  |  05391  "},
-    {"text": "BUNCHE   6250", "value": "BUNCHE  |  06250  "},
-    {"text": "BUNCHE   6258", "value": "BUNCHE  |  06258  "},
-    {"text": "BUNCHE   6265", "value": "BUNCHE  |  06265  "},
-    {"text": "BUNCHE   6275", "value": "BUNCHE  |  06275  "},
-    {"text": "BUNCHE   6299", "value": "BUNCHE  |  06299  "},
-    {"text": "BUNCHE   6339", "value": "BUNCHE  |  06339  "},
-    {"text": "BUNCHE   6345", "value": "BUNCHE  |  06345  "},
-    {"text": "BUNCHE   7386", "value": "BUNCHE  |  07386  "},
-    {"text": "BUNCHE   8242", "value": "BUNCHE  |  08242  "},
-    {"text": "BUNCHE   9294", "value": "BUNCHE  |  09294  "},
-    {"text": "BUNCHE   9383", "value": "BUNCHE  |  09383  "},
-    {"text": "BUNCHE   10383", "value": "BUNCHE  |  10383  "},
-    {"text": "BUNCHE   11372", "value": "BUNCHE  |  11372  "},
-    {"text": "BUNCHE   A152", "value": "BUNCHE  | A00152  "},
-    {"text": "BUNCHE   A162", "value": "BUNCHE  | A00162  "},
-    {"text": "BUNCHE   A163", "value": "BUNCHE  | A00163  "},
-    {"text": "CAMPBEL  1224", "value": "CAMPBEL |  01224  "},
-    {"text": "CAMPBEL  2101K", "value": "CAMPBEL |  02101K "},
-    {"text": "CAMPBEL  2122A", "value": "CAMPBEL |  02122A "},
-    {"text": "CAMPBEL  2122B", "value": "CAMPBEL |  02122B "},
-    {"text": "CAMPBEL  2210D", "value": "CAMPBEL |  02210D "},
-    {"text": "CAMPBEL  2210F", "value": "CAMPBEL |  02210F "},
-    {"text": "CAMPBEL  3103D", "value": "CAMPBEL |  03103D "},
-    {"text": "CAMPBEL  3221", "value": "CAMPBEL |  03221  "},
-    {"text": "CAMPBEL  3232", "value": "CAMPBEL |  03232  "},
-    {"text": "CARNESL  212A", "value": "CARNESL |  00212A "},
-    {"text": "CARNESL  218", "value": "CARNESL |  00218  "},
-    {"text": "CARNESL  SP206", "value": "CARNESL |SP00206  "},
-    {"text": "CLARK    B10", "value": "CLARK   | B00010  "},
-    {"text": "CNSI     146", "value": "CNSI    |  00146  "},
-    {"text": "CNSI     5200", "value": "CNSI    |  05200  "},
-    {"text": "CNYN PT  F401", "value": "CNYN PT | F00401  "},
-    {"text": "COLLINS  A201", "value": "COLLINS | A00201  "},
-    {"text": "COLLINS  A301", "value": "COLLINS | A00301  "},
-    {"text": "COLLINS  A416", "value": "COLLINS | A00416  "},
-    {"text": "CORNELL  D301", "value": "CORNELL | D00301  "},
-    {"text": "CORNELL  D303", "value": "CORNELL | D00303  "},
-    {"text": "CORNELL  D307", "value": "CORNELL | D00307  "},
-    {"text": "CORNELL  D310", "value": "CORNELL | D00310  "},
-    {"text": "CORNELL  D311", "value": "CORNELL | D00311  "},
-    {"text": "CORNELL  D312", "value": "CORNELL | D00312  "},
-    {"text": "CORNELL  D313", "value": "CORNELL | D00313  "},
-    {"text": "CORNELL  D414", "value": "CORNELL | D00414  "},
-    {"text": "COVEL    210", "value": "COVEL   |  00210  "},
-    {"text": "COVEL    218", "value": "COVEL   |  00218  "},
-    {"text": "COVEL    225", "value": "COVEL   |  00225  "},
-    {"text": "COVEL    229", "value": "COVEL   |  00229  "},
-    {"text": "DE NEVE  P115", "value": "DE NEVE | P00115  "},
-    {"text": "DE NEVE  P154", "value": "DE NEVE | P00154  "},
-    {"text": "DE NEVE  P215K", "value": "DE NEVE | P00215K "},
-    {"text": "DE NEVE  P345", "value": "DE NEVE | P00345  "},
-    {"text": "DE NEVE  P349", "value": "DE NEVE | P00349  "},
-    {"text": "DE NEVE  P350", "value": "DE NEVE | P00350  "},
-    {"text": "DE NEVE  P353B", "value": "DE NEVE | P00353B "},
-    {"text": "DENT     13041", "value": "DENT    |  13041  "},
-    {"text": "DENT     23029", "value": "DENT    |  23029  "},
-    {"text": "DENT     A3011", "value": "DENT    | A03011  "},
-    {"text": "DENT     A3029", "value": "DENT    | A03029  "},
-    {"text": "DENT     A3089", "value": "DENT    | A03089  "},
-    {"text": "DENT     B148", "value": "DENT    | B00148  "},
-    {"text": "DENT     B3020", "value": "DENT    | B03020  "},
-    {"text": "DODD     52", "value": "DODD    |  00052  "},
-    {"text": "DODD     67", "value": "DODD    |  00067  "},
-    {"text": "DODD     78", "value": "DODD    |  00078  "},
-    {"text": "DODD     121", "value": "DODD    |  00121  "},
-    {"text": "DODD     146", "value": "DODD    |  00146  "},
-    {"text": "DODD     147", "value": "DODD    |  00147  "},
-    {"text": "DODD     154", "value": "DODD    |  00154  "},
-    {"text": "DODD     161", "value": "DODD    |  00161  "},
-    {"text": "DODD     162", "value": "DODD    |  00162  "},
-    {"text": "DODD     167", "value": "DODD    |  00167  "},
-    {"text": "DODD     170", "value": "DODD    |  00170  "},
-    {"text": "DODD     175", "value": "DODD    |  00175  "},
-    {"text": "DODD     178", "value": "DODD    |  00178  "},
-    {"text": "DODD     200C", "value": "DODD    |  00200C "},
-    {"text": "DODD     220", "value": "DODD    |  00220  "},
-    {"text": "DODD     232", "value": "DODD    |  00232  "},
-    {"text": "DODD     247", "value": "DODD    |  00247  "},
-    {"text": "DODD     248", "value": "DODD    |  00248  "},
-    {"text": "DODD     275", "value": "DODD    |  00275  "},
-    {"text": "DODD     325", "value": "DODD    |  00325  "},
-    {"text": "DODD     374", "value": "DODD    |  00374  "},
-    {"text": "DODD     399", "value": "DODD    |  00399  "},
-    {"text": "E MLNTZ  302E", "value": "E MLNTZ |  00302E "},
-    {"text": "E MLNTZ  314B", "value": "E MLNTZ |  00314B "},
-    {"text": "ENGR IV  14118", "value": "ENGR IV |  14118  "},
-    {"text": "ENGR IV  14131B", "value": "ENGR IV |  14131B "},
-    {"text": "ENGR IV  15139", "value": "ENGR IV |  15139  "},
-    {"text": "ENGR IV  18132", "value": "ENGR IV |  18132  "},
-    {"text": "ENGR IV  18132J", "value": "ENGR IV |  18132J "},
-    {"text": "ENGR IV  33128", "value": "ENGR IV |  33128  "},
-    {"text": "ENGR IV  37124", "value": "ENGR IV |  37124  "},
-    {"text": "ENGR IV  38138", "value": "ENGR IV |  38138  "},
-    {"text": "ENGR IV  38138A", "value": "ENGR IV |  38138A "},
-    {"text": "ENGR IV  43116", "value": "ENGR IV |  43116  "},
-    {"text": "ENGR IV  44110", "value": "ENGR IV |  44110  "},
-    {"text": "ENGR IV  47124", "value": "ENGR IV |  47124  "},
-    {"text": "ENGR IV  48121", "value": "ENGR IV |  48121  "},
-    {"text": "ENGR IV  53125", "value": "ENGR IV |  53125  "},
-    {"text": "ENGR IV  53133", "value": "ENGR IV |  53133  "},
-    {"text": "ENGR IV  54134", "value": "ENGR IV |  54134  "},
-    {"text": "ENGR IV  63134", "value": "ENGR IV |  63134  "},
-    {"text": "ENGR IV  64132", "value": "ENGR IV |  64132  "},
-    {"text": "ENGR V   1010", "value": "ENGR V  |  01010  "},
-    {"text": "ENGR V   1230", "value": "ENGR V  |  01230  "},
-    {"text": "ENGR V   2101", "value": "ENGR V  |  02101  "},
-    {"text": "ENGR V   3129", "value": "ENGR V  |  03129  "},
-    {"text": "ENGR V   4101", "value": "ENGR V  |  04101  "},
-    {"text": "ENGR V   5101", "value": "ENGR V  |  05101  "},
-    {"text": "ENGR VI  134", "value": "ENGR VI |  00134  "},
-    {"text": "ENGR VI  134A", "value": "ENGR VI |  00134A "},
-    {"text": "ENGR VI  134B", "value": "ENGR VI |  00134B "},
-    {"text": "ENGR VI  ML0C", "value": "ENGR VI |ML00000C "},
-    {"text": "ENTRPNR  C301", "value": "ENTRPNR | C00301  "},
-    {"text": "ENTRPNR  C303", "value": "ENTRPNR | C00303  "},
-    {"text": "ENTRPNR  C314", "value": "ENTRPNR | C00314  "},
-    {"text": "ENTRPNR  C315", "value": "ENTRPNR | C00315  "},
-    {"text": "FAC CTR  0SE", "value": "FAC CTR |  00000SE"},
-    {"text": "FACTOR   2539", "value": "FACTOR  |  02539  "},
-    {"text": "FACTOR   2648", "value": "FACTOR  |  02648  "},
-    {"text": "FACTOR   3148", "value": "FACTOR  |  03148  "},
-    {"text": "FACTOR   3250", "value": "FACTOR  |  03250  "},
-    {"text": "FACTOR   3637", "value": "FACTOR  |  03637  "},
-    {"text": "FACTOR   3648", "value": "FACTOR  |  03648  "},
-    {"text": "FACTOR   4145", "value": "FACTOR  |  04145  "},
-    {"text": "FACTOR   4147A", "value": "FACTOR  |  04147A "},
-    {"text": "FACTOR   4650", "value": "FACTOR  |  04650  "},
-    {"text": "FACTOR   4662", "value": "FACTOR  |  04662  "},
-    {"text": "FACTOR   5150", "value": "FACTOR  |  05150  "},
-    {"text": "FACTOR   5235", "value": "FACTOR  |  05235  "},
-    {"text": "FACTOR   5242", "value": "FACTOR  |  05242  "},
-    {"text": "FACTOR   5255", "value": "FACTOR  |  05255  "},
-    {"text": "FACTOR   5636", "value": "FACTOR  |  05636  "},
-    {"text": "FACTOR   5638", "value": "FACTOR  |  05638  "},
-    {"text": "FACTOR   5642", "value": "FACTOR  |  05642  "},
-    {"text": "FACTOR   A660A", "value": "FACTOR  | A00660A "},
-    {"text": "FERNALD  100", "value": "FERNALD |  00100  "},
-    {"text": "FOWLER   0DR", "value": "FOWLER  |  00000DR"},
-    {"text": "FOWLER   2329A", "value": "FOWLER  |  02329A "},
-    {"text": "FOWLER   2450", "value": "FOWLER  |  02450  "},
-    {"text": "FOWLER   A103B", "value": "FOWLER  | A00103B "},
-    {"text": "FOWLER   A139", "value": "FOWLER  | A00139  "},
-    {"text": "FOWLER   A163", "value": "FOWLER  | A00163  "},
-    {"text": "FOWLER   A222", "value": "FOWLER  | A00222  "},
-    {"text": "FOWLER   A312", "value": "FOWLER  | A00312  "},
-    {"text": "FOWLER   A322", "value": "FOWLER  | A00322  "},
-    {"text": "FOWLER   A410", "value": "FOWLER  | A00410  "},
-    {"text": "FOWLER   A419", "value": "FOWLER  | A00419  "},
-    {"text": "FRANZ    1178", "value": "FRANZ   |  01178  "},
-    {"text": "FRANZ    1229", "value": "FRANZ   |  01229  "},
-    {"text": "FRANZ    1260", "value": "FRANZ   |  01260  "},
-    {"text": "FRANZ    1283", "value": "FRANZ   |  01283  "},
-    {"text": "FRANZ    1354", "value": "FRANZ   |  01354  "},
-    {"text": "FRANZ    1543", "value": "FRANZ   |  01543  "},
-    {"text": "FRANZ    1571", "value": "FRANZ   |  01571  "},
-    {"text": "FRANZ    2180", "value": "FRANZ   |  02180  "},
-    {"text": "FRANZ    2220", "value": "FRANZ   |  02220  "},
-    {"text": "FRANZ    2221", "value": "FRANZ   |  02221  "},
-    {"text": "FRANZ    2227", "value": "FRANZ   |  02227  "},
-    {"text": "FRANZ    2232", "value": "FRANZ   |  02232  "},
-    {"text": "FRANZ    2258A", "value": "FRANZ   |  02258A "},
-    {"text": "FRANZ    2268", "value": "FRANZ   |  02268  "},
-    {"text": "FRANZ    2279B", "value": "FRANZ   |  02279B "},
-    {"text": "FRANZ    2288", "value": "FRANZ   |  02288  "},
-    {"text": "FRANZ    2322", "value": "FRANZ   |  02322  "},
-    {"text": "FRANZ    2329", "value": "FRANZ   |  02329  "},
-    {"text": "FRANZ    2434", "value": "FRANZ   |  02434  "},
-    {"text": "FRANZ    2527", "value": "FRANZ   |  02527  "},
-    {"text": "FRANZ    2567E", "value": "FRANZ   |  02567E "},
-    {"text": "FRANZ    3165", "value": "FRANZ   |  03165  "},
-    {"text": "FRANZ    3183", "value": "FRANZ   |  03183  "},
-    {"text": "FRANZ    3221", "value": "FRANZ   |  03221  "},
-    {"text": "FRANZ    3243", "value": "FRANZ   |  03243  "},
-    {"text": "FRANZ    3257", "value": "FRANZ   |  03257  "},
-    {"text": "FRANZ    3258", "value": "FRANZ   |  03258  "},
-    {"text": "FRANZ    3265", "value": "FRANZ   |  03265  "},
-    {"text": "FRANZ    3290", "value": "FRANZ   |  03290  "},
-    {"text": "FRANZ    3291", "value": "FRANZ   |  03291  "},
-    {"text": "FRANZ    3312", "value": "FRANZ   |  03312  "},
-    {"text": "FRANZ    3316", "value": "FRANZ   |  03316  "},
-    {"text": "FRANZ    3351", "value": "FRANZ   |  03351  "},
-    {"text": "FRANZ    3423", "value": "FRANZ   |  03423  "},
-    {"text": "FRANZ    3435", "value": "FRANZ   |  03435  "},
-    {"text": "FRANZ    3534", "value": "FRANZ   |  03534  "},
-    {"text": "FRANZ    3538H", "value": "FRANZ   |  03538H "},
-    {"text": "FRANZ    3587", "value": "FRANZ   |  03587  "},
-    {"text": "FRANZ    3621C", "value": "FRANZ   |  03621C "},
-    {"text": "FRANZ    4427", "value": "FRANZ   |  04427  "},
-    {"text": "FRANZ    4441B", "value": "FRANZ   |  04441B "},
-    {"text": "FRANZ    4537", "value": "FRANZ   |  04537  "},
-    {"text": "FRANZ    4574", "value": "FRANZ   |  04574  "},
-    {"text": "FRANZ    5454", "value": "FRANZ   |  05454  "},
-    {"text": "FRANZ    5461", "value": "FRANZ   |  05461  "},
-    {"text": "FRANZ    5532B", "value": "FRANZ   |  05532B "},
-    {"text": "FRANZ    6423", "value": "FRANZ   |  06423  "},
-    {"text": "FRANZ    6461", "value": "FRANZ   |  06461  "},
-    {"text": "FRANZ    6550", "value": "FRANZ   |  06550  "},
-    {"text": "FRANZ    7425", "value": "FRANZ   |  07425  "},
-    {"text": "FRANZ    7437", "value": "FRANZ   |  07437  "},
-    {"text": "FRANZ    7531", "value": "FRANZ   |  07531  "},
-    {"text": "FRANZ    7626", "value": "FRANZ   |  07626  "},
-    {"text": "FRANZ    8461C", "value": "FRANZ   |  08461C "},
-    {"text": "FRANZ    8581", "value": "FRANZ   |  08581  "},
-    {"text": "FRANZ    A191B", "value": "FRANZ   | A00191B "},
-    {"text": "FRANZ    A225", "value": "FRANZ   | A00225  "},
-    {"text": "FRANZ    A258", "value": "FRANZ   | A00258  "},
-    {"text": "FRANZ    A258A", "value": "FRANZ   | A00258A "},
-    {"text": "FRANZ    A279", "value": "FRANZ   | A00279  "},
-    {"text": "FRANZ    A332", "value": "FRANZ   | A00332  "},
-    {"text": "FRANZ    A347", "value": "FRANZ   | A00347  "},
-    {"text": "FRANZ    A456", "value": "FRANZ   | A00456  "},
-    {"text": "FRANZ    A461", "value": "FRANZ   | A00461  "},
-    {"text": "FRANZ    A613", "value": "FRANZ   | A00613  "},
-    {"text": "FRANZ    A1283", "value": "FRANZ   | A01283  "},
-    {"text": "FRANZ    B439", "value": "FRANZ   | B00439  "},
-    {"text": "FRANZ    C451", "value": "FRANZ   | C00451  "},
-    {"text": "FRANZ    C533", "value": "FRANZ   | C00533  "},
-    {"text": "GEFFENHL 113", "value": "GEFFENHL|  00113  "},
-    {"text": "GEFFENHL 150", "value": "GEFFENHL|  00150  "},
-    {"text": "GEFFENHL 207", "value": "GEFFENHL|  00207  "},
-    {"text": "GEFFENHL B13", "value": "GEFFENHL| B00013  "},
-    {"text": "GEOLOGY  1707", "value": "GEOLOGY |  01707  "},
-    {"text": "GEOLOGY  3614", "value": "GEOLOGY |  03614  "},
-    {"text": "GEOLOGY  3645", "value": "GEOLOGY |  03645  "},
-    {"text": "GEOLOGY  3656", "value": "GEOLOGY |  03656  "},
-    {"text": "GEOLOGY  3657", "value": "GEOLOGY |  03657  "},
-    {"text": "GEOLOGY  3814", "value": "GEOLOGY |  03814  "},
-    {"text": "GEOLOGY  3820", "value": "GEOLOGY |  03820  "},
-    {"text": "GEOLOGY  4641", "value": "GEOLOGY |  04641  "},
-    {"text": "GEOLOGY  4645", "value": "GEOLOGY |  04645  "},
-    {"text": "GEOLOGY  4653", "value": "GEOLOGY |  04653  "},
-    {"text": "GEOLOGY  4660", "value": "GEOLOGY |  04660  "},
-    {"text": "GEOLOGY  4677", "value": "GEOLOGY |  04677  "},
-    {"text": "GEOLOGY  4680", "value": "GEOLOGY |  04680  "},
-    {"text": "GEOLOGY  4691", "value": "GEOLOGY |  04691  "},
-    {"text": "GEOLOGY  5638", "value": "GEOLOGY |  05638  "},
-    {"text": "GEOLOGY  5644", "value": "GEOLOGY |  05644  "},
-    {"text": "GEOLOGY  5655", "value": "GEOLOGY |  05655  "},
-    {"text": "GEOLOGY  5681", "value": "GEOLOGY |  05681  "},
-    {"text": "GEOLOGY  6704", "value": "GEOLOGY |  06704  "},
-    {"text": "GEOLOGY  B707", "value": "GEOLOGY | B00707  "},
-    {"text": "GOLD     B117", "value": "GOLD    | B00117  "},
-    {"text": "GOLD     B208X", "value": "GOLD    | B00208X "},
-    {"text": "GOLD     B301", "value": "GOLD    | B00301  "},
-    {"text": "GOLD     B308", "value": "GOLD    | B00308  "},
-    {"text": "GOLD     B312", "value": "GOLD    | B00312  "},
-    {"text": "GOLD     B313", "value": "GOLD    | B00313  "},
-    {"text": "GOLD     B413", "value": "GOLD    | B00413  "},
-    {"text": "GONDA    1357", "value": "GONDA   |  01357  "},
-    {"text": "GONDA    2303", "value": "GONDA   |  02303  "},
-    {"text": "GONDA    3303", "value": "GONDA   |  03303  "},
-    {"text": "GONDA    4303", "value": "GONDA   |  04303  "},
-    {"text": "GONDA    5303", "value": "GONDA   |  05303  "},
-    {"text": "GONDA    6303", "value": "GONDA   |  06303  "},
-    {"text": "GSEIS    102", "value": "GSEIS   |  00102  "},
-    {"text": "GSEIS    111", "value": "GSEIS   |  00111  "},
-    {"text": "GSEIS    118", "value": "GSEIS   |  00118  "},
-    {"text": "GSEIS    121", "value": "GSEIS   |  00121  "},
-    {"text": "GSEIS    202", "value": "GSEIS   |  00202  "},
-    {"text": "GSEIS    228", "value": "GSEIS   |  00228  "},
-    {"text": "GSEIS    245", "value": "GSEIS   |  00245  "},
-    {"text": "HAINES   39", "value": "HAINES  |  00039  "},
-    {"text": "HAINES   102", "value": "HAINES  |  00102  "},
-    {"text": "HAINES   110", "value": "HAINES  |  00110  "},
-    {"text": "HAINES   118", "value": "HAINES  |  00118  "},
-    {"text": "HAINES   122", "value": "HAINES  |  00122  "},
-    {"text": "HAINES   153", "value": "HAINES  |  00153  "},
-    {"text": "HAINES   179", "value": "HAINES  |  00179  "},
-    {"text": "HAINES   215", "value": "HAINES  |  00215  "},
-    {"text": "HAINES   220", "value": "HAINES  |  00220  "},
-    {"text": "HAINES   279", "value": "HAINES  |  00279  "},
-    {"text": "HAINES   310", "value": "HAINES  |  00310  "},
-    {"text": "HAINES   314", "value": "HAINES  |  00314  "},
-    {"text": "HAINES   332", "value": "HAINES  |  00332  "},
-    {"text": "HAINES   350", "value": "HAINES  |  00350  "},
-    {"text": "HAINES   352", "value": "HAINES  |  00352  "},
-    {"text": "HAINES   A2", "value": "HAINES  | A00002  "},
-    {"text": "HAINES   A6", "value": "HAINES  | A00006  "},
-    {"text": "HAINES   A18", "value": "HAINES  | A00018  "},
-    {"text": "HAINES   A20", "value": "HAINES  | A00020  "},
-    {"text": "HAINES   A24", "value": "HAINES  | A00024  "},
-    {"text": "HAINES   A25", "value": "HAINES  | A00025  "},
-    {"text": "HAINES   A28", "value": "HAINES  | A00028  "},
-    {"text": "HAINES   A33", "value": "HAINES  | A00033  "},
-    {"text": "HAINES   A37", "value": "HAINES  | A00037  "},
-    {"text": "HAINES   A44", "value": "HAINES  | A00044  "},
-    {"text": "HAINES   A74", "value": "HAINES  | A00074  "},
-    {"text": "HAINES   A76", "value": "HAINES  | A00076  "},
-    {"text": "HAINES   A78", "value": "HAINES  | A00078  "},
-    {"text": "HAINES   A82", "value": "HAINES  | A00082  "},
-    {"text": "HEDRICK  115", "value": "HEDRICK |  00115  "},
-    {"text": "HEDRICK  134", "value": "HEDRICK |  00134  "},
-    {"text": "HERSHEY  148", "value": "HERSHEY |  00148  "},
-    {"text": "HERSHEY  150", "value": "HERSHEY |  00150  "},
-    {"text": "HERSHEY  158", "value": "HERSHEY |  00158  "},
-    {"text": "HERSHEY  164", "value": "HERSHEY |  00164  "},
-    {"text": "HERSHEY  168", "value": "HERSHEY |  00168  "},
-    {"text": "HITCH    100", "value": "HITCH   |  00100  "},
-    {"text": "HITCH    A11", "value": "HITCH   | A00011  "},
-    {"text": "HLTHSCI  12077D", "value": "HLTHSCI |  12077D "},
-    {"text": "HLTHSCI  12077X", "value": "HLTHSCI |  12077X "},
-    {"text": "HLTHSCI  13105A", "value": "HLTHSCI |  13105A "},
-    {"text": "HLTHSCI  13265", "value": "HLTHSCI |  13265  "},
-    {"text": "HLTHSCI  14214U", "value": "HLTHSCI |  14214U "},
-    {"text": "HLTHSCI  16145", "value": "HLTHSCI |  16145  "},
-    {"text": "HLTHSCI  16154", "value": "HLTHSCI |  16154  "},
-    {"text": "HLTHSCI  17187", "value": "HLTHSCI |  17187  "},
-    {"text": "HLTHSCI  17242B", "value": "HLTHSCI |  17242B "},
-    {"text": "HLTHSCI  17256", "value": "HLTHSCI |  17256  "},
-    {"text": "HLTHSCI  17323", "value": "HLTHSCI |  17323  "},
-    {"text": "HLTHSCI  17364", "value": "HLTHSCI |  17364  "},
-    {"text": "HLTHSCI  22096", "value": "HLTHSCI |  22096  "},
-    {"text": "HLTHSCI  23105A", "value": "HLTHSCI |  23105A "},
-    {"text": "HLTHSCI  24132", "value": "HLTHSCI |  24132  "},
-    {"text": "HLTHSCI  30113", "value": "HLTHSCI |  30113  "},
-    {"text": "HLTHSCI  33105A", "value": "HLTHSCI |  33105A "},
-    {"text": "HLTHSCI  33245", "value": "HLTHSCI |  33245  "},
-    {"text": "HLTHSCI  43105A", "value": "HLTHSCI |  43105A "},
-    {"text": "HLTHSCI  51279", "value": "HLTHSCI |  51279  "},
-    {"text": "HLTHSCI  52087", "value": "HLTHSCI |  52087  "},
-    {"text": "HLTHSCI  53105A", "value": "HLTHSCI |  53105A "},
-    {"text": "HLTHSCI  63105A", "value": "HLTHSCI |  63105A "},
-    {"text": "HLTHSCI  63127", "value": "HLTHSCI |  63127  "},
-    {"text": "HLTHSCI  63214", "value": "HLTHSCI |  63214  "},
-    {"text": "HLTHSCI  72181", "value": "HLTHSCI |  72181  "},
-    {"text": "HLTHSCI  73105A", "value": "HLTHSCI |  73105A "},
-    {"text": "HLTHSCI  73167A", "value": "HLTHSCI |  73167A "},
-    {"text": "HLTHSCI  73235", "value": "HLTHSCI |  73235  "},
-    {"text": "HLTHSCI  73240", "value": "HLTHSCI |  73240  "},
-    {"text": "HLTHSCI  A2125", "value": "HLTHSCI | A02125  "},
-    {"text": "HLTHSCI  A2342", "value": "HLTHSCI | A02342  "},
-    {"text": "HLTHSCI  B2161", "value": "HLTHSCI | B02161  "},
-    {"text": "HLTHSCI  B8225", "value": "HLTHSCI | B08225  "},
-    {"text": "HLTHSCI  BH173", "value": "HLTHSCI |BH00173  "},
-    {"text": "HLTHSCI  BL420", "value": "HLTHSCI |BL00420  "},
-    {"text": "HLTHSCI  BO148", "value": "HLTHSCI |BO00148  "},
-    {"text": "HLTHSCI  IP151", "value": "HLTHSCI |IP00151  "},
-    {"text": "HUMANTS  109", "value": "HUMANTS |  00109  "},
-    {"text": "HUMANTS  135", "value": "HUMANTS |  00135  "},
-    {"text": "HUMANTS  136", "value": "HUMANTS |  00136  "},
-    {"text": "HUMANTS  169", "value": "HUMANTS |  00169  "},
-    {"text": "HUMANTS  222B", "value": "HUMANTS |  00222B "},
-    {"text": "HUMANTS  305", "value": "HUMANTS |  00305  "},
-    {"text": "HUMANTS  307", "value": "HUMANTS |  00307  "},
-    {"text": "HUMANTS  311", "value": "HUMANTS |  00311  "},
-    {"text": "HUMANTS  348", "value": "HUMANTS |  00348  "},
-    {"text": "HUMANTS  367", "value": "HUMANTS |  00367  "},
-    {"text": "HUMANTS  370", "value": "HUMANTS |  00370  "},
-    {"text": "HUMANTS  372", "value": "HUMANTS |  00372  "},
-    {"text": "HUMANTS  376C", "value": "HUMANTS |  00376C "},
-    {"text": "HUMANTS  380", "value": "HUMANTS |  00380  "},
-    {"text": "HUMANTS  A26", "value": "HUMANTS | A00026  "},
-    {"text": "HUMANTS  A30", "value": "HUMANTS | A00030  "},
-    {"text": "HUMANTS  A32", "value": "HUMANTS | A00032  "},
-    {"text": "HUMANTS  A40", "value": "HUMANTS | A00040  "},
-    {"text": "HUMANTS  A46", "value": "HUMANTS | A00046  "},
-    {"text": "HUMANTS  A48", "value": "HUMANTS | A00048  "},
-    {"text": "HUMANTS  A51", "value": "HUMANTS | A00051  "},
-    {"text": "HUMANTS  A56", "value": "HUMANTS | A00056  "},
-    {"text": "HUMANTS  A60", "value": "HUMANTS | A00060  "},
-    {"text": "HUMANTS  A65", "value": "HUMANTS | A00065  "},
-    {"text": "HUMANTS  A66", "value": "HUMANTS | A00066  "},
-    {"text": "HUMANTS  A68", "value": "HUMANTS | A00068  "},
-    {"text": "HUMANTS  A82", "value": "HUMANTS | A00082  "},
-    {"text": "JSEI     0AU", "value": "JSEI    |  00000AU"},
-    {"text": "JWEST    0FR", "value": "JWEST   |  00000FR"},
-    {"text": "JWEST    0GP", "value": "JWEST   |  00000GP"},
-    {"text": "KAPLAN   109", "value": "KAPLAN  |  00109  "},
-    {"text": "KAPLAN   126A", "value": "KAPLAN  |  00126A "},
-    {"text": "KAPLAN   135", "value": "KAPLAN  |  00135  "},
-    {"text": "KAPLAN   169", "value": "KAPLAN  |  00169  "},
-    {"text": "KAPLAN   222B", "value": "KAPLAN  |  00222B "},
-    {"text": "KAPLAN   304", "value": "KAPLAN  |  00304  "},
-    {"text": "KAPLAN   305", "value": "KAPLAN  |  00305  "},
-    {"text": "KAPLAN   307", "value": "KAPLAN  |  00307  "},
-    {"text": "KAPLAN   311", "value": "KAPLAN  |  00311  "},
-    {"text": "KAPLAN   318", "value": "KAPLAN  |  00318  "},
-    {"text": "KAPLAN   348", "value": "KAPLAN  |  00348  "},
-    {"text": "KAPLAN   350", "value": "KAPLAN  |  00350  "},
-    {"text": "KAPLAN   365", "value": "KAPLAN  |  00365  "},
-    {"text": "KAPLAN   367", "value": "KAPLAN  |  00367  "},
-    {"text": "KAPLAN   372", "value": "KAPLAN  |  00372  "},
-    {"text": "KAPLAN   398", "value": "KAPLAN  |  00398  "},
-    {"text": "KAPLAN   A6", "value": "KAPLAN  | A00006  "},
-    {"text": "KAPLAN   A26", "value": "KAPLAN  | A00026  "},
-    {"text": "KAPLAN   A30", "value": "KAPLAN  | A00030  "},
-    {"text": "KAPLAN   A32", "value": "KAPLAN  | A00032  "},
-    {"text": "KAPLAN   A40", "value": "KAPLAN  | A00040  "},
-    {"text": "KAPLAN   A46", "value": "KAPLAN  | A00046  "},
-    {"text": "KAPLAN   A48", "value": "KAPLAN  | A00048  "},
-    {"text": "KAPLAN   A51", "value": "KAPLAN  | A00051  "},
-    {"text": "KAPLAN   A56", "value": "KAPLAN  | A00056  "},
-    {"text": "KAPLAN   A60", "value": "KAPLAN  | A00060  "},
-    {"text": "KAPLAN   A65", "value": "KAPLAN  | A00065  "},
-    {"text": "KAPLAN   A66", "value": "KAPLAN  | A00066  "},
-    {"text": "KAPLAN   A68", "value": "KAPLAN  | A00068  "},
-    {"text": "KAUFMAN  101", "value": "KAUFMAN |  00101  "},
-    {"text": "KAUFMAN  136", "value": "KAUFMAN |  00136  "},
-    {"text": "KAUFMAN  145", "value": "KAUFMAN |  00145  "},
-    {"text": "KAUFMAN  153", "value": "KAUFMAN |  00153  "},
-    {"text": "KAUFMAN  160", "value": "KAUFMAN |  00160  "},
-    {"text": "KAUFMAN  180", "value": "KAUFMAN |  00180  "},
-    {"text": "KAUFMAN  200", "value": "KAUFMAN |  00200  "},
-    {"text": "KAUFMAN  208", "value": "KAUFMAN |  00208  "},
-    {"text": "KAUFMAN  214", "value": "KAUFMAN |  00214  "},
-    {"text": "KAUFMAN  230", "value": "KAUFMAN |  00230  "},
-    {"text": "KAUFMAN  240", "value": "KAUFMAN |  00240  "},
-    {"text": "KAUFMAN  250", "value": "KAUFMAN |  00250  "},
-    {"text": "KAUFMAN  1000", "value": "KAUFMAN |  01000  "},
-    {"text": "KNSY PV  1200B", "value": "KNSY PV |  01200B "},
-    {"text": "KNSY PV  1220B", "value": "KNSY PV |  01220B "},
-    {"text": "KNSY PV  1240B", "value": "KNSY PV |  01240B "},
-    {"text": "KNUDSEN  1116", "value": "KNUDSEN |  01116  "},
-    {"text": "KNUDSEN  1134", "value": "KNUDSEN |  01134  "},
-    {"text": "KNUDSEN  1152", "value": "KNUDSEN |  01152  "},
-    {"text": "KNUDSEN  1210", "value": "KNUDSEN |  01210  "},
-    {"text": "KNUDSEN  1238", "value": "KNUDSEN |  01238  "},
-    {"text": "KNUDSEN  2115", "value": "KNUDSEN |  02115  "},
-    {"text": "KNUDSEN  2122", "value": "KNUDSEN |  02122  "},
-    {"text": "KNUDSEN  2136", "value": "KNUDSEN |  02136  "},
-    {"text": "KNUDSEN  3145L", "value": "KNUDSEN |  03145L "},
-    {"text": "KNUDSEN  3171", "value": "KNUDSEN |  03171  "},
-    {"text": "KNUDSEN  4134", "value": "KNUDSEN |  04134  "},
-    {"text": "KNUDSEN  4173", "value": "KNUDSEN |  04173  "},
-    {"text": "KNUDSEN  6107", "value": "KNUDSEN |  06107  "},
-    {"text": "KNUDSEN  6129", "value": "KNUDSEN |  06129  "},
-    {"text": "KNUDSEN  A137", "value": "KNUDSEN | A00137  "},
-    {"text": "KNUDSEN  A146", "value": "KNUDSEN | A00146  "},
-    {"text": "KORN     C314", "value": "KORN    | C00314  "},
-    {"text": "LAKRETZ  100", "value": "LAKRETZ |  00100  "},
-    {"text": "LAKRETZ  101", "value": "LAKRETZ |  00101  "},
-    {"text": "LAKRETZ  110", "value": "LAKRETZ |  00110  "},
-    {"text": "LAKRETZ  120", "value": "LAKRETZ |  00120  "},
-    {"text": "LAKRETZ  300A", "value": "LAKRETZ |  00300A "},
-    {"text": "LAKRETZ  300F", "value": "LAKRETZ |  00300F "},
-    {"text": "LAW      1102", "value": "LAW     |  01102  "},
-    {"text": "LAW      1310", "value": "LAW     |  01310  "},
-    {"text": "LAW      1314", "value": "LAW     |  01314  "},
-    {"text": "LAW      1327", "value": "LAW     |  01327  "},
-    {"text": "LAW      1337", "value": "LAW     |  01337  "},
-    {"text": "LAW      1347", "value": "LAW     |  01347  "},
-    {"text": "LAW      1357", "value": "LAW     |  01357  "},
-    {"text": "LAW      1420", "value": "LAW     |  01420  "},
-    {"text": "LAW      1430", "value": "LAW     |  01430  "},
-    {"text": "LAW      1447", "value": "LAW     |  01447  "},
-    {"text": "LAW      1457", "value": "LAW     |  01457  "},
-    {"text": "LAW      2326", "value": "LAW     |  02326  "},
-    {"text": "LAW      2357", "value": "LAW     |  02357  "},
-    {"text": "LAW      2442", "value": "LAW     |  02442  "},
-    {"text": "LAW      2448", "value": "LAW     |  02448  "},
-    {"text": "LAW      2467", "value": "LAW     |  02467  "},
-    {"text": "LAW      2473", "value": "LAW     |  02473  "},
-    {"text": "LAW      2476", "value": "LAW     |  02476  "},
-    {"text": "LAW      2477", "value": "LAW     |  02477  "},
-    {"text": "LAW      2480", "value": "LAW     |  02480  "},
-    {"text": "LAW      2483", "value": "LAW     |  02483  "},
-    {"text": "LAW      2484", "value": "LAW     |  02484  "},
-    {"text": "LAW      3211A", "value": "LAW     |  03211A "},
-    {"text": "LAW      3393", "value": "LAW     |  03393  "},
-    {"text": "LAW      3467", "value": "LAW     |  03467  "},
-    {"text": "LAW      3473", "value": "LAW     |  03473  "},
-    {"text": "LAW      3483", "value": "LAW     |  03483  "},
-    {"text": "LAW      3484", "value": "LAW     |  03484  "},
-    {"text": "LAW      A122", "value": "LAW     | A00122  "},
-    {"text": "LKGP     100", "value": "LKGP    |  00100  "},
-    {"text": "LKGP     101", "value": "LKGP    |  00101  "},
-    {"text": "LS       1111", "value": "LS      |  01111  "},
-    {"text": "LS       1113", "value": "LS      |  01113  "},
-    {"text": "LS       1123", "value": "LS      |  01123  "},
-    {"text": "LS       1230", "value": "LS      |  01230  "},
-    {"text": "LS       1315", "value": "LS      |  01315  "},
-    {"text": "LS       1362", "value": "LS      |  01362  "},
-    {"text": "LS       2127", "value": "LS      |  02127  "},
-    {"text": "LS       2226", "value": "LS      |  02226  "},
-    {"text": "LS       2306", "value": "LS      |  02306  "},
-    {"text": "LS       2320", "value": "LS      |  02320  "},
-    {"text": "LS       2325", "value": "LS      |  02325  "},
-    {"text": "LS       2328", "value": "LS      |  02328  "},
-    {"text": "LS       2335", "value": "LS      |  02335  "},
-    {"text": "LS       2365", "value": "LS      |  02365  "},
-    {"text": "LS       2822", "value": "LS      |  02822  "},
-    {"text": "LS       3309", "value": "LS      |  03309  "},
-    {"text": "LS       3314", "value": "LS      |  03314  "},
-    {"text": "LS       3324", "value": "LS      |  03324  "},
-    {"text": "LS       3326", "value": "LS      |  03326  "},
-    {"text": "LS       3836", "value": "LS      |  03836  "},
-    {"text": "LS       4114", "value": "LS      |  04114  "},
-    {"text": "LS       4127", "value": "LS      |  04127  "},
-    {"text": "LS       5229", "value": "LS      |  05229  "},
-    {"text": "LS       5236", "value": "LS      |  05236  "},
-    {"text": "LS       5309", "value": "LS      |  05309  "},
-    {"text": "LS       5312", "value": "LS      |  05312  "},
-    {"text": "LS       5323", "value": "LS      |  05323  "},
-    {"text": "LS       5328", "value": "LS      |  05328  "},
-    {"text": "LS       5818", "value": "LS      |  05818  "},
-    {"text": "LS       5826", "value": "LS      |  05826  "},
-    {"text": "LS       5908", "value": "LS      |  05908  "},
-    {"text": "LS       5926", "value": "LS      |  05926  "},
-    {"text": "LS       5929", "value": "LS      |  05929  "},
-    {"text": "LS       A830", "value": "LS      | A00830  "},
-    {"text": "MACDNLD  1441", "value": "MACDNLD |  01441  "},
-    {"text": "MACDNLD  2740", "value": "MACDNLD |  02740  "},
-    {"text": "MACDNLD  3248", "value": "MACDNLD |  03248  "},
-    {"text": "MACGOWN  1154", "value": "MACGOWN |  01154  "},
-    {"text": "MACGOWN  1165", "value": "MACGOWN |  01165  "},
-    {"text": "MACGOWN  1167", "value": "MACGOWN |  01167  "},
-    {"text": "MACGOWN  1200B", "value": "MACGOWN |  01200B "},
-    {"text": "MACGOWN  1220", "value": "MACGOWN |  01220  "},
-    {"text": "MACGOWN  1330", "value": "MACGOWN |  01330  "},
-    {"text": "MACGOWN  1340", "value": "MACGOWN |  01340  "},
-    {"text": "MACGOWN  1350", "value": "MACGOWN |  01350  "},
-    {"text": "MACGOWN  2203", "value": "MACGOWN |  02203  "},
-    {"text": "MACGOWN  2204B", "value": "MACGOWN |  02204B "},
-    {"text": "MACGOWN  2217", "value": "MACGOWN |  02217  "},
-    {"text": "MACGOWN  2310B", "value": "MACGOWN |  02310B "},
-    {"text": "MACGOWN  2310C", "value": "MACGOWN |  02310C "},
-    {"text": "MACGOWN  2330", "value": "MACGOWN |  02330  "},
-    {"text": "MACGOWN  2534", "value": "MACGOWN |  02534  "},
-    {"text": "MACGOWN  3312", "value": "MACGOWN |  03312  "},
-    {"text": "MCGWN E  101", "value": "MCGWN E |  00101  "},
-    {"text": "MCGWN E  102", "value": "MCGWN E |  00102  "},
-    {"text": "MCGWN E  103", "value": "MCGWN E |  00103  "},
-    {"text": "MDCC     12407", "value": "MDCC    |  12407  "},
-    {"text": "MDCC     A2342", "value": "MDCC    | A02342  "},
-    {"text": "MELNITZ  1409", "value": "MELNITZ |  01409  "},
-    {"text": "MELNITZ  1410A", "value": "MELNITZ |  01410A "},
-    {"text": "MELNITZ  1422A", "value": "MELNITZ |  01422A "},
-    {"text": "MELNITZ  1439A", "value": "MELNITZ |  01439A "},
-    {"text": "MELNITZ  1441", "value": "MELNITZ |  01441  "},
-    {"text": "MELNITZ  1446A", "value": "MELNITZ |  01446A "},
-    {"text": "MELNITZ  1451B", "value": "MELNITZ |  01451B "},
-    {"text": "MELNITZ  1462A", "value": "MELNITZ |  01462A "},
-    {"text": "MELNITZ  1470", "value": "MELNITZ |  01470  "},
-    {"text": "MELNITZ  1473A", "value": "MELNITZ |  01473A "},
-    {"text": "MELNITZ  2410", "value": "MELNITZ |  02410  "},
-    {"text": "MELNITZ  2457", "value": "MELNITZ |  02457  "},
-    {"text": "MELNITZ  2471", "value": "MELNITZ |  02471  "},
-    {"text": "MELNITZ  2474", "value": "MELNITZ |  02474  "},
-    {"text": "MELNITZ  2479", "value": "MELNITZ |  02479  "},
-    {"text": "MELNITZ  2487", "value": "MELNITZ |  02487  "},
-    {"text": "MELNITZ  2534", "value": "MELNITZ |  02534  "},
-    {"text": "MELNITZ  2536", "value": "MELNITZ |  02536  "},
-    {"text": "MELNITZ  2544", "value": "MELNITZ |  02544  "},
-    {"text": "MELNITZ  2558", "value": "MELNITZ |  02558  "},
-    {"text": "MELNITZ  2568B", "value": "MELNITZ |  02568B "},
-    {"text": "MELNITZ  2585", "value": "MELNITZ |  02585  "},
-    {"text": "MELNITZ  2586B", "value": "MELNITZ |  02586B "},
-    {"text": "MELNITZ  2589", "value": "MELNITZ |  02589  "},
-    {"text": "MELNITZ  A405", "value": "MELNITZ | A00405  "},
-    {"text": "MNOUKIAN 1208", "value": "MNOUKIAN|  01208  "},
-    {"text": "MOL SCI  1434", "value": "MOL SCI |  01434  "},
-    {"text": "MOL SCI  1601", "value": "MOL SCI |  01601  "},
-    {"text": "MOL SCI  3440", "value": "MOL SCI |  03440  "},
-    {"text": "MOL SCI  3515", "value": "MOL SCI |  03515  "},
-    {"text": "MOL SCI  5241", "value": "MOL SCI |  05241  "},
-    {"text": "MOORE    100", "value": "MOORE   |  00100  "},
-    {"text": "MOORE    1003", "value": "MOORE   |  01003  "},
-    {"text": "MOORE    1041", "value": "MOORE   |  01041  "},
-    {"text": "MOORE    1048", "value": "MOORE   |  01048  "},
-    {"text": "MOORE    2011A", "value": "MOORE   |  02011A "},
-    {"text": "MOORE    2016", "value": "MOORE   |  02016  "},
-    {"text": "MOORE    2120", "value": "MOORE   |  02120  "},
-    {"text": "MOORE    2137", "value": "MOORE   |  02137  "},
-    {"text": "MOORE    2320", "value": "MOORE   |  02320  "},
-    {"text": "MOORE    3021", "value": "MOORE   |  03021  "},
-    {"text": "MOORE    3026", "value": "MOORE   |  03026  "},
-    {"text": "MOORE    3027", "value": "MOORE   |  03027  "},
-    {"text": "MOORE    3030", "value": "MOORE   |  03030  "},
-    {"text": "MOORE    3034", "value": "MOORE   |  03034  "},
-    {"text": "MOORE    3120", "value": "MOORE   |  03120  "},
-    {"text": "MOORE    3140", "value": "MOORE   |  03140  "},
-    {"text": "MOORE    3320", "value": "MOORE   |  03320  "},
-    {"text": "MOORE    3340", "value": "MOORE   |  03340  "},
-    {"text": "MP 200   B265", "value": "MP 200  | B00265  "},
-    {"text": "MP 300   1208", "value": "MP 300  |  01208  "},
-    {"text": "MP 300   3200", "value": "MP 300  |  03200  "},
-    {"text": "MP 300   B500", "value": "MP 300  | B00500  "},
-    {"text": "MS       1000B", "value": "MS      |  01000B "},
-    {"text": "MS       2000", "value": "MS      |  02000  "},
-    {"text": "MS       2915", "value": "MS      |  02915  "},
-    {"text": "MS       3915A", "value": "MS      |  03915A "},
-    {"text": "MS       3915D", "value": "MS      |  03915D "},
-    {"text": "MS       3915G", "value": "MS      |  03915G "},
-    {"text": "MS       3915H", "value": "MS      |  03915H "},
-    {"text": "MS       3974", "value": "MS      |  03974  "},
-    {"text": "MS       4000A", "value": "MS      |  04000A "},
-    {"text": "MS       4202", "value": "MS      |  04202  "},
-    {"text": "MS       5117", "value": "MS      |  05117  "},
-    {"text": "MS       5118", "value": "MS      |  05118  "},
-    {"text": "MS       5127", "value": "MS      |  05127  "},
-    {"text": "MS       5128", "value": "MS      |  05128  "},
-    {"text": "MS       5137", "value": "MS      |  05137  "},
-    {"text": "MS       5138", "value": "MS      |  05138  "},
-    {"text": "MS       5147", "value": "MS      |  05147  "},
-    {"text": "MS       5148", "value": "MS      |  05148  "},
-    {"text": "MS       5200", "value": "MS      |  05200  "},
-    {"text": "MS       5203", "value": "MS      |  05203  "},
-    {"text": "MS       5217", "value": "MS      |  05217  "},
-    {"text": "MS       5225", "value": "MS      |  05225  "},
-    {"text": "MS       5233", "value": "MS      |  05233  "},
-    {"text": "MS       5628", "value": "MS      |  05628  "},
-    {"text": "MS       6118", "value": "MS      |  06118  "},
-    {"text": "MS       6201", "value": "MS      |  06201  "},
-    {"text": "MS       6221", "value": "MS      |  06221  "},
-    {"text": "MS       6229", "value": "MS      |  06229  "},
-    {"text": "MS       6620", "value": "MS      |  06620  "},
-    {"text": "MS       6627", "value": "MS      |  06627  "},
-    {"text": "MS       6943", "value": "MS      |  06943  "},
-    {"text": "MS       7101", "value": "MS      |  07101  "},
-    {"text": "MS       7121", "value": "MS      |  07121  "},
-    {"text": "MS       7124", "value": "MS      |  07124  "},
-    {"text": "MS       7124A", "value": "MS      |  07124A "},
-    {"text": "MS       7124B", "value": "MS      |  07124B "},
-    {"text": "MS       7150", "value": "MS      |  07150  "},
-    {"text": "MS       7160", "value": "MS      |  07160  "},
-    {"text": "MS       7608", "value": "MS      |  07608  "},
-    {"text": "MS       8361", "value": "MS      |  08361  "},
-    {"text": "MS       8941", "value": "MS      |  08941  "},
-    {"text": "MS       8964", "value": "MS      |  08964  "},
-    {"text": "MS       8983", "value": "MS      |  08983  "},
-    {"text": "MURPHY   1215", "value": "MURPHY  |  01215  "},
-    {"text": "MURPHY   2121", "value": "MURPHY  |  02121  "},
-    {"text": "MURPHY   3312", "value": "MURPHY  |  03312  "},
-    {"text": "MURPHY   A316", "value": "MURPHY  | A00316  "},
-    {"text": "MURPHY   A334", "value": "MURPHY  | A00334  "},
-    {"text": "NEUROSC  132", "value": "NEUROSC |  00132  "},
-    {"text": "NEUROSC  225X", "value": "NEUROSC |  00225X "},
-    {"text": "NEUROSC  368", "value": "NEUROSC |  00368  "},
-    {"text": "NEUROSC  27200C", "value": "NEUROSC |  27200C "},
-    {"text": "NWAUD    101A", "value": "NWAUD   |  00101A "},
-    {"text": "OHRC     301", "value": "OHRC    |  00301  "},
-    {"text": "OHRC     383", "value": "OHRC    |  00383  "},
-    {"text": "OHRC     401", "value": "OHRC    |  00501  "},
-    {"text": "OHRC     501", "value": "OHRC    |  00501  "},
-    {"text": "OLYMPIC  470", "value": "OLYMPIC |  00470  "},
-    {"text": "OLYMPIC  475", "value": "OLYMPIC |  00475  "},
-    {"text": "ONLINE   0AS", "value": "ONLINE  |  00000AS"},
-    {"text": "ONLINE   0LA", "value": "ONLINE  |  00000LA"},
-    {"text": "ONLINE   0RE", "value": "ONLINE  |  00000RE"},
-    {"text": "ONLINE   IL0TI", "value": "ONLINE  |IL00000TI"},
-    {"text": "OSTIN    110A", "value": "OSTIN   |  00110A "},
-    {"text": "OSTIN    165", "value": "OSTIN   |  00165  "},
-    {"text": "OSTIN    B105", "value": "OSTIN   | B00105  "},
-    {"text": "PAB      1425", "value": "PAB     |  01425  "},
-    {"text": "PAB      1434A", "value": "PAB     |  01434A "},
-    {"text": "PAB      1749", "value": "PAB     |  01749  "},
-    {"text": "PAB      2434", "value": "PAB     |  02434  "},
-    {"text": "PAB      2748", "value": "PAB     |  02748  "},
-    {"text": "PAB      3326", "value": "PAB     |  03326  "},
-    {"text": "PAB      3703", "value": "PAB     |  03703  "},
-    {"text": "PAB      3735", "value": "PAB     |  03735  "},
-    {"text": "PAB      4330", "value": "PAB     |  04330  "},
-    {"text": "PAB      4708", "value": "PAB     |  04708  "},
-    {"text": "PAB      4740", "value": "PAB     |  04740  "},
-    {"text": "PERLOFF  1102", "value": "PERLOFF |  01102  "},
-    {"text": "PERLOFF  1118A", "value": "PERLOFF |  01118A "},
-    {"text": "PERLOFF  1209B", "value": "PERLOFF |  01209B "},
-    {"text": "PERLOFF  1220", "value": "PERLOFF |  01220  "},
-    {"text": "PERLOFF  1224", "value": "PERLOFF |  01224  "},
-    {"text": "PERLOFF  1243A", "value": "PERLOFF |  01243A "},
-    {"text": "PERLOFF  1243B", "value": "PERLOFF |  01243B "},
-    {"text": "PERLOFF  1243C", "value": "PERLOFF |  01243C "},
-    {"text": "PERLOFF  1302A", "value": "PERLOFF |  01302A "},
-    {"text": "PERLOFF  B309", "value": "PERLOFF | B00309  "},
-    {"text": "PERLOFF  B320", "value": "PERLOFF | B00320  "},
-    {"text": "POWELL   186", "value": "POWELL  |  00186  "},
-    {"text": "POWELL   228", "value": "POWELL  |  00228  "},
-    {"text": "POWELL   238", "value": "POWELL  |  00238  "},
-    {"text": "POWELL   270", "value": "POWELL  |  00270  "},
-    {"text": "POWELL   285", "value": "POWELL  |  00285  "},
-    {"text": "POWELL   307", "value": "POWELL  |  00307  "},
-    {"text": "POWELL   320", "value": "POWELL  |  00320  "},
-    {"text": "POWELL   320B", "value": "POWELL  |  00320B "},
-    {"text": "POWELL   320C", "value": "POWELL  |  00320C "},
-    {"text": "POWELL   330", "value": "POWELL  |  00330  "},
-    {"text": "PRITZKER 1521", "value": "PRITZKER|  01521  "},
-    {"text": "PRITZKER 1531", "value": "PRITZKER|  01531  "},
-    {"text": "PRITZKER 2220", "value": "PRITZKER|  02220  "},
-    {"text": "PRITZKER 2506", "value": "PRITZKER|  02506  "},
-    {"text": "PRITZKER 2531", "value": "PRITZKER|  02531  "},
-    {"text": "PRITZKER 2541", "value": "PRITZKER|  02541  "},
-    {"text": "PRITZKER 3509", "value": "PRITZKER|  03509  "},
-    {"text": "PRITZKER 3513", "value": "PRITZKER|  03513  "},
-    {"text": "PRITZKER 3517", "value": "PRITZKER|  03517  "},
-    {"text": "PRITZKER 3520", "value": "PRITZKER|  03520  "},
-    {"text": "PRITZKER 3535", "value": "PRITZKER|  03535  "},
-    {"text": "PRITZKER 3571", "value": "PRITZKER|  03571  "},
-    {"text": "PRITZKER 3572", "value": "PRITZKER|  03572  "},
-    {"text": "PRITZKER 3581", "value": "PRITZKER|  03581  "},
-    {"text": "PRITZKER 4513", "value": "PRITZKER|  04513  "},
-    {"text": "PRITZKER 4522", "value": "PRITZKER|  04522  "},
-    {"text": "PRITZKER 4567", "value": "PRITZKER|  04567  "},
-    {"text": "PRITZKER 5501", "value": "PRITZKER|  05501  "},
-    {"text": "PRITZKER 5505", "value": "PRITZKER|  05505  "},
-    {"text": "PRITZKER 5509", "value": "PRITZKER|  05509  "},
-    {"text": "PRITZKER 5513", "value": "PRITZKER|  05513  "},
-    {"text": "PRITZKER 5533", "value": "PRITZKER|  05533  "},
-    {"text": "PRITZKER 5567", "value": "PRITZKER|  05567  "},
-    {"text": "PRITZKER 6513", "value": "PRITZKER|  06513  "},
-    {"text": "PRITZKER 6546", "value": "PRITZKER|  06546  "},
-    {"text": "PRITZKER 7501", "value": "PRITZKER|  07501  "},
-    {"text": "PRITZKER 7513", "value": "PRITZKER|  07513  "},
-    {"text": "PRITZKER 7525", "value": "PRITZKER|  07525  "},
-    {"text": "PRITZKER 7567", "value": "PRITZKER|  07567  "},
-    {"text": "PRITZKER 8505", "value": "PRITZKER|  08505  "},
-    {"text": "PRITZKER 8509", "value": "PRITZKER|  08509  "},
-    {"text": "PRITZKER 8513", "value": "PRITZKER|  08513  "},
-    {"text": "PRITZKER 8581", "value": "PRITZKER|  08581  "},
-    {"text": "PRITZKER A407B", "value": "PRITZKER| A00407B "},
-    {"text": "PRITZKER C451", "value": "PRITZKER| C00451  "},
-    {"text": "PUB AFF  1015A", "value": "PUB AFF |  01015A "},
-    {"text": "PUB AFF  1023", "value": "PUB AFF |  01023  "},
-    {"text": "PUB AFF  1040", "value": "PUB AFF |  01040  "},
-    {"text": "PUB AFF  1041", "value": "PUB AFF |  01041  "},
-    {"text": "PUB AFF  1222", "value": "PUB AFF |  01222  "},
-    {"text": "PUB AFF  1234", "value": "PUB AFF |  01234  "},
-    {"text": "PUB AFF  1246", "value": "PUB AFF |  01246  "},
-    {"text": "PUB AFF  1256", "value": "PUB AFF |  01256  "},
-    {"text": "PUB AFF  1264", "value": "PUB AFF |  01264  "},
-    {"text": "PUB AFF  1270", "value": "PUB AFF |  01270  "},
-    {"text": "PUB AFF  1278", "value": "PUB AFF |  01278  "},
-    {"text": "PUB AFF  1284", "value": "PUB AFF |  01284  "},
-    {"text": "PUB AFF  1323", "value": "PUB AFF |  01323  "},
-    {"text": "PUB AFF  1329", "value": "PUB AFF |  01329  "},
-    {"text": "PUB AFF  1337", "value": "PUB AFF |  01337  "},
-    {"text": "PUB AFF  1343", "value": "PUB AFF |  01343  "},
-    {"text": "PUB AFF  1400", "value": "PUB AFF |  01400  "},
-    {"text": "PUB AFF  2035B", "value": "PUB AFF |  02035B "},
-    {"text": "PUB AFF  2035H", "value": "PUB AFF |  02035H "},
-    {"text": "PUB AFF  2214", "value": "PUB AFF |  02214  "},
-    {"text": "PUB AFF  2232", "value": "PUB AFF |  02232  "},
-    {"text": "PUB AFF  2238", "value": "PUB AFF |  02238  "},
-    {"text": "PUB AFF  2242", "value": "PUB AFF |  02242  "},
-    {"text": "PUB AFF  2250", "value": "PUB AFF |  02250  "},
-    {"text": "PUB AFF  2270", "value": "PUB AFF |  02270  "},
-    {"text": "PUB AFF  2278", "value": "PUB AFF |  02278  "},
-    {"text": "PUB AFF  2284", "value": "PUB AFF |  02284  "},
-    {"text": "PUB AFF  2292", "value": "PUB AFF |  02292  "},
-    {"text": "PUB AFF  2317", "value": "PUB AFF |  02317  "},
-    {"text": "PUB AFF  2319", "value": "PUB AFF |  02319  "},
-    {"text": "PUB AFF  2325", "value": "PUB AFF |  02325  "},
-    {"text": "PUB AFF  2333", "value": "PUB AFF |  02333  "},
-    {"text": "PUB AFF  2343", "value": "PUB AFF |  02343  "},
-    {"text": "PUB AFF  2355", "value": "PUB AFF |  02355  "},
-    {"text": "PUB AFF  2400", "value": "PUB AFF |  02400  "},
-    {"text": "PUB AFF  2400A", "value": "PUB AFF |  02400A "},
-    {"text": "PUB AFF  2500", "value": "PUB AFF |  02500  "},
-    {"text": "PUB AFF  3320A", "value": "PUB AFF |  03320A "},
-    {"text": "PUB AFF  3333", "value": "PUB AFF |  03333  "},
-    {"text": "PUB AFF  3343", "value": "PUB AFF |  03343  "},
-    {"text": "PUB AFF  4240", "value": "PUB AFF |  04240  "},
-    {"text": "PUB AFF  4240A", "value": "PUB AFF |  04240A "},
-    {"text": "PUB AFF  4317", "value": "PUB AFF |  04317  "},
-    {"text": "PUB AFF  4320A", "value": "PUB AFF |  04320A "},
-    {"text": "PUB AFF  4320B", "value": "PUB AFF |  04320B "},
-    {"text": "PUB AFF  4355", "value": "PUB AFF |  04355  "},
-    {"text": "PUB AFF  4357", "value": "PUB AFF |  04357  "},
-    {"text": "PUB AFF  4371", "value": "PUB AFF |  04371  "},
-    {"text": "PUB AFF  4375", "value": "PUB AFF |  04375  "},
-    {"text": "PUB AFF  5273", "value": "PUB AFF |  05273  "},
-    {"text": "PUB AFF  5344", "value": "PUB AFF |  05344  "},
-    {"text": "PUB AFF  5391", "value": "PUB AFF |  05391  "},
-    {"text": "PUB AFF  6223", "value": "PUB AFF |  06223  "},
-    {"text": "PUB AFF  6232", "value": "PUB AFF |  06232  "},
-    {"text": "PUB AFF  6274", "value": "PUB AFF |  06274  "},
-    {"text": "PUB AFF  6326", "value": "PUB AFF |  06326  "},
-    {"text": "PUB AFF  6362", "value": "PUB AFF |  06362  "},
-    {"text": "PUB HLT  21297", "value": "PUB HLT |  21297  "},
-    {"text": "PUB HLT  31262", "value": "PUB HLT |  31262  "},
-    {"text": "PUB HLT  36070A", "value": "PUB HLT |  36070A "},
-    {"text": "PUB HLT  41235", "value": "PUB HLT |  41235  "},
-    {"text": "PUB HLT  41268", "value": "PUB HLT |  41268  "},
-    {"text": "PUB HLT  51279", "value": "PUB HLT |  51279  "},
-    {"text": "PUB HLT  56059", "value": "PUB HLT |  56059  "},
-    {"text": "PUB HLT  61235", "value": "PUB HLT |  61235  "},
-    {"text": "PUB HLT  61262", "value": "PUB HLT |  61262  "},
-    {"text": "PUB HLT  61269", "value": "PUB HLT |  61269  "},
-    {"text": "PUB HLT  71257", "value": "PUB HLT |  71257  "},
-    {"text": "PUB HLT  A1125", "value": "PUB HLT | A01125  "},
-    {"text": "PUB HLT  A1241", "value": "PUB HLT | A01241  "},
-    {"text": "PUB HLT  A1279", "value": "PUB HLT | A01279  "},
-    {"text": "PUB HLT  A2125", "value": "PUB HLT | A02125  "},
-    {"text": "PVUB     1400K", "value": "PVUB    |  01400K "},
-    {"text": "PVUB     2339B", "value": "PVUB    |  02339B "},
-    {"text": "REED     B106", "value": "REED    | B00106  "},
-    {"text": "REED     C128", "value": "REED    | C00128  "},
-    {"text": "RIEBER   115A", "value": "RIEBER  |  00115A "},
-    {"text": "ROLFE    1200", "value": "ROLFE   |  01200  "},
-    {"text": "ROLFE    1301", "value": "ROLFE   |  01301  "},
-    {"text": "ROLFE    1305", "value": "ROLFE   |  01305  "},
-    {"text": "ROLFE    2117", "value": "ROLFE   |  02117  "},
-    {"text": "ROLFE    2118", "value": "ROLFE   |  02118  "},
-    {"text": "ROLFE    2125", "value": "ROLFE   |  02125  "},
-    {"text": "ROLFE    2201", "value": "ROLFE   |  02201  "},
-    {"text": "ROLFE    2303", "value": "ROLFE   |  02303  "},
-    {"text": "ROLFE    2310", "value": "ROLFE   |  02310  "},
-    {"text": "ROLFE    2325", "value": "ROLFE   |  02325  "},
-    {"text": "ROLFE    3105", "value": "ROLFE   |  03105  "},
-    {"text": "ROLFE    3108", "value": "ROLFE   |  03108  "},
-    {"text": "ROLFE    3115", "value": "ROLFE   |  03115  "},
-    {"text": "ROLFE    3116", "value": "ROLFE   |  03116  "},
-    {"text": "ROLFE    3120", "value": "ROLFE   |  03120  "},
-    {"text": "ROLFE    3121", "value": "ROLFE   |  03121  "},
-    {"text": "ROLFE    3126", "value": "ROLFE   |  03126  "},
-    {"text": "ROLFE    3129", "value": "ROLFE   |  03129  "},
-    {"text": "ROLFE    3134", "value": "ROLFE   |  03134  "},
-    {"text": "ROLFE    3135", "value": "ROLFE   |  03135  "},
-    {"text": "ROLFE    4302", "value": "ROLFE   |  04302  "},
-    {"text": "ROLFE    4330", "value": "ROLFE   |  04330  "},
-    {"text": "ROSNFLD  E214", "value": "ROSNFLD | E00214  "},
-    {"text": "ROYCE    148", "value": "ROYCE   |  00148  "},
-    {"text": "ROYCE    150", "value": "ROYCE   |  00150  "},
-    {"text": "ROYCE    152", "value": "ROYCE   |  00152  "},
-    {"text": "ROYCE    154", "value": "ROYCE   |  00154  "},
-    {"text": "ROYCE    156", "value": "ROYCE   |  00156  "},
-    {"text": "ROYCE    160", "value": "ROYCE   |  00160  "},
-    {"text": "ROYCE    162", "value": "ROYCE   |  00162  "},
-    {"text": "ROYCE    164", "value": "ROYCE   |  00164  "},
-    {"text": "ROYCE    166", "value": "ROYCE   |  00166  "},
-    {"text": "ROYCE    190", "value": "ROYCE   |  00190  "},
-    {"text": "ROYCE    236", "value": "ROYCE   |  00236  "},
-    {"text": "ROYCE    246B", "value": "ROYCE   |  00246B "},
-    {"text": "ROYCE    268B", "value": "ROYCE   |  00268B "},
-    {"text": "ROYCE    276B", "value": "ROYCE   |  00276B "},
-    {"text": "ROYCE    280A", "value": "ROYCE   |  00280A "},
-    {"text": "ROYCE    306", "value": "ROYCE   |  00306  "},
-    {"text": "ROYCE    332", "value": "ROYCE   |  00332  "},
-    {"text": "ROYCE    332C", "value": "ROYCE   |  00332C "},
-    {"text": "ROYCE    334C", "value": "ROYCE   |  00334C "},
-    {"text": "ROYCE    342", "value": "ROYCE   |  00342  "},
-    {"text": "ROYCE    362", "value": "ROYCE   |  00362  "},
-    {"text": "SAC      120P", "value": "SAC     |  00120P "},
-    {"text": "SAC      215", "value": "SAC     |  00215  "},
-    {"text": "SAC      304", "value": "SAC     |  00304  "},
-    {"text": "SAC      B1", "value": "SAC     | B00001  "},
-    {"text": "SAC      B2", "value": "SAC     | B00002  "},
-    {"text": "SAC      B3", "value": "SAC     | B00003  "},
-    {"text": "SAC      B5", "value": "SAC     | B00005  "},
-    {"text": "SAC      B20B", "value": "SAC     | B00020B "},
-    {"text": "SEMEL    17364", "value": "SEMEL   |  17364  "},
-    {"text": "SEMEL    17416", "value": "SEMEL   |  17416  "},
-    {"text": "SEMEL    18250", "value": "SEMEL   |  18250  "},
-    {"text": "SEMEL    27418", "value": "SEMEL   |  27418  "},
-    {"text": "SEMEL    28181", "value": "SEMEL   |  28181  "},
-    {"text": "SEMEL    28221", "value": "SEMEL   |  28221  "},
-    {"text": "SEMEL    37413", "value": "SEMEL   |  37413  "},
-    {"text": "SEMEL    37415", "value": "SEMEL   |  37415  "},
-    {"text": "SEMEL    37417", "value": "SEMEL   |  37417  "},
-    {"text": "SEMEL    67415", "value": "SEMEL   |  67415  "},
-    {"text": "SEMEL    68238", "value": "SEMEL   |  68238  "},
-    {"text": "SEMEL    78233", "value": "SEMEL   |  78233  "},
-    {"text": "SEMEL    A8221", "value": "SEMEL   | A08221  "},
-    {"text": "SEMEL    B8225", "value": "SEMEL   | B08225  "},
-    {"text": "SEMEL    C8177", "value": "SEMEL   | C08177  "},
-    {"text": "SEMEL    C8183H", "value": "SEMEL   | C08183H "},
-    {"text": "SEMEL    C8639", "value": "SEMEL   | C08639  "},
-    {"text": "SLICHTR  2834", "value": "SLICHTR |  02834  "},
-    {"text": "SLICHTR  2870", "value": "SLICHTR |  02870  "},
-    {"text": "SLICHTR  3853", "value": "SLICHTR |  03853  "},
-    {"text": "SLICHTR  3871", "value": "SLICHTR |  03871  "},
-    {"text": "SMB      1100", "value": "SMB     |  01100  "},
-    {"text": "SMB      1102F", "value": "SMB     |  01102F "},
-    {"text": "SMB      1102M", "value": "SMB     |  01102M "},
-    {"text": "SMB      1200", "value": "SMB     |  01200  "},
-    {"text": "SMB      1230", "value": "SMB     |  01230  "},
-    {"text": "SMB      1325", "value": "SMB     |  01325  "},
-    {"text": "SMB      1343", "value": "SMB     |  01343  "},
-    {"text": "SMB      1344", "value": "SMB     |  01344  "},
-    {"text": "SMB      1345", "value": "SMB     |  01345  "},
-    {"text": "SMB      1354", "value": "SMB     |  01354  "},
-    {"text": "SMB      1402", "value": "SMB     |  01402  "},
-    {"text": "SMB      1420", "value": "SMB     |  01420  "},
-    {"text": "SMB      1421", "value": "SMB     |  01421  "},
-    {"text": "SMB      1439", "value": "SMB     |  01439  "},
-    {"text": "SMB      1440", "value": "SMB     |  01440  "},
-    {"text": "SMB      1535", "value": "SMB     |  01535  "},
-    {"text": "SMB      1630A", "value": "SMB     |  01630A "},
-    {"text": "SMB      1642B", "value": "SMB     |  01642B "},
-    {"text": "SMB      1659", "value": "SMB     |  01659  "},
-    {"text": "SMB      1818", "value": "SMB     |  01818  "},
-    {"text": "SMB      1846", "value": "SMB     |  01846  "},
-    {"text": "SMB      2449", "value": "SMB     |  02449  "},
-    {"text": "SMB      2646", "value": "SMB     |  02646  "},
-    {"text": "SMB      B425", "value": "SMB     | B00425  "},
-    {"text": "SMB      B429", "value": "SMB     | B00429  "},
-    {"text": "SMB      B431", "value": "SMB     | B00431  "},
-    {"text": "SMB      B544", "value": "SMB     | B00544  "},
-    {"text": "SMB      B648", "value": "SMB     | B00648  "},
-    {"text": "SMB      B665A", "value": "SMB     | B00665A "},
-    {"text": "SMB      B674", "value": "SMB     | B00674  "},
-    {"text": "SMB      B686", "value": "SMB     | B00686  "},
-    {"text": "SPROUL   110A", "value": "SPROUL  |  00110A "},
-    {"text": "STRTHMR  200", "value": "STRTHMR |  00200  "},
-    {"text": "TERASKI  1100", "value": "TERASKI |  01100  "},
-    {"text": "WASSRMN  437", "value": "WASSRMN |  00437  "},
-    {"text": "WGYOUNG  1033", "value": "WGYOUNG |  01033  "},
-    {"text": "WGYOUNG  1039", "value": "WGYOUNG |  01039  "},
-    {"text": "WGYOUNG  1044", "value": "WGYOUNG |  01044  "},
-    {"text": "WGYOUNG  1049", "value": "WGYOUNG |  01049  "},
-    {"text": "WGYOUNG  1067", "value": "WGYOUNG |  01067  "},
-    {"text": "WGYOUNG  1077", "value": "WGYOUNG |  01077  "},
-    {"text": "WGYOUNG  1089", "value": "WGYOUNG |  01089  "},
-    {"text": "WGYOUNG  1096", "value": "WGYOUNG |  01096  "},
-    {"text": "WGYOUNG  1110", "value": "WGYOUNG |  01110  "},
-    {"text": "WGYOUNG  1111", "value": "WGYOUNG |  01111  "},
-    {"text": "WGYOUNG  1336", "value": "WGYOUNG |  01336  "},
-    {"text": "WGYOUNG  1337", "value": "WGYOUNG |  01337  "},
-    {"text": "WGYOUNG  1340", "value": "WGYOUNG |  01340  "},
-    {"text": "WGYOUNG  1343", "value": "WGYOUNG |  01343  "},
-    {"text": "WGYOUNG  1370", "value": "WGYOUNG |  01370  "},
-    {"text": "WGYOUNG  1379", "value": "WGYOUNG |  01379  "},
-    {"text": "WGYOUNG  2033", "value": "WGYOUNG |  02033  "},
-    {"text": "WGYOUNG  2050", "value": "WGYOUNG |  02050  "},
-    {"text": "WGYOUNG  2200", "value": "WGYOUNG |  02200  "},
-    {"text": "WGYOUNG  2336", "value": "WGYOUNG |  02336  "},
-    {"text": "WGYOUNG  2337", "value": "WGYOUNG |  02337  "},
-    {"text": "WGYOUNG  2343", "value": "WGYOUNG |  02343  "},
-    {"text": "WGYOUNG  2370", "value": "WGYOUNG |  02370  "},
-    {"text": "WGYOUNG  2379", "value": "WGYOUNG |  02379  "},
-    {"text": "WGYOUNG  3047", "value": "WGYOUNG |  03047  "},
-    {"text": "WGYOUNG  3064", "value": "WGYOUNG |  03064  "},
-    {"text": "WGYOUNG  3069", "value": "WGYOUNG |  03069  "},
-    {"text": "WGYOUNG  3085B", "value": "WGYOUNG |  03085B "},
-    {"text": "WGYOUNG  3096", "value": "WGYOUNG |  03096  "},
-    {"text": "WGYOUNG  3336", "value": "WGYOUNG |  03336  "},
-    {"text": "WGYOUNG  3337", "value": "WGYOUNG |  03337  "},
-    {"text": "WGYOUNG  3340", "value": "WGYOUNG |  03340  "},
-    {"text": "WGYOUNG  3370", "value": "WGYOUNG |  03370  "},
-    {"text": "WGYOUNG  4067", "value": "WGYOUNG |  04067  "},
-    {"text": "WGYOUNG  4085F", "value": "WGYOUNG |  04085F "},
-    {"text": "WGYOUNG  4216", "value": "WGYOUNG |  04216  "},
-    {"text": "WGYOUNG  4232", "value": "WGYOUNG |  04232  "},
-    {"text": "WGYOUNG  4335", "value": "WGYOUNG |  04335  "},
-    {"text": "WGYOUNG  4336", "value": "WGYOUNG |  04336  "},
-    {"text": "WGYOUNG  4340", "value": "WGYOUNG |  04340  "},
-    {"text": "WGYOUNG  4341", "value": "WGYOUNG |  04341  "},
-    {"text": "WGYOUNG  4346", "value": "WGYOUNG |  04346  "},
-    {"text": "WGYOUNG  4350", "value": "WGYOUNG |  04350  "},
-    {"text": "WGYOUNG  5076", "value": "WGYOUNG |  05076  "},
-    {"text": "WGYOUNG  6072", "value": "WGYOUNG |  06072  "},
-    {"text": "WGYOUNG  6073", "value": "WGYOUNG |  06073  "},
-    {"text": "WGYOUNG  6085", "value": "WGYOUNG |  06085  "},
-    {"text": "WGYOUNG  6086", "value": "WGYOUNG |  06086  "},
-    {"text": "WGYOUNG  6096", "value": "WGYOUNG |  06096  "},
-    {"text": "WGYOUNG  6110", "value": "WGYOUNG |  06110  "},
-    {"text": "WGYOUNG  CS24", "value": "WGYOUNG |CS00024  "},
-    {"text": "WGYOUNG  CS50", "value": "WGYOUNG |CS00050  "},
-    {"text": "WGYOUNG  CS76", "value": "WGYOUNG |CS00076  "},
-    {"text": "WOODEN   1402", "value": "WOODEN  |  01402  "},
-    {"text": "WOODEN   2320", "value": "WOODEN  |  02320  "},
-    {"text": "YRL      11360", "value": "YRL     |  11360  "},
-    {"text": "YRL      11630F", "value": "YRL     |  11630F "},
-    {"text": "YRL      11630L", "value": "YRL     |  11630L "},
-    {"text": "YRL      23167", "value": "YRL     |  23167  "},
-    {"text": "YRL      A1713A", "value": "YRL     | A01713A "},
-    ]
-
-    offered_rooms_25F = [
-        {"building": "Boelter Hall", "room": "2444", "capacity": 80, "type": "Classroom"},
-        {"building": "Boelter Hall", "room": "2760", "capacity": 72, "type": "Classroom"},
-        {"building": "Boelter Hall", "room": "3400", "capacity": 174, "type": "Classroom"},
-        {"building": "Boelter Hall", "room": "4283", "capacity": 30, "type": "Classroom"},
-        {"building": "Boelter Hall", "room": "4413", "capacity": 30, "type": "Classroom"},
-        {"building": "Boelter Hall", "room": "5249", "capacity": 92, "type": "Classroom"},
-        {"building": "Boelter Hall", "room": "5252", "capacity": 34, "type": "Classroom"},
-        {"building": "Boelter Hall", "room": "5264", "capacity": 48, "type": "Classroom"},
-        {"building": "Boelter Hall", "room": "5272", "capacity": 39, "type": "Classroom"},
-        {"building": "Boelter Hall", "room": "5273", "capacity": 41, "type": "Classroom"},
-        {"building": "Boelter Hall", "room": "5280", "capacity": 40, "type": "Classroom"},
-        {"building": "Boelter Hall", "room": "5419", "capacity": 40, "type": "Classroom"},
-        {"building": "Boelter Hall", "room": "5420", "capacity": 40, "type": "Classroom"},
-        {"building": "Boelter Hall", "room": "5422", "capacity": 40, "type": "Classroom"},
-        {"building": "Boelter Hall", "room": "5436", "capacity": 49, "type": "Classroom"},
-        {"building": "Boelter Hall", "room": "5440", "capacity": 44, "type": "Classroom"},
-        {"building": "Boelter Hall", "room": "5514", "capacity": 14, "type": "Seminar Room"},
-        {"building": "Boelter Hall", "room": "9436", "capacity": 47, "type": "Classroom"},
-        {"building": "Broad Art Center", "room": "2100A", "capacity": 83, "type": "Classroom"},
-        {"building": "Broad Art Center", "room": "2160E", "capacity": 406, "type": "Auditorium"},
-        {"building": "Bunche Hall", "room": "1209B", "capacity": 221, "type": "Classroom"},
-        {"building": "Bunche Hall", "room": "1221A", "capacity": 34, "type": "Classroom"},
-        {"building": "Bunche Hall", "room": "1265", "capacity": 16, "type": "Seminar Room"},
-        {"building": "Bunche Hall", "room": "2121", "capacity": 16, "type": "Seminar Room"},
-        {"building": "Bunche Hall", "room": "2150", "capacity": 16, "type": "Seminar Room"},
-        {"building": "Bunche Hall", "room": "2156", "capacity": 28, "type": "Classroom"},
-        {"building": "Bunche Hall", "room": "2160", "capacity": 40, "type": "Classroom"},
-        {"building": "Bunche Hall", "room": "2168", "capacity": 28, "type": "Classroom"},
-        {"building": "Bunche Hall", "room": "2173", "capacity": 16, "type": "Seminar Room"},
-        {"building": "Bunche Hall", "room": "2174", "capacity": 16, "type": "Seminar Room"},
-        {"building": "Bunche Hall", "room": "2178", "capacity": 38, "type": "Classroom"},
-        {"building": "Bunche Hall", "room": "2181", "capacity": 26, "type": "Classroom"},
-        {"building": "Bunche Hall", "room": "2209A", "capacity": 221, "type": "Classroom"},
-        {"building": "Bunche Hall", "room": "3117", "capacity": 27, "type": "Classroom"},
-        {"building": "Bunche Hall", "room": "3123", "capacity": 26, "type": "Classroom"},
-        {"building": "Bunche Hall", "room": "3143", "capacity": 37, "type": "Classroom"},
-        {"building": "Bunche Hall", "room": "3150", "capacity": 36, "type": "Classroom"},
-        {"building": "Bunche Hall", "room": "3153", "capacity": 36, "type": "Classroom"},
-        {"building": "Bunche Hall", "room": "3156", "capacity": 40, "type": "Classroom"},
-        {"building": "Bunche Hall", "room": "3157", "capacity": 41, "type": "Classroom"},
-        {"building": "Bunche Hall", "room": "3164", "capacity": 40, "type": "Classroom"},
-        {"building": "Bunche Hall", "room": "3170", "capacity": 40, "type": "Classroom"},
-        {"building": "Bunche Hall", "room": "3178", "capacity": 44, "type": "Classroom"},
-        {"building": "Bunche Hall", "room": "3211", "capacity": 45, "type": "Classroom"},
-        {"building": "Bunche Hall", "room": "A152", "capacity": 25, "type": "Seminar Room"},
-        {"building": "Dodd Hall", "room": "121", "capacity": 158, "type": "Auditorium"},
-        {"building": "Dodd Hall", "room": "146", "capacity": 89, "type": "Classroom"},
-        {"building": "Dodd Hall", "room": "147", "capacity": 366, "type": "Auditorium"},
-        {"building": "Dodd Hall", "room": "154", "capacity": 34, "type": "Classroom"},
-        {"building": "Dodd Hall", "room": "161", "capacity": 106, "type": "Classroom"},
-        {"building": "Dodd Hall", "room": "162", "capacity": 32, "type": "Classroom"},
-        {"building": "Dodd Hall", "room": "167", "capacity": 58, "type": "Classroom"},
-        {"building": "Dodd Hall", "room": "170", "capacity": 62, "type": "Classroom"},
-        {"building": "Dodd Hall", "room": "175", "capacity": 98, "type": "Classroom"},
-        {"building": "Dodd Hall", "room": "178", "capacity": 32, "type": "Classroom"},
-        {"building": "Dodd Hall", "room": "78", "capacity": 50, "type": "Classroom"},
-        {"building": "Fowler Museum", "room": "A103B", "capacity": 320, "type": "Auditorium"},
-        {"building": "Fowler Museum", "room": "A139", "capacity": 104, "type": "Classroom"},
-        {"building": "Franz Hall", "room": "1178", "capacity": 296, "type": "Auditorium"},
-        {"building": "Franz Hall", "room": "1260", "capacity": 147, "type": "Auditorium"},
-        {"building": "Franz Hall", "room": "2258A", "capacity": 82, "type": "Auditorium"},
-        {"building": "Franz Hall", "room": "2288", "capacity": 30, "type": "Seminar Room"},
-        {"building": "Geology Building", "room": "3656", "capacity": 81, "type": "Classroom"},
-        {"building": "Geology Building", "room": "4645", "capacity": 48, "type": "Classroom"},
-        {"building": "Geology Building", "room": "4660", "capacity": 70, "type": "Classroom"},
-        {"building": "Geology Building", "room": "6704", "capacity": 47, "type": "Classroom"},
-        {"building": "Haines Hall", "room": "110", "capacity": 20, "type": "Seminar Room"},
-        {"building": "Haines Hall", "room": "118", "capacity": 122, "type": "Classroom"},
-        {"building": "Haines Hall", "room": "122", "capacity": 20, "type": "Seminar Room"},
-        {"building": "Haines Hall", "room": "220", "capacity": 122, "type": "Classroom"},
-        {"building": "Haines Hall", "room": "39", "capacity": 419, "type": "Auditorium"},
-        {"building": "Haines Hall", "room": "A18", "capacity": 140, "type": "Classroom"},
-        {"building": "Haines Hall", "room": "A2", "capacity": 138, "type": "Classroom"},
-        {"building": "Haines Hall", "room": "A20", "capacity": 26, "type": "Seminar Room"},
-        {"building": "Haines Hall", "room": "A24", "capacity": 28, "type": "Classroom"},
-        {"building": "Haines Hall", "room": "A25", "capacity": 73, "type": "Classroom"},
-        {"building": "Haines Hall", "room": "A28", "capacity": 24, "type": "Seminar Room"},
-        {"building": "Haines Hall", "room": "A44", "capacity": 40, "type": "Classroom"},
-        {"building": "Haines Hall", "room": "A6", "capacity": 20, "type": "Seminar Room"},
-        {"building": "Haines Hall", "room": "A74", "capacity": 26, "type": "Classroom"},
-        {"building": "Haines Hall", "room": "A76", "capacity": 24, "type": "Classroom"},
-        {"building": "Haines Hall", "room": "A78", "capacity": 20, "type": "Seminar Room"},
-        {"building": "Haines Hall", "room": "A82", "capacity": 24, "type": "Classroom"},
-        {"building": "Kaplan Hall", "room": "135", "capacity": 115, "type": "Classroom"},
-        {"building": "Kaplan Hall", "room": "169", "capacity": 115, "type": "Classroom"},
-        {"building": "Kaplan Hall", "room": "A26", "capacity": 32, "type": "Seminar Room"},
-        {"building": "Kaplan Hall", "room": "A30", "capacity": 16, "type": "Seminar Room"},
-        {"building": "Kaplan Hall", "room": "A32", "capacity": 24, "type": "Seminar Room"},
-        {"building": "Kaplan Hall", "room": "A40", "capacity": 20, "type": "Seminar Room"},
-        {"building": "Kaplan Hall", "room": "A46", "capacity": 24, "type": "Seminar Room"},
-        {"building": "Kaplan Hall", "room": "A48", "capacity": 24, "type": "Seminar Room"},
-        {"building": "Kaplan Hall", "room": "A51", "capacity": 290, "type": "Auditorium"},
-        {"building": "Kaplan Hall", "room": "A56", "capacity": 20, "type": "Seminar Room"},
-        {"building": "Kaplan Hall", "room": "A60", "capacity": 20, "type": "Seminar Room"},
-        {"building": "Kaplan Hall", "room": "A65", "capacity": 115, "type": "Classroom"},
-        {"building": "Kaplan Hall", "room": "A66", "capacity": 24, "type": "Seminar Room"},
-        {"building": "Kaplan Hall", "room": "A68", "capacity": 24, "type": "Seminar Room"},
-        {"building": "Kaufman Hall", "room": "101", "capacity": 52, "type": "Classroom"},
-        {"building": "Kaufman Hall", "room": "136", "capacity": 12, "type": "Seminar Room"},
-        {"building": "Kaufman Hall", "room": "153", "capacity": 26, "type": "Classroom"},
-        {"building": "Kinsey Pavilion", "room": "1200B", "capacity": 122, "type": "Auditorium"},
-        {"building": "Kinsey Pavilion", "room": "1220B", "capacity": 178, "type": "Auditorium"},
-        {"building": "Kinsey Pavilion", "room": "1240B", "capacity": 122, "type": "Auditorium"},
-        {"building": "La Kretz Hall", "room": "100", "capacity": 22, "type": "Seminar Room"},
-        {"building": "La Kretz Hall", "room": "101", "capacity": 22, "type": "Seminar Room"},
-        {"building": "La Kretz Hall", "room": "110", "capacity": 352, "type": "Auditorium"},
-        {"building": "La Kretz Hall", "room": "120", "capacity": 46, "type": "Classroom"},
-        {"building": "Mathematical Sciences", "room": "3915A", "capacity": 24, "type": "Seminar Room"},
-        {"building": "Mathematical Sciences", "room": "3915D", "capacity": 24, "type": "Seminar Room"},
-        {"building": "Mathematical Sciences", "room": "3915G", "capacity": 24, "type": "Seminar Room"},
-        {"building": "Mathematical Sciences", "room": "3915H", "capacity": 24, "type": "Seminar Room"},
-        {"building": "Mathematical Sciences", "room": "4000A", "capacity": 210, "type": "Auditorium"},
-        {"building": "Mathematical Sciences", "room": "5117", "capacity": 40, "type": "Classroom"},
-        {"building": "Mathematical Sciences", "room": "5118", "capacity": 40, "type": "Classroom"},
-        {"building": "Mathematical Sciences", "room": "5127", "capacity": 40, "type": "Classroom"},
-        {"building": "Mathematical Sciences", "room": "5128", "capacity": 40, "type": "Classroom"},
-        {"building": "Mathematical Sciences", "room": "5137", "capacity": 40, "type": "Classroom"},
-        {"building": "Mathematical Sciences", "room": "5138", "capacity": 40, "type": "Classroom"},
-        {"building": "Mathematical Sciences", "room": "5147", "capacity": 39, "type": "Classroom"},
-        {"building": "Mathematical Sciences", "room": "5148", "capacity": 26, "type": "Classroom"},
-        {"building": "Mathematical Sciences", "room": "5200", "capacity": 130, "type": "Auditorium"},
-        {"building": "Mathematical Sciences", "room": "5203", "capacity": 30, "type": "Classroom"},
-        {"building": "Mathematical Sciences", "room": "5217", "capacity": 28, "type": "Classroom"},
-        {"building": "Mathematical Sciences", "room": "5225", "capacity": 29, "type": "Classroom"},
-        {"building": "Mathematical Sciences", "room": "5233", "capacity": 30, "type": "Classroom"},
-        {"building": "Mathematical Sciences", "room": "6201", "capacity": 28, "type": "Seminar Room"},
-        {"building": "Mathematical Sciences", "room": "6229", "capacity": 51, "type": "Classroom"},
-        {"building": "Mathematical Sciences", "room": "7608", "capacity": 22, "type": "Classroom"},
-        {"building": "Moore Hall", "room": "100", "capacity": 442, "type": "Auditorium"},
-        {"building": "Moore Hall", "room": "1003", "capacity": 25, "type": "Seminar Room"},
-        {"building": "Perloff Hall", "room": "1102", "capacity": 146, "type": "Classroom"},
-        {"building": "Physics and Astronomy Building", "room": "1425", "capacity": 188, "type": "Classroom"},
-        {"building": "Physics and Astronomy Building", "room": "1434A", "capacity": 95, "type": "Classroom"},
-        {"building": "Physics and Astronomy Building", "room": "1749", "capacity": 40, "type": "Classroom"},
-        {"building": "Physics and Astronomy Building", "room": "2434", "capacity": 48, "type": "Classroom"},
-        {"building": "Physics and Astronomy Building", "room": "2748", "capacity": 43, "type": "Classroom"},
-        {"building": "Public Affairs Building", "room": "1222", "capacity": 93, "type": "Classroom"},
-        {"building": "Public Affairs Building", "room": "1234", "capacity": 93, "type": "Classroom"},
-        {"building": "Public Affairs Building", "room": "1246", "capacity": 93, "type": "Classroom"},
-        {"building": "Public Affairs Building", "room": "1256", "capacity": 32, "type": "Seminar Room"},
-        {"building": "Public Affairs Building", "room": "1264", "capacity": 28, "type": "Seminar Room"},
-        {"building": "Public Affairs Building", "room": "1270", "capacity": 28, "type": "Seminar Room"},
-        {"building": "Public Affairs Building", "room": "1278", "capacity": 28, "type": "Seminar Room"},
-        {"building": "Public Affairs Building", "room": "1284", "capacity": 32, "type": "Seminar Room"},
-        {"building": "Public Affairs Building", "room": "1323", "capacity": 28, "type": "Seminar Room"},
-        {"building": "Public Affairs Building", "room": "1329", "capacity": 32, "type": "Seminar Room"},
-        {"building": "Public Affairs Building", "room": "1337", "capacity": 46, "type": "Classroom"},
-        {"building": "Public Affairs Building", "room": "1343", "capacity": 32, "type": "Seminar Room"},
-        {"building": "Public Affairs Building", "room": "2214", "capacity": 85, "type": "Classroom"},
-        {"building": "Public Affairs Building", "room": "2232", "capacity": 57, "type": "Classroom"},
-        {"building": "Public Affairs Building", "room": "2238", "capacity": 46, "type": "Classroom"},
-        {"building": "Public Affairs Building", "room": "2242", "capacity": 50, "type": "Classroom"},
-        {"building": "Public Affairs Building", "room": "2250", "capacity": 60, "type": "Classroom"},
-        {"building": "Public Affairs Building", "room": "2270", "capacity": 73, "type": "Classroom"},
-        {"building": "Public Affairs Building", "room": "2278", "capacity": 28, "type": "Seminar Room"},
-        {"building": "Public Affairs Building", "room": "2284", "capacity": 28, "type": "Seminar Room"},
-        {"building": "Public Affairs Building", "room": "2292", "capacity": 16, "type": "Seminar Room"},
-        {"building": "Public Affairs Building", "room": "2317", "capacity": 28, "type": "Seminar Room"},
-        {"building": "Public Affairs Building", "room": "2319", "capacity": 28, "type": "Seminar Room"},
-        {"building": "Public Affairs Building", "room": "2325", "capacity": 28, "type": "Seminar Room"},
-        {"building": "Public Affairs Building", "room": "2333", "capacity": 28, "type": "Seminar Room"},
-        {"building": "Rolfe Hall", "room": "1200", "capacity": 292, "type": "Auditorium"},
-        {"building": "Rolfe Hall", "room": "3105", "capacity": 35, "type": "Classroom"},
-        {"building": "Rolfe Hall", "room": "3108", "capacity": 36, "type": "Seminar Room"},
-        {"building": "Rolfe Hall", "room": "3115", "capacity": 16, "type": "Seminar Room"},
-        {"building": "Rolfe Hall", "room": "3116", "capacity": 36, "type": "Seminar Room"},
-        {"building": "Rolfe Hall", "room": "3120", "capacity": 16, "type": "Seminar Room"},
-        {"building": "Rolfe Hall", "room": "3121", "capacity": 36, "type": "Seminar Room"},
-        {"building": "Rolfe Hall", "room": "3126", "capacity": 52, "type": "Classroom"},
-        {"building": "Rolfe Hall", "room": "3129", "capacity": 36, "type": "Seminar Room"},
-        {"building": "Rolfe Hall", "room": "3134", "capacity": 48, "type": "Classroom"},
-        {"building": "Rolfe Hall", "room": "3135", "capacity": 45, "type": "Classroom"},
-        {"building": "Royce Hall", "room": "148", "capacity": 24, "type": "Classroom"},
-        {"building": "Royce Hall", "room": "150", "capacity": 37, "type": "Classroom"},
-        {"building": "Royce Hall", "room": "152", "capacity": 30, "type": "Seminar Room"},
-        {"building": "Royce Hall", "room": "154", "capacity": 50, "type": "Classroom"},
-        {"building": "Royce Hall", "room": "156", "capacity": 52, "type": "Classroom"},
-        {"building": "Royce Hall", "room": "160", "capacity": 43, "type": "Classroom"},
-        {"building": "Royce Hall", "room": "162", "capacity": 45, "type": "Classroom"},
-        {"building": "Royce Hall", "room": "164", "capacity": 50, "type": "Classroom"},
-        {"building": "Royce Hall", "room": "166", "capacity": 20, "type": "Seminar Room"},
-        {"building": "Royce Hall", "room": "190", "capacity": 122, "type": "Classroom"},
-        {"building": "Royce Hall", "room": "362", "capacity": 133, "type": "Classroom"},
-        {"building": "Slichter", "room": "2834", "capacity": 20, "type": "Seminar Room"},
-        {"building": "Young Hall", "room": "1044", "capacity": 47, "type": "Classroom"},
-        {"building": "Young Hall", "room": "2200", "capacity": 98, "type": "Classroom"},
-        {"building": "Young Hall", "room": "4216", "capacity": 62, "type": "Classroom"},
-        {"building": "Young Hall", "room": "CS24", "capacity": 254, "type": "Auditorium"},
-        {"building": "Young Hall", "room": "CS50", "capacity": 351, "type": "Auditorium"},
-        {"building": "Young Hall", "room": "CS76", "capacity": 256, "type": "Auditorium"}
-    ]
+    # Dropdown options and offered rooms come from discovery (cached), or the offline snapshot
+    classroom_options, offered_rooms, source = load_catalog(terms[0], refresh=refresh, offline=offline)
+    print(f"Catalog source: {source}")
     print(f"Generating URLs for {len(classroom_options)} classrooms...")
     
     # Generate URLs for the classrooms
-    filled_classrooms = generate_urls(classroom_options, offered_rooms_25F, building_name_map)
+    filled_classrooms = generate_urls(classroom_options, offered_rooms, catalog.building_name_map(), terms)
     
     # Save to JSON
     print("Saving to classrooms.json...")
@@ -1444,4 +124,7 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    import sys
+    
+    terms = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    main(terms or None, refresh='--refresh' in sys.argv, offline='--offline' in sys.argv)
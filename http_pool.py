@@ -0,0 +1,105 @@
+"""
+Pooled HTTP Client
+
+A small keep-alive HTTP client for the thread-pool stages (room probes, image
+checks). Each thread keeps one persistent connection per host, so hundreds of
+requests to the same server reuse a handful of TCP/TLS connections instead of
+opening one per request as urllib does.
+"""
+
+import http.client
+import threading
+import urllib.parse
+
+USER_AGENT = 'StudySpace (educational use)'
+
+
+class Response:
+    """Status, headers (lower-cased names) and body of a completed request."""
+
+    def __init__(self, status, headers, body):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+
+class PooledHTTP:
+    """
+    Per-thread persistent connections keyed by (scheme, host).
+
+    Args:
+        timeout: Socket timeout in seconds
+        max_redirects: Redirects followed before giving up
+    """
+
+    def __init__(self, timeout=15, max_redirects=3, user_agent=USER_AGENT):
+        self.timeout = timeout
+        self.max_redirects = max_redirects
+        self.user_agent = user_agent
+        self._local = threading.local()
+
+    def _connection(self, scheme, netloc):
+        connections = getattr(self._local, 'connections', None)
+        if connections is None:
+            connections = self._local.connections = {}
+        key = (scheme, netloc)
+        if key not in connections:
+            cls = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+            connections[key] = cls(netloc, timeout=self.timeout)
+        return connections[key]
+
+    def _drop(self, scheme, netloc):
+        connection = self._local.connections.pop((scheme, netloc), None)
+        if connection is not None:
+            connection.close()
+
+    def request(self, method, url, headers=None, read_body=True):
+        """
+        Send one request and return a Response, following redirects.
+        A connection the server closed is retried once on a fresh socket.
+        Raises OSError or http.client.HTTPException if the request fails.
+        """
+        for _ in range(self.max_redirects + 1):
+            parts = urllib.parse.urlsplit(url)
+            path = (parts.path or '/') + (f"?{parts.query}" if parts.query else '')
+            request_headers = {'User-Agent': self.user_agent}
+            request_headers.update(headers or {})
+
+            for attempt in range(2):
+                connection = self._connection(parts.scheme, parts.netloc)
+                try:
+                    connection.request(method, path, headers=request_headers)
+                    response = connection.getresponse()
+                    if read_body or method == 'HEAD':
+                        body = response.read()
+                    else:
+                        # An unread body leaves the connection unusable, so close it
+                        body = b''
+                        self._drop(parts.scheme, parts.netloc)
+                    break
+                except (http.client.HTTPException, OSError):
+                    self._drop(parts.scheme, parts.netloc)
+                    if attempt == 1:
+                        raise
+
+            response_headers = {name.lower(): value for name, value in response.getheaders()}
+            if response.status in (301, 302, 303, 307, 308) and 'location' in response_headers:
+                url = urllib.parse.urljoin(url, response_headers['location'])
+                if response.status == 303:
+                    method = 'GET'
+                continue
+            return Response(response.status, response_headers, body)
+
+        raise http.client.HTTPException(f"Too many redirects for {url}")
+
+    def get(self, url, headers=None):
+        return self.request('GET', url, headers)
+
+    def head(self, url, headers=None):
+        return self.request('HEAD', url, headers)
+
+    def close(self):
+        """Close the calling thread's connections."""
+        for connection in getattr(self._local, 'connections', {}).values():
+            connection.close()
+        self._local.connections = {}
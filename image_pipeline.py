@@ -0,0 +1,267 @@
+"""
+Classroom Image Pipeline
+
+Downloads the photos add_images.py mapped into classrooms.json and publishes
+card-sized derivatives next to index.html, so the room grid loads a ~20 KB
+thumbnail in a modern format instead of hot-linking each full-size JPEG.
+
+    1. Fetch every distinct image_url through a bounded thread pool over
+       keep-alive connections. Originals are cached in image_cache/ by content
+       hash; the URL's ETag / Last-Modified are kept in image_cache/index.json
+       and sent back as a conditional request, so unchanged images cost a 304.
+    2. For each original, write WIDTHS-wide derivatives in every format Pillow
+       can encode (AVIF, WebP, JPEG) to images/, named by content hash, and
+       skip files that already exist.
+    3. Store the derivative paths on the room as 'image':
+       {'src', 'srcset', 'sources': [{'type', 'srcset'}], 'width', 'height',
+       'placeholder'}. width/height are the original's intrinsic size and
+       placeholder is a 16px-wide inline data URI, both cached per content hash
+       in image_cache/details.json, so the frontend can reserve the card's
+       layout and paint a blurred preview before the thumbnail arrives.
+       Rooms whose image could not be fetched or decoded lose 'image' and are
+       reported.
+
+Requires Pillow (pip install Pillow).
+
+Usage:
+    python image_pipeline.py [--workers=8] [--out=images] [--widths=220,440]
+"""
+
+import base64
+import hashlib
+import io
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image, features
+
+from http_pool import PooledHTTP
+
+IMAGE_DIR = 'images'
+CACHE_DIR = 'image_cache'
+CACHE_INDEX = 'index.json'
+# Content hash -> intrinsic size and placeholder of each original
+DETAILS_INDEX = 'details.json'
+PLACEHOLDER_WIDTH = 16
+# Cards are 220 CSS pixels wide: 1x and 2x
+WIDTHS = (220, 440)
+
+# (Pillow format, file extension, MIME type, save options), best compression first
+FORMATS = [
+    ('AVIF', 'avif', 'image/avif', {'quality': 55}),
+    ('WEBP', 'webp', 'image/webp', {'quality': 75, 'method': 5}),
+    ('JPEG', 'jpg', 'image/jpeg', {'quality': 80, 'optimize': True, 'progressive': True}),
+]
+
+
+def available_formats():
+    """The FORMATS entries this Pillow build can encode (JPEG is always last)."""
+    return [fmt for fmt in FORMATS if fmt[0] == 'JPEG' or features.check(fmt[0].lower())]
+
+
+def load_cache_index(cache_dir=CACHE_DIR, name=CACHE_INDEX):
+    try:
+        with open(os.path.join(cache_dir, name), 'r') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def save_cache_index(index, cache_dir=CACHE_DIR, name=CACHE_INDEX):
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(os.path.join(cache_dir, name), 'w') as f:
+        json.dump(index, f, indent=4)
+
+
+def fetch_image(url, client, entry, cache_dir=CACHE_DIR):
+    """
+    Download one image, revalidating a cached copy with its ETag / Last-Modified.
+
+    Args:
+        url: Image URL
+        client: PooledHTTP shared by the pool threads
+        entry: This URL's cache index entry, or None
+
+    Returns:
+        (entry, status) where status is 'downloaded', 'not_modified' or an error message;
+        entry is None on error
+    """
+    headers = {}
+    if entry and os.path.exists(os.path.join(cache_dir, entry['sha256'])):
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+
+    try:
+        response = client.get(url, headers=headers)
+    except Exception as e:
+        return None, f"request failed: {e}"
+
+    if response.status == 304 and headers:
+        return dict(entry, checked_at=time.time()), 'not_modified'
+    if response.status != 200:
+        return None, f"HTTP {response.status}"
+    if not response.body:
+        return None, 'empty body'
+
+    sha256 = hashlib.sha256(response.body).hexdigest()
+    path = os.path.join(cache_dir, sha256)
+    if not os.path.exists(path):
+        with open(path + '.tmp', 'wb') as f:
+            f.write(response.body)
+        os.replace(path + '.tmp', path)
+    return {
+        'sha256': sha256,
+        'etag': response.headers.get('etag'),
+        'last_modified': response.headers.get('last-modified'),
+        'content_type': response.headers.get('content-type'),
+        'bytes': len(response.body),
+        'checked_at': time.time(),
+    }, 'downloaded'
+
+
+def make_placeholder(image):
+    """Blurred stand-in for an RGB image: a PLACEHOLDER_WIDTH-wide copy as an inline data URI (~100 bytes)."""
+    width, height = image.size
+    small = image.resize((PLACEHOLDER_WIDTH, max(1, round(height * PLACEHOLDER_WIDTH / width))), Image.BILINEAR)
+    fmt, mime = ('WEBP', 'image/webp') if features.check('webp') else ('JPEG', 'image/jpeg')
+    buffer = io.BytesIO()
+    small.save(buffer, fmt, quality=40)
+    return f"data:{mime};base64,{base64.b64encode(buffer.getvalue()).decode('ascii')}"
+
+
+def _open_rgb(path):
+    with Image.open(path) as original:
+        return original.convert('RGB')
+
+
+def make_derivatives(sha256, cache_dir=CACHE_DIR, out_dir=IMAGE_DIR, widths=WIDTHS, formats=None, details=None):
+    """
+    Write resized copies of a cached original and return the room's 'image' metadata,
+    including the original's intrinsic width/height and an inline placeholder.
+
+    Existing derivative files are reused, so re-runs only encode new images. details
+    is the cached {'width', 'height', 'placeholder'} of this original; when it is given
+    and every derivative exists, the original is not decoded at all.
+    Raises OSError if the original cannot be decoded.
+    """
+    formats = formats or available_formats()
+    name = sha256[:16]
+    path = os.path.join(cache_dir, sha256)
+    image = None
+    if details is None:
+        image = _open_rgb(path)
+        details = {'width': image.width, 'height': image.height, 'placeholder': make_placeholder(image)}
+    width, height = details['width'], details['height']
+
+    # Never upscale; a small original still gets one derivative at its own width
+    srcsets = {}
+    for target in sorted({min(w, width) for w in widths}):
+        for fmt, ext, mime, options in formats:
+            filename = f"{name}-{target}.{ext}"
+            out_path = os.path.join(out_dir, filename)
+            if not os.path.exists(out_path):
+                if image is None:
+                    image = _open_rgb(path)
+                resized = image.resize((target, max(1, round(height * target / width))), Image.LANCZOS)
+                resized.save(out_path + '.tmp', fmt, **options)
+                os.replace(out_path + '.tmp', out_path)
+            srcsets.setdefault(mime, []).append(f"{out_dir}/{filename} {target}w")
+
+    jpeg_mime = formats[-1][2]
+    return {
+        'src': srcsets[jpeg_mime][0].split(' ')[0],
+        'srcset': ', '.join(srcsets[jpeg_mime]),
+        'sources': [{'type': mime, 'srcset': ', '.join(srcsets[mime])}
+                    for _, _, mime, _ in formats if mime != jpeg_mime],
+        'width': width,
+        'height': height,
+        'placeholder': details['placeholder'],
+    }
+
+
+def process_image(url, client, entry, details, cache_dir, out_dir, widths, formats):
+    """Fetch and derive one image. Returns (entry, status, image metadata or None)."""
+    entry, status = fetch_image(url, client, entry, cache_dir)
+    if entry is None:
+        return None, status, None
+    try:
+        image = make_derivatives(entry['sha256'], cache_dir, out_dir, widths, formats, details.get(entry['sha256']))
+        return entry, status, image
+    except OSError as e:
+        return entry, f"cannot decode image: {e}", None
+
+
+def build_images(classrooms, workers=8, cache_dir=CACHE_DIR, out_dir=IMAGE_DIR, widths=WIDTHS, client=None):
+    """
+    Run the pipeline for every room with an image_url and set or clear its 'image'.
+
+    Returns:
+        Dictionary of status -> count, and {url: error} for images that failed
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    os.makedirs(out_dir, exist_ok=True)
+    client = client or PooledHTTP(timeout=20)
+    formats = available_formats()
+    index = load_cache_index(cache_dir)
+    details = load_cache_index(cache_dir, DETAILS_INDEX)
+
+    urls = sorted({room['image_url'] for room in classrooms if room.get('image_url')})
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(
+            lambda url: process_image(url, client, index.get(url), details, cache_dir, out_dir, widths, formats), urls))
+
+    counts = {}
+    failed = {}
+    images = {}
+    for url, (entry, status, image) in zip(urls, results):
+        if entry is not None:
+            index[url] = entry
+        if image is None:
+            failed[url] = status
+            counts['failed'] = counts.get('failed', 0) + 1
+        else:
+            images[url] = image
+            details[entry['sha256']] = {key: image[key] for key in ('width', 'height', 'placeholder')}
+            counts[status] = counts.get(status, 0) + 1
+    save_cache_index(index, cache_dir)
+    save_cache_index(details, cache_dir, DETAILS_INDEX)
+
+    for room in classrooms:
+        image = images.get(room.get('image_url'))
+        if image:
+            room['image'] = image
+        else:
+            room.pop('image', None)
+    return counts, failed
+
+
+def main(workers=8, out_dir=IMAGE_DIR, widths=WIDTHS):
+    with open('classrooms.json', 'r') as f:
+        classrooms = json.load(f)
+
+    formats = ', '.join(fmt[1] for fmt in available_formats())
+    print(f"Formats: {formats} | Widths: {', '.join(map(str, widths))} | Workers: {workers}")
+    started = time.perf_counter()
+    counts, failed = build_images(classrooms, workers=workers, out_dir=out_dir, widths=widths)
+
+    print(f"Processed {sum(counts.values())} images in {time.perf_counter() - started:.1f}s | "
+          f"Downloaded: {counts.get('downloaded', 0)} | Not modified: {counts.get('not_modified', 0)} | "
+          f"Failed: {counts.get('failed', 0)}")
+    for url, error in sorted(failed.items()):
+        print(f"  FAILED {url}: {error}")
+
+    with open('classrooms.json', 'w') as f:
+        json.dump(classrooms, f, indent=4)
+    print("Updated classrooms.json with image derivatives")
+
+
+if __name__ == "__main__":
+    import sys
+
+    options = dict(arg.partition('=')[::2] for arg in sys.argv[1:] if arg.startswith('--'))
+    widths = tuple(int(w) for w in options['--widths'].split(',')) if options.get('--widths') else WIDTHS
+    main(workers=int(options.get('--workers') or 8), out_dir=options.get('--out') or IMAGE_DIR, widths=widths)
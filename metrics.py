@@ -0,0 +1,203 @@
+"""
+Scrape Run Metrics
+
+Structured instrumentation for scrape.py. Each worker fills in one record per
+classroom (phase durations, retries, bytes fetched, driver lifetime and worker
+RSS) and sends it back with its result; the parent process aggregates the
+records into a RunMetrics object and exports them as a JSON run report and a
+Prometheus-style text file.
+
+Phases:
+    probe         - plain HTTP pre-probe (rooms settled without a browser)
+    driver_start  - launching headless Chrome
+    throttle      - waiting on the shared rate limiter
+    navigate      - driver.get() for the ClassroomDetail page
+    wait_details  - waiting for the #classroomDetails element
+    settle        - fixed sleep that lets the calendar script run
+    wait_events   - waiting for FullCalendar events to render
+    parse         - BeautifulSoup parse and event normalization
+"""
+
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+PHASES = ['probe', 'driver_start', 'throttle', 'navigate', 'wait_details', 'settle', 'wait_events', 'parse']
+QUANTILES = [0.5, 0.9, 0.99]
+
+
+def new_room_record(index, building, room):
+    """Create an empty metrics record for one classroom."""
+    return {
+        'index': index,
+        'building': building,
+        'room': room,
+        'term': None,
+        'pid': os.getpid(),
+        'status': None,
+        'events': 0,
+        'phases': {phase: 0.0 for phase in PHASES},
+        'retries': 0,
+        'bytes': 0,
+        'driver_lifetime': 0.0,
+        'rss_bytes': 0,
+    }
+
+
+@contextmanager
+def timed(record, phase):
+    """Add the wall time spent inside the block to record['phases'][phase]."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if record is not None:
+            record['phases'][phase] = record['phases'].get(phase, 0.0) + time.perf_counter() - start
+
+
+def worker_rss_bytes():
+    """Peak resident set size of the current process in bytes (0 if unavailable)."""
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes on Linux
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _quantile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    position = q * (len(sorted_values) - 1)
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    fraction = position - lower
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * fraction
+
+
+def _summarize(values):
+    values = sorted(values)
+    total = sum(values)
+    return {
+        'count': len(values),
+        'sum': total,
+        'mean': total / len(values) if values else 0.0,
+        'max': values[-1] if values else 0.0,
+        'quantiles': {str(q): _quantile(values, q) for q in QUANTILES},
+    }
+
+
+class RunMetrics:
+    """Aggregates per-room metrics records from all pool workers."""
+
+    def __init__(self):
+        self.records = []
+        self.started_at = time.time()
+        self.finished_at = None
+
+    def add(self, record):
+        if record:
+            self.records.append(record)
+
+    def finish(self):
+        self.finished_at = time.time()
+
+    def summary(self):
+        """Return the aggregated run report as a JSON-serializable dict."""
+        finished_at = self.finished_at or time.time()
+        statuses = {}
+        for record in self.records:
+            statuses[record['status']] = statuses.get(record['status'], 0) + 1
+
+        # Peak RSS is per process, so keep the largest sample reported by each worker
+        worker_rss = {}
+        for record in self.records:
+            pid = str(record['pid'])
+            worker_rss[pid] = max(worker_rss.get(pid, 0), record['rss_bytes'])
+
+        phase_totals = {phase: sum(r['phases'].get(phase, 0.0) for r in self.records) for phase in PHASES}
+        accounted = sum(phase_totals.values())
+
+        return {
+            'started_at': self.started_at,
+            'finished_at': finished_at,
+            'wall_seconds': finished_at - self.started_at,
+            'rooms': len(self.records),
+            'statuses': statuses,
+            'retries': sum(r['retries'] for r in self.records),
+            'bytes_fetched': sum(r['bytes'] for r in self.records),
+            'events': sum(r['events'] for r in self.records),
+            'phases': {phase: _summarize([r['phases'].get(phase, 0.0) for r in self.records]) for phase in PHASES},
+            'phase_share': {phase: (phase_totals[phase] / accounted if accounted else 0.0) for phase in PHASES},
+            'driver_lifetime': _summarize([r['driver_lifetime'] for r in self.records]),
+            'worker_rss_bytes': worker_rss,
+            'slowest_rooms': [
+                {'building': r['building'], 'room': r['room'], 'seconds': sum(r['phases'].values())}
+                for r in sorted(self.records, key=lambda r: sum(r['phases'].values()), reverse=True)[:10]
+            ],
+        }
+
+    def write_json(self, path, include_records=True):
+        report = self.summary()
+        if include_records:
+            report['records'] = self.records
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=4)
+
+    def write_prometheus(self, path):
+        """Write the summary in the Prometheus text exposition format."""
+        report = self.summary()
+        lines = []
+
+        def metric(name, kind, help_text):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        def summary_metric(name, stats, labels=''):
+            sep = ',' if labels else ''
+            for q, value in stats['quantiles'].items():
+                lines.append(f'{name}{{{labels}{sep}quantile="{q}"}} {value:.6f}')
+            suffix_labels = f'{{{labels}}}' if labels else ''
+            lines.append(f"{name}_sum{suffix_labels} {stats['sum']:.6f}")
+            lines.append(f"{name}_count{suffix_labels} {stats['count']}")
+
+        metric('scrape_phase_seconds', 'summary', 'Time spent per classroom in each scrape phase.')
+        for phase in PHASES:
+            summary_metric('scrape_phase_seconds', report['phases'][phase], f'phase="{phase}"')
+
+        metric('scrape_driver_lifetime_seconds', 'summary', 'Lifetime of each Chrome driver.')
+        summary_metric('scrape_driver_lifetime_seconds', report['driver_lifetime'])
+
+        metric('scrape_rooms_total', 'counter', 'Classrooms processed by result status.')
+        for status, count in sorted(report['statuses'].items(), key=lambda item: str(item[0])):
+            lines.append(f'scrape_rooms_total{{status="{status}"}} {count}')
+
+        metric('scrape_retries_total', 'counter', 'Scrape attempts retried after a failure.')
+        lines.append(f"scrape_retries_total {report['retries']}")
+
+        metric('scrape_bytes_fetched_total', 'counter', 'Bytes of rendered page source fetched.')
+        lines.append(f"scrape_bytes_fetched_total {report['bytes_fetched']}")
+
+        metric('scrape_events_total', 'counter', 'Calendar events parsed.')
+        lines.append(f"scrape_events_total {report['events']}")
+
+        metric('scrape_worker_peak_rss_bytes', 'gauge', 'Peak resident set size of each pool worker.')
+        for pid, rss in sorted(report['worker_rss_bytes'].items()):
+            lines.append(f'scrape_worker_peak_rss_bytes{{pid="{pid}"}} {rss}')
+
+        metric('scrape_run_duration_seconds', 'gauge', 'Wall time of the whole scrape run.')
+        lines.append(f"scrape_run_duration_seconds {report['wall_seconds']:.6f}")
+
+        with open(path, 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+
+    def format_breakdown(self):
+        """One-line summary of where the time went, for the console."""
+        share = self.summary()['phase_share']
+        return ' | '.join(f"{phase}: {share[phase] * 100:.0f}%" for phase in PHASES)
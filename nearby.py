@@ -0,0 +1,168 @@
+"""
+Nearest Free Rooms
+
+"The closest free room to where I am": combines building coordinates from
+data/buildings.json with an AvailabilityIndex.
+
+Buildings are projected to local metres (equirectangular around the campus
+centroid, accurate to well under a metre at campus scale) and stored in a 2-d
+tree. A query walks the tree best-first, so buildings come out in order of
+straight-line distance without sorting all of them, and only the rooms of the
+buildings visited are checked against the window. The walk stops at the first
+building past the k-th free room, so a query touches a handful of buildings
+and intervals: cheap enough to rerun on every filter change.
+
+Rooms in a building without coordinates are never returned.
+
+Usage:
+    nearby = NearbyIndex(AvailabilityIndex.from_file('classrooms.json'))
+    nearby.nearest_free(34.0700, -118.4430, 'Monday', '10:00 AM', '11:00 AM', k=5, min_cap=30)
+
+    python nearby.py 34.0700 -118.4430 Monday 10:00AM 11:00AM [--k=10] [--min-cap=30] [--max-cap=100]
+                      [--building=BOELTER] [--feature=...] [--term=26W]
+"""
+
+import heapq
+import math
+
+import catalog
+from availability import parse_time
+
+# Metres per degree of latitude; a degree of longitude is this times cos(latitude)
+METRES_PER_DEGREE = 111320.0
+
+
+class KDTree:
+    """
+    Static 2-d tree over (x, y, item) points with best-first nearest-neighbour iteration.
+
+    Each node is (x, y, item, axis, left, right, bounds), bounds being the
+    (min_x, min_y, max_x, max_y) box of its subtree.
+    """
+
+    def __init__(self, points):
+        self.root = self._build(list(points), 0)
+
+    def _build(self, points, axis):
+        if not points:
+            return None
+        points.sort(key=lambda point: point[axis])
+        middle = len(points) // 2
+        x, y, item = points[middle]
+        bounds = (min(p[0] for p in points), min(p[1] for p in points),
+                  max(p[0] for p in points), max(p[1] for p in points))
+        return (x, y, item, axis,
+                self._build(points[:middle], 1 - axis), self._build(points[middle + 1:], 1 - axis), bounds)
+
+    @staticmethod
+    def _box_distance(bounds, x, y):
+        dx = max(bounds[0] - x, 0, x - bounds[2])
+        dy = max(bounds[1] - y, 0, y - bounds[3])
+        return math.hypot(dx, dy)
+
+    def nearest(self, x, y):
+        """Yield (distance, item) for every point, nearest first."""
+        if self.root is None:
+            return
+        # Heap entries are (distance lower bound, tiebreak, node or None, item): a subtree is only
+        # expanded once nothing already found can be closer than its bounding box
+        heap = [(self._box_distance(self.root[6], x, y), 0, self.root, None)]
+        counter = 1
+        while heap:
+            distance, _, node, item = heapq.heappop(heap)
+            if node is None:
+                yield distance, item
+                continue
+            node_x, node_y, node_item, _, left, right, _ = node
+            heapq.heappush(heap, (math.hypot(node_x - x, node_y - y), counter, None, node_item))
+            counter += 1
+            for child in (left, right):
+                if child is not None:
+                    heapq.heappush(heap, (self._box_distance(child[6], x, y), counter, child, None))
+                    counter += 1
+
+
+class NearbyIndex:
+    """
+    Building 2-d tree on top of an AvailabilityIndex.
+
+    Args:
+        index: AvailabilityIndex whose rooms to search
+        locations: Building code -> (lat, lon); default catalog.building_locations()
+    """
+
+    def __init__(self, index, locations=None):
+        self.index = index
+        locations = catalog.building_locations() if locations is None else locations
+        located = {code: locations[code] for code in index.by_building if code in locations}
+        self.unlocated = sorted(set(index.by_building) - set(located))
+        if located:
+            self.origin = (sum(lat for lat, _ in located.values()) / len(located),
+                           sum(lon for _, lon in located.values()) / len(located))
+        else:
+            self.origin = (0.0, 0.0)
+        self.tree = KDTree(self.project(lat, lon) + (code,) for code, (lat, lon) in located.items())
+
+    def project(self, lat, lon):
+        """(x, y) metres east and north of the origin."""
+        origin_lat, origin_lon = self.origin
+        return ((lon - origin_lon) * METRES_PER_DEGREE * math.cos(math.radians(origin_lat)),
+                (lat - origin_lat) * METRES_PER_DEGREE)
+
+    def nearest_buildings(self, lat, lon):
+        """Yield (metres, building code), nearest first."""
+        yield from self.tree.nearest(*self.project(lat, lon))
+
+    def nearest_free(self, lat, lon, day, start, end, k=10, min_cap=None, max_cap=None, building=None, features=()):
+        """
+        The k rooms nearest to (lat, lon) that are free for all of [start, end) on day.
+
+        Rooms in the same building are ordered by smallest capacity, then id.
+
+        Returns:
+            List of dicts with 'id', 'room' (the record), 'distance' (metres) and 'free_until' (minutes)
+        """
+        start, end = parse_time(start), parse_time(end)
+        candidates = self.index.candidates(min_cap, max_cap, building, features)
+        results = []
+        for distance, code in self.nearest_buildings(lat, lon):
+            if len(results) >= k:
+                break
+            rooms = [self.index.rooms[rid] for rid in self.index.by_building[code] & candidates]
+            rooms.sort(key=lambda room: (room.record.get('capacity') or 0, room.id))
+            for room in rooms:
+                if room.is_free(day, start, end):
+                    results.append({'id': room.id, 'room': room.record, 'distance': round(distance),
+                                    'free_until': room.free_until(day, start)})
+        return results[:k]
+
+
+if __name__ == "__main__":
+    import sys
+
+    from availability import AvailabilityIndex, format_time
+
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    options = {}
+    for arg in sys.argv[1:]:
+        if arg.startswith('--'):
+            name, _, value = arg.partition('=')
+            options.setdefault(name, []).append(value)
+    if len(args) != 5:
+        print(__doc__)
+        sys.exit(1)
+
+    def option(name, cast=str):
+        return cast(options[name][-1]) if options.get(name) and options[name][-1] else None
+
+    nearby = NearbyIndex(AvailabilityIndex.from_file(term=option('--term')))
+    day = args[2].capitalize()
+    results = nearby.nearest_free(float(args[0]), float(args[1]), day, args[3], args[4], k=option('--k', int) or 10,
+                                  min_cap=option('--min-cap', int), max_cap=option('--max-cap', int),
+                                  building=option('--building'), features=options.get('--feature', []))
+    for result in results:
+        room = result['room']
+        print(f"{result['distance']:>5}m  {room['text']:<24} cap {room.get('capacity') or '?':>4}  "
+              f"free until {format_time(result['free_until'])}")
+    if nearby.unlocated:
+        print(f"No coordinates for: {', '.join(nearby.unlocated)}")
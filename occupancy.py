@@ -0,0 +1,246 @@
+"""
+Batch Availability Queries
+
+Answers thousands of (day, start, end) + filter questions at once, for
+planners, timetabling experiments and analytics, without Python loops over
+rooms and events.
+
+The week is cut into SLOT_MINUTES slots (5 minutes: classes start and end on
+that grid; only all-day reservations ending at 11:59 PM do not) and the
+schedules from an AvailabilityIndex are laid out as a rooms x week-slots
+boolean busy matrix. A running sum along each row turns "is anything booked
+in this window" into two lookups, so a batch of Q windows is a (Q x rooms)
+fancy-indexing subtraction. Capacity, building and feature filters are
+evaluated as (Q x rooms) masks as well, and combined with the free matrix
+before reducing to counts or room ids.
+
+A window that does not fall on the slot grid is widened to whole slots, so
+partial slots count as busy.
+
+Requires NumPy (pip install numpy).
+
+Usage:
+    matrix = OccupancyMatrix(AvailabilityIndex.from_file('classrooms.json'))
+    counts = matrix.free_counts([{'day': 'Monday', 'start': '10:00 AM', 'end': '11:00 AM', 'min_cap': 30}, ...])
+
+    matrix.free_together(3, 60, min_cap=20)
+
+    python occupancy.py queries.json     # JSON list of query dicts; prints free counts and room ids
+    python occupancy.py --together=3 --duration=60 [--days=Monday,Tuesday] [--start=10:00AM] [--end=6:00PM]
+                        [--min-cap=20] [--max-cap=60] [--feature=Projector] [--limit=10]
+"""
+
+import numpy as np
+
+from availability import DAY_END, DAY_START, DAYS, parse_time
+from room_keys import canonical_building
+
+SLOT_MINUTES = 5
+MINUTES_PER_DAY = 24 * 60
+
+
+class OccupancyMatrix:
+    """
+    Rooms x week-slots busy matrix plus per-room filter columns.
+
+    Args:
+        index: AvailabilityIndex to lay out (its rooms, term and intervals)
+        slot_minutes: Slot width; must divide a day
+    """
+
+    def __init__(self, index, slot_minutes=SLOT_MINUTES):
+        self.slot_minutes = slot_minutes
+        self.slots_per_day = MINUTES_PER_DAY // slot_minutes
+        self.ids = list(index.rooms)
+        rooms = [index.rooms[rid] for rid in self.ids]
+
+        self.busy = np.zeros((len(rooms), len(DAYS) * self.slots_per_day), dtype=bool)
+        for row, room in enumerate(rooms):
+            for day_number, day in enumerate(DAYS):
+                offset = day_number * self.slots_per_day
+                for start, end in zip(*room.days[day]):
+                    first, last = self.slot_range(start, end)
+                    self.busy[row, offset + first:offset + last] = True
+        # prefix[:, j] = busy slots before slot j, so a window's busy count is prefix[:, e] - prefix[:, s]
+        self.prefix = np.zeros((len(rooms), self.busy.shape[1] + 1), dtype=np.int32)
+        np.cumsum(self.busy, axis=1, out=self.prefix[:, 1:])
+
+        self.capacity = np.array([room.record.get('capacity') or np.nan for room in rooms], dtype=float)
+        buildings = sorted({canonical_building(room.record['building']) for room in rooms})
+        self.building_codes = {building: code for code, building in enumerate(buildings)}
+        self.building = np.array([self.building_codes[canonical_building(room.record['building'])] for room in rooms])
+        features = sorted({feature for room in rooms for feature in room.record.get('characteristics') or []})
+        self.feature_columns = {feature: column for column, feature in enumerate(features)}
+        self.features = np.zeros((len(rooms), len(features)), dtype=bool)
+        for row, room in enumerate(rooms):
+            for feature in room.record.get('characteristics') or []:
+                self.features[row, self.feature_columns[feature]] = True
+
+    def slot_range(self, start, end):
+        """First and one-past-last slot of the day covering [start, end) minutes."""
+        return start // self.slot_minutes, -(-end // self.slot_minutes)
+
+    def _window_slots(self, queries):
+        starts, ends = np.empty(len(queries), dtype=np.int64), np.empty(len(queries), dtype=np.int64)
+        for i, query in enumerate(queries):
+            offset = DAYS.index(query['day'].capitalize()) * self.slots_per_day
+            first, last = self.slot_range(parse_time(query['start']), parse_time(query['end']))
+            starts[i], ends[i] = offset + first, offset + min(last, self.slots_per_day)
+        return starts, ends
+
+    def _filter_mask(self, queries):
+        """(Q x rooms) mask of rooms passing each query's capacity, building and feature filters."""
+        min_cap = np.array([query.get('min_cap') or 0 for query in queries], dtype=float)
+        max_cap = np.array([query.get('max_cap') or np.inf for query in queries], dtype=float)
+        with np.errstate(invalid='ignore'):
+            # Unknown capacity (NaN) fails a minimum but passes a maximum, as in the frontend
+            mask = (self.capacity[None, :] >= min_cap[:, None]) | (min_cap[:, None] == 0)
+            mask &= ~(self.capacity[None, :] > max_cap[:, None])
+
+        # Building and feature masks are computed once per distinct filter value
+        room_masks = {}
+        for i, query in enumerate(queries):
+            building = query.get('building')
+            features = tuple(sorted(query.get('features') or ()))
+            if not building and not features:
+                continue
+            key = (canonical_building(building) if building else None, features)
+            if key not in room_masks:
+                room_mask = np.ones(len(self.ids), dtype=bool)
+                if key[0] is not None:
+                    room_mask &= self.building == self.building_codes.get(key[0], -1)
+                for feature in features:
+                    column = self.feature_columns.get(feature)
+                    room_mask &= self.features[:, column] if column is not None else False
+                room_masks[key] = room_mask
+            mask[i] &= room_masks[key]
+        return mask
+
+    def free_matrix(self, queries):
+        """
+        (Q x rooms) boolean matrix: room j is free for query i's whole window and passes its filters.
+
+        Args:
+            queries: Dicts with 'day', 'start', 'end' and optional 'min_cap', 'max_cap',
+                'building' and 'features' (same meaning as AvailabilityIndex.free_rooms)
+        """
+        starts, ends = self._window_slots(queries)
+        busy_slots = self.prefix[:, ends] - self.prefix[:, starts]
+        return (busy_slots.T == 0) & self._filter_mask(queries)
+
+    def free_counts(self, queries):
+        """Number of matching free rooms per query."""
+        return self.free_matrix(queries).sum(axis=1)
+
+    def free_rooms(self, queries):
+        """Matching free room ids per query, in index order."""
+        ids = np.array(self.ids)
+        return [ids[row].tolist() for row in self.free_matrix(queries)]
+
+    def free_together(self, k, duration, days=DAYS[:5], start=DAY_START, end=DAY_END, min_cap=None, max_cap=None,
+                      features=(), clusters=None, limit=None):
+        """
+        Earliest window in which at least k rooms of one building (or cluster) are free together.
+
+        For each day, the free matrix of every room passing the filters against every
+        slot-aligned window start is one prefix-sum subtraction; a clusters x rooms
+        membership product then counts the free rooms of every cluster at every start.
+        Clusters with fewer than k matching rooms are dropped before any of this.
+
+        Args:
+            k: Rooms needed at the same time
+            duration: Window length in minutes
+            days: Days to search, in order; each cluster reports its earliest window
+            start, end: Earliest start and latest end of the window on each day
+            min_cap, max_cap, features: Filters every room must pass, as in free_matrix
+            clusters: Name -> building codes searched as one group, e.g. {'SOUTH': ['BOELTER', 'MS']};
+                default every building on its own
+            limit: Return at most this many clusters
+
+        Returns:
+            List of dicts with 'cluster', 'day', 'start', 'end' (minutes) and 'rooms' (ids of
+            every matching room free for the window, at least k, smallest capacity first),
+            earliest window first
+        """
+        codes = sorted(self.building_codes, key=self.building_codes.get)
+        clusters = clusters or {code: [code] for code in codes}
+        rows = np.flatnonzero(self._filter_mask([{'min_cap': min_cap, 'max_cap': max_cap, 'features': features}])[0])
+        membership = np.array([np.isin(self.building[rows], [self.building_codes.get(canonical_building(code), -1)
+                                                              for code in buildings])
+                               for buildings in clusters.values()], dtype=np.int32).reshape(len(clusters), len(rows))
+        names = [name for name, size in zip(clusters, membership.sum(axis=1)) if size >= k]
+        membership = membership[membership.sum(axis=1) >= k]
+
+        width = -(-duration // self.slot_minutes)
+        first = -(-parse_time(start) // self.slot_minutes)
+        last = (parse_time(end) - width * self.slot_minutes) // self.slot_minutes
+        capacity = np.nan_to_num(self.capacity[rows])
+        prefix = self.prefix[rows]
+        results = []
+        for day in days:
+            if not names or last < first:
+                break
+            starts = DAYS.index(day.capitalize()) * self.slots_per_day + np.arange(first, last + 1)
+            free = (prefix[:, starts + width] - prefix[:, starts]) == 0
+            enough = (membership @ free) >= k
+            found = enough.any(axis=1)
+            for cluster in np.flatnonzero(found):
+                column = int(enough[cluster].argmax())
+                members = np.flatnonzero(membership[cluster].astype(bool) & free[:, column])
+                members = members[np.argsort(capacity[members], kind='stable')]
+                slot = first + column
+                results.append({'cluster': names[cluster], 'day': day.capitalize(),
+                                'start': slot * self.slot_minutes, 'end': (slot + width) * self.slot_minutes,
+                                'rooms': [self.ids[rows[member]] for member in members]})
+            names = [name for name, done in zip(names, found) if not done]
+            membership = membership[~found]
+        results.sort(key=lambda result: (DAYS.index(result['day']), result['start'], result['cluster']))
+        return results[:limit]
+
+
+if __name__ == "__main__":
+    import json
+    import sys
+    import time
+
+    from availability import AvailabilityIndex, format_time
+
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    options = {}
+    for arg in sys.argv[1:]:
+        if arg.startswith('--'):
+            name, _, value = arg.partition('=')
+            options.setdefault(name, []).append(value)
+    if len(args) != 1 and not options.get('--together'):
+        print(__doc__)
+        sys.exit(1)
+
+    def option(name, default=None):
+        return options[name][-1] if options.get(name) and options[name][-1] else default
+
+    started = time.perf_counter()
+    matrix = OccupancyMatrix(AvailabilityIndex.from_file('classrooms.json'))
+    built = time.perf_counter()
+
+    if options.get('--together'):
+        results = matrix.free_together(int(option('--together')), int(option('--duration', 60)),
+                                       days=option('--days', ','.join(DAYS[:5])).split(','),
+                                       start=option('--start', DAY_START), end=option('--end', DAY_END),
+                                       min_cap=int(option('--min-cap', 0)) or None,
+                                       max_cap=int(option('--max-cap', 0)) or None,
+                                       features=options.get('--feature', []), limit=int(option('--limit', 10)))
+        finished = time.perf_counter()
+        for result in results:
+            print(f"{result['cluster']:<10} {result['day']:<9} {format_time(result['start'])}-{format_time(result['end'])}"
+                  f"  {len(result['rooms'])} rooms: {', '.join(result['rooms'])}")
+        print(f"{len(results)} buildings in {(finished - built) * 1000:.1f}ms", file=sys.stderr)
+        sys.exit(0)
+
+    with open(args[0], 'r') as f:
+        queries = json.load(f)
+    results = matrix.free_rooms(queries)
+    finished = time.perf_counter()
+    for query, rooms in zip(queries, results):
+        print(json.dumps({'query': query, 'count': len(rooms), 'rooms': rooms}))
+    print(f"{len(matrix.ids)} rooms x {matrix.busy.shape[1]} slots built in {(built - started) * 1000:.0f}ms | "
+          f"{len(queries)} queries in {(finished - built) * 1000:.1f}ms", file=sys.stderr)
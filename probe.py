@@ -0,0 +1,113 @@
+"""
+Classroom Page Pre-Probe
+
+A cheap first pass over ClassroomDetail pages: one plain HTTP GET per room (no
+browser, no waits) and a regex over the inline createFullCalendar payload.
+Rooms come back as one of:
+
+    empty       - the calendar payload is an empty list; the room has no classes
+    has_events  - the payload contains events
+    unknown     - the request failed or the payload was not found
+
+scrape.py only launches Chrome for has_events and unknown rooms, which makes
+scraping the whole catalog (including rooms that are not offered) affordable.
+
+Usage:
+    python probe.py [LIMIT] [--all] [--workers=8]
+"""
+
+import html
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from http_pool import PooledHTTP
+
+EMPTY = 'empty'
+HAS_EVENTS = 'has_events'
+UNKNOWN = 'unknown'
+
+CALENDAR_RE = re.compile(r"createFullCalendar\(\$\.parseJSON\('(.*?)'\)\)", re.DOTALL)
+EMPTY_PAYLOAD_RE = re.compile(r'^\s*\[\s*\]\s*$')
+CHARACTERISTICS_RE = re.compile(r'<ul[^>]*id="characteristics-list"[^>]*>(.*?)</ul>', re.DOTALL | re.IGNORECASE)
+LIST_ITEM_RE = re.compile(r'<li[^>]*>(.*?)</li>', re.DOTALL | re.IGNORECASE)
+TAG_RE = re.compile(r'<[^>]+>')
+
+
+def classify_page(page):
+    """Classify a page's calendar payload as EMPTY, HAS_EVENTS or UNKNOWN."""
+    match = CALENDAR_RE.search(page)
+    if not match:
+        return UNKNOWN
+    return EMPTY if EMPTY_PAYLOAD_RE.match(match.group(1)) else HAS_EVENTS
+
+
+def extract_characteristics(page):
+    """Room characteristics from the static page (the same list scrape.py reads), or None."""
+    match = CHARACTERISTICS_RE.search(page)
+    if not match:
+        return None
+    characteristics = []
+    for item in LIST_ITEM_RE.findall(match.group(1)):
+        text = html.unescape(TAG_RE.sub('', item)).strip()
+        if text:
+            characteristics.append(text)
+    return characteristics
+
+
+def probe_classroom(url, client, limiter=None):
+    """
+    Probe one room. Returns (status, characteristics, bytes_fetched, seconds).
+    characteristics is only filled in for EMPTY rooms, which skip the browser.
+    """
+    started = time.perf_counter()
+    if limiter:
+        limiter.acquire()
+    request_started = time.monotonic()
+    try:
+        response = client.get(url)
+    except Exception:
+        if limiter:
+            limiter.report(time.monotonic() - request_started, ok=False)
+        return (UNKNOWN, None, 0, time.perf_counter() - started)
+    if limiter:
+        limiter.report(time.monotonic() - request_started, ok=response.status == 200)
+
+    if response.status != 200:
+        return (UNKNOWN, None, len(response.body), time.perf_counter() - started)
+
+    page = response.body.decode('utf-8', errors='replace')
+    status = classify_page(page)
+    characteristics = extract_characteristics(page) if status == EMPTY else None
+    return (status, characteristics, len(response.body), time.perf_counter() - started)
+
+
+def probe_classrooms(urls, workers=8, limiter=None, timeout=15):
+    """Probe many rooms concurrently over pooled keep-alive connections. Results follow the order of urls."""
+    client = PooledHTTP(timeout=timeout)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda url: probe_classroom(url, client, limiter), urls))
+
+
+if __name__ == "__main__":
+    import json
+    import sys
+
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    options = dict(arg.partition('=')[::2] for arg in sys.argv[1:] if arg.startswith('--'))
+
+    with open('classrooms.json', 'r') as f:
+        classrooms = json.load(f)
+    if '--all' not in options:
+        classrooms = [c for c in classrooms if c.get('offered', False)]
+    if args:
+        classrooms = classrooms[:int(args[0])]
+
+    started = time.perf_counter()
+    results = probe_classrooms([c['url'] for c in classrooms], workers=int(options.get('--workers') or 8))
+    counts = {EMPTY: 0, HAS_EVENTS: 0, UNKNOWN: 0}
+    for classroom, (status, _, _, seconds) in zip(classrooms, results):
+        counts[status] += 1
+        print(f"{classroom['text']}: {status} ({seconds:.2f}s)")
+    print(f"Probed {len(classrooms)} rooms in {time.perf_counter() - started:.1f}s | "
+          f"Empty: {counts[EMPTY]} | Has events: {counts[HAS_EVENTS]} | Unknown: {counts[UNKNOWN]}")
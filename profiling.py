@@ -0,0 +1,246 @@
+"""
+Profiling Hooks for Scraper Workers
+
+cProfile at the top level of scrape.py never sees the work done inside Pool
+workers, so each worker profiles its own tasks and dumps the results into a
+shared directory. After the run the parent merges every dump into combined
+outputs:
+
+    combined.prof          - merged pstats (cProfile mode)
+    combined.txt           - top functions by cumulative and internal time
+    combined.collapsed     - collapsed stacks for flamegraph.pl / speedscope
+    tracemalloc_top.txt    - top allocation sites summed over workers
+
+Modes:
+    cprofile  - deterministic profiling with cProfile
+    sample    - a background thread samples the worker's main thread stack
+
+Usage from scrape.py:
+    Pool(..., initializer=init_worker, initargs=(make_config('sample'),))
+    result = run_profiled(func, args, label)
+    merge_profiles(config)
+"""
+
+import cProfile
+import glob
+import json
+import os
+import pickle
+import pstats
+import shutil
+import sys
+import threading
+import tracemalloc
+
+PROFILE_DIR = 'profile_output'
+PROFILE_MODES = ('cprofile', 'sample')
+SAMPLE_INTERVAL = 0.005
+TRACEMALLOC_FRAMES = 25
+MAX_STACK_DEPTH = 64
+
+# Set in each worker by init_worker; None means profiling is off
+_config = None
+
+
+def make_config(mode=None, trace_malloc=False, output_dir=PROFILE_DIR, interval=SAMPLE_INTERVAL):
+    """Build the picklable profiling config passed to every worker (None if profiling is off)."""
+    if mode is None and not trace_malloc:
+        return None
+    if mode is not None and mode not in PROFILE_MODES:
+        raise ValueError(f"Unknown profile mode: {mode} (expected one of {', '.join(PROFILE_MODES)})")
+    return {'mode': mode, 'tracemalloc': trace_malloc, 'dir': output_dir, 'interval': interval}
+
+
+def prepare_output_dir(config):
+    """Remove dumps left over from a previous run."""
+    if config:
+        shutil.rmtree(config['dir'], ignore_errors=True)
+        os.makedirs(config['dir'], exist_ok=True)
+
+
+def init_worker(config):
+    """Pool initializer: enable profiling for every task run in this process."""
+    global _config
+    _config = config
+    if config and config['tracemalloc'] and not tracemalloc.is_tracing():
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+
+
+def _frame_label(filename, lineno, name):
+    return f"{name} ({os.path.basename(filename)}:{lineno})"
+
+
+class _StackSampler(threading.Thread):
+    """Samples the stack of one thread at a fixed interval into collapsed-stack counts."""
+
+    def __init__(self, thread_id, interval):
+        super().__init__(daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.counts = {}
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None and len(stack) < MAX_STACK_DEPTH:
+                code = frame.f_code
+                stack.append(_frame_label(code.co_filename, code.co_firstlineno, code.co_name))
+                frame = frame.f_back
+            if stack:
+                key = ';'.join(reversed(stack))
+                self.counts[key] = self.counts.get(key, 0) + 1
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+
+def run_profiled(func, args, label):
+    """
+    Call func(args), profiling it according to the worker's config.
+
+    The result is pickled once inside the profiled region so the cost of
+    sending it back to the parent (IPC serialization) shows up in the output.
+    """
+    if not _config:
+        return func(args)
+
+    mode = _config['mode']
+    prefix = os.path.join(_config['dir'], f"{os.getpid()}-{label}")
+    profiler = None
+    sampler = None
+
+    if mode == 'cprofile':
+        profiler = cProfile.Profile()
+        profiler.enable()
+    elif mode == 'sample':
+        sampler = _StackSampler(threading.get_ident(), _config['interval'])
+        sampler.start()
+
+    try:
+        result = func(args)
+        pickle.dumps(result)
+        return result
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(prefix + '.prof')
+        if sampler is not None:
+            sampler.stop()
+            with open(prefix + '.samples.json', 'w') as f:
+                json.dump(sampler.counts, f)
+        if _config['tracemalloc']:
+            # Snapshots are cumulative for the process, so keep only the latest per worker
+            tracemalloc.take_snapshot().dump(os.path.join(_config['dir'], f"{os.getpid()}.tracemalloc"))
+
+
+def _collapse_pstats(stats):
+    """
+    Turn pstats call-graph data into collapsed stacks.
+
+    cProfile only records caller -> callee edges, so time is attributed down
+    each path in proportion to the edge's share of the callee's cumulative time.
+    """
+    children = {}
+    for func, (_, _, _, _, callers) in stats.items():
+        for caller, (_, _, _, edge_ct) in callers.items():
+            children.setdefault(caller, []).append((func, edge_ct))
+
+    roots = [func for func, (_, _, _, _, callers) in stats.items() if not callers]
+    collapsed = {}
+
+    def walk(func, stack, scale):
+        if len(stack) >= MAX_STACK_DEPTH:
+            return
+        filename, lineno, name = func
+        stack = stack + [_frame_label(filename, lineno, name)]
+        own = stats[func][2] * scale
+        if own > 0:
+            key = ';'.join(stack)
+            collapsed[key] = collapsed.get(key, 0) + own
+        for child, edge_ct in children.get(func, []):
+            if child not in stats or stats[child][3] <= 0 or _frame_label(*child) in stack:
+                continue
+            walk(child, stack, scale * edge_ct / stats[child][3])
+
+    for root in roots:
+        walk(root, [], 1.0)
+
+    # Weights are reported in microseconds
+    return {stack: int(seconds * 1e6) for stack, seconds in collapsed.items() if seconds * 1e6 >= 1}
+
+
+def _write_collapsed(path, counts):
+    with open(path, 'w') as f:
+        for stack, count in sorted(counts.items(), key=lambda item: item[1], reverse=True):
+            f.write(f"{stack} {count}\n")
+
+
+def _merge_tracemalloc(paths, output_path, limit=30):
+    totals = {}
+    for path in paths:
+        snapshot = tracemalloc.Snapshot.load(path).filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ])
+        for stat in snapshot.statistics('lineno'):
+            frame = stat.traceback[0]
+            key = f"{frame.filename}:{frame.lineno}"
+            size, count = totals.get(key, (0, 0))
+            totals[key] = (size + stat.size, count + stat.count)
+
+    with open(output_path, 'w') as f:
+        f.write(f"Top {limit} allocation sites across {len(paths)} workers\n")
+        for key, (size, count) in sorted(totals.items(), key=lambda item: item[1][0], reverse=True)[:limit]:
+            f.write(f"{size / 1024:10.1f} KiB {count:8d} blocks  {key}\n")
+
+
+def merge_profiles(config, top=40):
+    """Merge every worker dump in config['dir'] into the combined outputs. Returns written paths."""
+    if not config:
+        return []
+
+    out_dir = config['dir']
+    written = []
+
+    prof_files = sorted(glob.glob(os.path.join(out_dir, '*-*.prof')))
+    if prof_files:
+        stats = pstats.Stats(prof_files[0])
+        for path in prof_files[1:]:
+            stats.add(path)
+        combined = os.path.join(out_dir, 'combined.prof')
+        stats.dump_stats(combined)
+        written.append(combined)
+
+        report = os.path.join(out_dir, 'combined.txt')
+        with open(report, 'w') as f:
+            merged = pstats.Stats(combined, stream=f)
+            f.write(f"Merged {len(prof_files)} task profiles\n\n")
+            merged.sort_stats('cumulative').print_stats(top)
+            merged.sort_stats('tottime').print_stats(top)
+        written.append(report)
+
+        collapsed = os.path.join(out_dir, 'combined.collapsed')
+        _write_collapsed(collapsed, _collapse_pstats(stats.stats))
+        written.append(collapsed)
+
+    sample_files = sorted(glob.glob(os.path.join(out_dir, '*.samples.json')))
+    if sample_files:
+        counts = {}
+        for path in sample_files:
+            with open(path) as f:
+                for stack, count in json.load(f).items():
+                    counts[stack] = counts.get(stack, 0) + count
+        collapsed = os.path.join(out_dir, 'combined.collapsed')
+        _write_collapsed(collapsed, counts)
+        written.append(collapsed)
+
+    snapshot_files = sorted(glob.glob(os.path.join(out_dir, '*.tracemalloc')))
+    if snapshot_files:
+        report = os.path.join(out_dir, 'tracemalloc_top.txt')
+        _merge_tracemalloc(snapshot_files, report)
+        written.append(report)
+
+    return written
@@ -0,0 +1,100 @@
+"""
+Per-Slot Availability Files
+
+Precomputes the answer to "what is free on DAY at TIME" for every day and
+time slot as small static files, so static hosting or a CDN can serve the most
+common query without any computation and without sending classrooms.json:
+
+    slots/rooms.json           [{'id', 'text', 'building', 'capacity', 'type'}, ...]
+                               sorted by capacity (rooms without one first)
+    slots/Monday/1000.json     {'day', 'start', 'end', 'rooms': VERSION, 'free': [3, 7, 12, ...]}
+
+'free' holds positions in rooms.json of the rooms free for the whole slot, so
+each slot file is a few hundred bytes and already sorted by capacity. 'rooms'
+is a hash of rooms.json; a client holding a rooms.json with another hash must
+fetch it again before using the positions.
+
+Files whose content did not change are not rewritten, which keeps their
+timestamps (and CDN caches) intact between runs.
+
+Usage:
+    python publish_slots.py [--slot=30] [--out=slots] [--term=26W]
+"""
+
+import hashlib
+import json
+import os
+
+from availability import DAY_END, DAY_START, DAYS, AvailabilityIndex, format_time
+
+OUTPUT_DIR = 'slots'
+SLOT_MINUTES = 30
+
+
+def encode(data):
+    return json.dumps(data, separators=(',', ':')).encode()
+
+
+def write_if_changed(path, data):
+    """Write compact JSON to path unless the file already holds exactly that; returns True if written."""
+    content = encode(data)
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == content:
+                return False
+    except FileNotFoundError:
+        pass
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path + '.tmp', 'wb') as f:
+        f.write(content)
+    os.replace(path + '.tmp', path)
+    return True
+
+
+def publish_slots(index, out_dir=OUTPUT_DIR, slot_minutes=SLOT_MINUTES):
+    """
+    Write rooms.json and one file per (day, slot) between DAY_START and DAY_END.
+
+    Returns:
+        (files written, files unchanged, total bytes of the slot files)
+    """
+    rooms = sorted(index.rooms.values(), key=lambda room: (room.record.get('capacity') or 0, room.id))
+    written = unchanged = total_bytes = 0
+
+    listing = [{'id': room.id, 'text': room.record['text'], 'building': room.record['building'],
+                'capacity': room.record.get('capacity'), 'type': room.record.get('type')} for room in rooms]
+    version = hashlib.sha1(encode(listing)).hexdigest()[:12]
+    if write_if_changed(os.path.join(out_dir, 'rooms.json'), listing):
+        written += 1
+    else:
+        unchanged += 1
+
+    for day in DAYS:
+        for start in range(DAY_START, DAY_END, slot_minutes):
+            end = min(start + slot_minutes, DAY_END)
+            free = [position for position, room in enumerate(rooms) if room.is_free(day, start, end)]
+            path = os.path.join(out_dir, day, f"{start // 60:02d}{start % 60:02d}.json")
+            slot = {'day': day, 'start': format_time(start), 'end': format_time(end), 'rooms': version, 'free': free}
+            if write_if_changed(path, slot):
+                written += 1
+            else:
+                unchanged += 1
+            total_bytes += os.path.getsize(path)
+    return written, unchanged, total_bytes
+
+
+def main(slot_minutes=SLOT_MINUTES, out_dir=OUTPUT_DIR, term=None):
+    index = AvailabilityIndex.from_file('classrooms.json', term=term)
+    written, unchanged, total_bytes = publish_slots(index, out_dir, slot_minutes)
+    slots = written + unchanged - 1
+    print(f"{len(index.rooms)} rooms | {slots} slot files of {slot_minutes} minutes "
+          f"(avg {total_bytes / max(slots, 1):.0f} bytes) | Written: {written} | Unchanged: {unchanged}")
+
+
+if __name__ == "__main__":
+    import sys
+
+    options = dict(arg.partition('=')[::2] for arg in sys.argv[1:] if arg.startswith('--'))
+    main(slot_minutes=int(options.get('--slot') or SLOT_MINUTES),
+         out_dir=options.get('--out') or OUTPUT_DIR,
+         term=options.get('--term') or None)
@@ -0,0 +1,99 @@
+"""
+Adaptive Cross-Process Rate Limiter
+
+A token bucket kept in shared memory so every scraper worker draws from the
+same request budget. The refill rate adapts with AIMD (additive increase,
+multiplicative decrease): each fast, successful page load nudges the rate up,
+and a slow response or an error cuts it by a constant factor. The scraper runs
+as fast as the registrar comfortably allows and backs off when it slows down.
+
+The limiter must be created in the parent process and handed to workers via the
+Pool initializer (shared-memory objects cannot be pickled into task arguments).
+"""
+
+import multiprocessing
+import time
+
+# Indices into the shared state array
+_TOKENS, _LAST_REFILL, _RATE, _LAST_DECREASE, _INCREASES, _DECREASES = range(6)
+
+
+class AdaptiveRateLimiter:
+    """
+    Shared token bucket with AIMD rate control.
+
+    Args:
+        initial_rate: Starting request rate in requests per second
+        min_rate: Floor the rate never drops below
+        max_rate: Ceiling the rate never grows above
+        burst: Bucket size (requests that may be issued back to back)
+        target_latency: Page loads slower than this (seconds) count as congestion
+        increase: Requests per second added after each fast, successful response
+        decrease: Factor applied to the rate on congestion or error
+        cooldown: Minimum seconds between two decreases, so one slow burst
+            observed by several workers only backs off once
+    """
+
+    def __init__(self, initial_rate=1.0, min_rate=0.1, max_rate=8.0, burst=2.0,
+                 target_latency=4.0, increase=0.05, decrease=0.5, cooldown=None):
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.target_latency = target_latency
+        self.increase = increase
+        self.decrease = decrease
+        self.cooldown = target_latency if cooldown is None else cooldown
+
+        now = time.monotonic()
+        initial_rate = min(max(initial_rate, min_rate), max_rate)
+        self._lock = multiprocessing.Lock()
+        self._state = multiprocessing.Array('d', [burst, now, initial_rate, 0.0, 0.0, 0.0], lock=False)
+
+    def _refill(self, now):
+        state = self._state
+        elapsed = max(0.0, now - state[_LAST_REFILL])
+        state[_TOKENS] = min(self.burst, state[_TOKENS] + elapsed * state[_RATE])
+        state[_LAST_REFILL] = now
+
+    def acquire(self):
+        """Block until a request token is available. Returns the seconds spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._state[_TOKENS] >= 1.0:
+                    self._state[_TOKENS] -= 1.0
+                    return waited
+                wait = (1.0 - self._state[_TOKENS]) / self._state[_RATE]
+            time.sleep(wait)
+            waited += wait
+
+    def report(self, latency, ok=True):
+        """Feed back one observed response and adjust the shared rate."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            state = self._state
+            if not ok or latency > self.target_latency:
+                if now - state[_LAST_DECREASE] >= self.cooldown:
+                    state[_RATE] = max(self.min_rate, state[_RATE] * self.decrease)
+                    state[_LAST_DECREASE] = now
+                    state[_DECREASES] += 1
+            else:
+                state[_RATE] = min(self.max_rate, state[_RATE] + self.increase)
+                state[_INCREASES] += 1
+
+    @property
+    def rate(self):
+        with self._lock:
+            return self._state[_RATE]
+
+    def snapshot(self):
+        """Current limiter state for reporting."""
+        with self._lock:
+            return {
+                'rate': self._state[_RATE],
+                'increases': int(self._state[_INCREASES]),
+                'decreases': int(self._state[_DECREASES]),
+            }
@@ -0,0 +1,130 @@
+"""
+Canonical Room Keys
+
+One place to turn the many spellings of a room into a single join key:
+
+    registrar codes      BOELTER | 02444, WGYOUNG | CS00024
+    full building names  Boelter Hall 2444, Young Hall CS24
+    DTS image names      Boelter 2444, WG Young CS 24
+
+Every spelling maps to the key 'BOELTER|2444' (registrar building code, room
+number without padding). generate_urls, add_images and soc_listings all join
+through these keys, and new datasets only need their spellings added to
+data/buildings.json.
+
+Usage:
+    index = RoomIndex(classrooms)
+    classroom = index.find_name('WG Young CS 24')
+"""
+
+import re
+from functools import lru_cache
+
+import catalog
+
+ALPHA_PREFIX_RE = re.compile(r'^([A-Z]+)0*(\d+\w*)$')
+NON_ALNUM_RE = re.compile(r'[^A-Z0-9]+')
+
+
+def alias_form(name):
+    """Upper-case a building name, spell out '&' and collapse punctuation and spaces."""
+    return NON_ALNUM_RE.sub(' ', name.upper().replace('&', ' AND ')).strip()
+
+
+@lru_cache(maxsize=None)
+def building_aliases():
+    """Registrar building code -> other names used for the building (data/buildings.json)."""
+    return {code: [info['name']] + info['aliases'] for code, info in catalog.buildings().items()}
+
+
+@lru_cache(maxsize=None)
+def _alias_table():
+    """Alias form of every known spelling -> building code, and those forms longest first."""
+    table = {}
+    for code, names in building_aliases().items():
+        for name in [code] + names:
+            table[alias_form(name)] = code
+    # Longest aliases first so 'WG YOUNG' wins over 'YOUNG' when splitting names
+    return table, sorted(table, key=len, reverse=True)
+
+
+@lru_cache(maxsize=None)
+def normalize_room_number(room):
+    """Normalize room number by removing leading zeros and trailing spaces for comparison."""
+    # Remove trailing spaces
+    room = room.strip()
+
+    # Handle different room number formats:
+    # Numeric only: "02444" -> "2444"
+    # Alpha prefix with numbers: "A00002" -> "A2", "CS00024" -> "CS24"
+    # Mixed: "2100A" -> "2100A" (no change needed)
+
+    # Check if it starts with letters followed by numbers
+    match = ALPHA_PREFIX_RE.match(room)
+    if match:
+        # Alpha prefix case: remove leading zeros from the numeric part
+        prefix, number = match.groups()
+        return f"{prefix}{number}"
+    elif room and not room[0].isalpha():
+        # Pure numeric case: remove leading zeros
+        room = room.lstrip('0') or '0'
+
+    return room
+
+
+@lru_cache(maxsize=None)
+def canonical_building(name):
+    """Building code for any known spelling; unknown names are returned in alias form."""
+    form = alias_form(name)
+    return _alias_table()[0].get(form, form)
+
+
+@lru_cache(maxsize=None)
+def room_key(building, room):
+    """Canonical 'BUILDING|room' key for a building (any spelling) and a room number."""
+    return f"{canonical_building(building)}|{normalize_room_number(room.replace(' ', '').upper())}"
+
+
+@lru_cache(maxsize=None)
+def parse_room_name(text):
+    """
+    Canonical key for a combined 'building room' string such as 'Boelter Hall 2444',
+    'BOELTER  2444' or 'WG Young CS 24'. Returns None if no room number is left.
+    """
+    form = alias_form(text)
+    table, aliases_by_length = _alias_table()
+    for alias in aliases_by_length:
+        if form.startswith(alias + ' '):
+            return room_key(table[alias], form[len(alias):])
+    # Unknown building: everything before the last token is the building
+    building, _, room = form.rpartition(' ')
+    return room_key(building, room) if building else None
+
+
+@lru_cache(maxsize=None)
+def room_id(building, room):
+    """URL-safe form of room_key, e.g. 'boelter-2444' or 'knsy-pv-1200b'."""
+    return NON_ALNUM_RE.sub('-', room_key(building, room)).strip('-').lower()
+
+
+class RoomIndex:
+    """Canonical key -> classroom record, built once for all joins against a classroom list."""
+
+    def __init__(self, classrooms):
+        self.by_key = {}
+        for classroom in classrooms:
+            if classroom.get('building') and classroom.get('room'):
+                self.by_key.setdefault(room_key(classroom['building'], classroom['room']), classroom)
+
+    def __len__(self):
+        return len(self.by_key)
+
+    def find(self, building, room):
+        return self.by_key.get(room_key(building, room))
+
+    def find_name(self, text):
+        key = parse_room_name(text)
+        return self.by_key.get(key) if key else None
+
+    def find_key(self, key):
+        return self.by_key.get(key)
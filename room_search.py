@@ -0,0 +1,154 @@
+"""
+Room Text Search
+
+Fuzzy, ranked search over room names that understands the spellings
+room_keys does: 'Boelter 2444', 'BOELTER  02444' and 'boelter hall 2444' all
+find the same room, and 'young cs24' finds WGYOUNG CS00024.
+
+Every room is indexed under each of its names: the registrar text, the
+building code and every alias from data/buildings.json, each followed by the
+normalized room number. Names and queries are reduced to search form
+(room_keys.alias_form, then room_keys.normalize_room_number on every token
+with a digit) and split into word trigrams, each word padded as '  word '.
+A query scores each name by the Dice coefficient of their trigram sets,
+accumulated from the postings of the query's trigrams only; a room's score is
+its best name's.
+
+search_index.json carries the same index for the frontend:
+
+    {'rooms': [room text], 'names': [room position per name], 'sizes': [trigrams per name],
+     'trigrams': {trigram: [name positions]}, 'min_score': MIN_SCORE}
+
+Usage:
+    search = RoomSearch(classrooms)
+    search.search('young cs 24', limit=5)
+
+    python room_search.py "boelter 2444" [--limit=10]
+    python room_search.py --publish [--out=search_index.json]
+"""
+
+import json
+import re
+
+from publish_slots import write_if_changed
+from room_keys import alias_form, building_aliases, canonical_building, normalize_room_number, room_id
+
+INDEX_FILE = 'search_index.json'
+# Names scoring below this are not matches; about half a short word in common
+MIN_SCORE = 0.3
+DIGIT_RE = re.compile(r'\d')
+
+
+def search_form(text):
+    """'Boelter Hall 02444' -> 'BOELTER HALL 2444'."""
+    return ' '.join(normalize_room_number(token) if DIGIT_RE.search(token) else token
+                    for token in alias_form(text).split())
+
+
+def trigrams(text):
+    """Set of word trigrams of text's search form."""
+    grams = set()
+    for word in search_form(text).split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def room_names(record):
+    """Every name a room is searchable by, in search form and without duplicates."""
+    building = canonical_building(record['building'])
+    number = normalize_room_number(record['room'].replace(' ', '').upper())
+    names = [record['text']] + [f"{name} {number}" for name in [building] + building_aliases().get(building, [])]
+    return list(dict.fromkeys(search_form(name) for name in names))
+
+
+class RoomSearch:
+    """
+    Trigram index over the names of a list of room records.
+
+    Args:
+        classrooms: Records as stored in classrooms.json
+        offered_only: Skip rooms that are not offered, as the frontend does
+    """
+
+    def __init__(self, classrooms, offered_only=True):
+        self.rooms = [record for record in classrooms
+                      if record.get('building') and (record.get('offered') or not offered_only)]
+        self.names = []
+        self.sizes = []
+        self.postings = {}
+        for position, record in enumerate(self.rooms):
+            for name in room_names(record):
+                grams = trigrams(name)
+                for gram in grams:
+                    self.postings.setdefault(gram, []).append(len(self.names))
+                self.names.append(position)
+                self.sizes.append(len(grams))
+
+    @classmethod
+    def from_file(cls, path='classrooms.json', **kwargs):
+        with open(path, 'r') as f:
+            return cls(json.load(f), **kwargs)
+
+    def search(self, query, limit=10, min_score=MIN_SCORE):
+        """
+        Rooms matching query, best first (ties by room text). Rooms whose text
+        contains the query but score below min_score are listed last, with score 0.
+
+        Returns:
+            List of dicts with 'id', 'text', 'score' (0-1) and 'room' (the record)
+        """
+        grams = trigrams(query)
+        shared = {}
+        for gram in grams:
+            for name in self.postings.get(gram, ()):
+                shared[name] = shared.get(name, 0) + 1
+        best = {}
+        for name, count in shared.items():
+            score = 2 * count / (len(grams) + self.sizes[name])
+            position = self.names[name]
+            if score >= min_score and score > best.get(position, 0):
+                best[position] = score
+        # Rooms whose text contains the query as typed match too, after every scored room:
+        # a query of one or two characters has too few trigrams to reach min_score
+        needle = query.strip().lower()
+        if needle:
+            for position, record in enumerate(self.rooms):
+                if position not in best and needle in record['text'].lower():
+                    best[position] = 0
+        ranked = sorted(best.items(), key=lambda item: (-item[1], self.rooms[item[0]]['text']))
+        return [{'id': room_id(self.rooms[position]['building'], self.rooms[position]['room']),
+                 'text': self.rooms[position]['text'], 'score': round(score, 3), 'room': self.rooms[position]}
+                for position, score in ranked[:limit]]
+
+    def to_json(self):
+        """The index in the form published as search_index.json."""
+        return {'rooms': [record['text'] for record in self.rooms], 'names': self.names, 'sizes': self.sizes,
+                'trigrams': dict(sorted(self.postings.items())), 'min_score': MIN_SCORE}
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    options = dict(arg.partition('=')[::2] for arg in sys.argv[1:] if arg.startswith('--'))
+    if not args and '--publish' not in options:
+        print(__doc__)
+        sys.exit(1)
+
+    search = RoomSearch.from_file()
+    if '--publish' in options:
+        path = options.get('--out') or INDEX_FILE
+        written = write_if_changed(path, search.to_json())
+        print(f"{len(search.rooms)} rooms | {len(search.names)} names | {len(search.postings)} trigrams | "
+              f"{path} {'written' if written else 'unchanged'}")
+        sys.exit(0)
+
+    query = ' '.join(args)
+    started = time.perf_counter()
+    results = search.search(query, limit=int(options.get('--limit') or 10))
+    elapsed = time.perf_counter() - started
+    for result in results:
+        print(f"{result['score']:.3f}  {result['text']:<24} {result['id']}")
+    print(f"{len(results)} matches for {query!r} in {elapsed * 1000:.2f}ms")
@@ -7,35 +7,156 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 import time
-from multiprocessing import Pool
+import queue
+from multiprocessing import Pool, Process, Queue
+from multiprocessing.util import Finalize
 from datetime import datetime
+from metrics import RunMetrics, new_room_record, timed, worker_rss_bytes
+import profiling
+from profiling import make_config, merge_profiles, prepare_output_dir, run_profiled
+from rate_limit import AdaptiveRateLimiter
+from generate_urls import DEFAULT_TERM, term_url
+from probe import EMPTY, HAS_EVENTS, UNKNOWN, probe_classrooms
+from availability import store_term_result
 
-def scrape_classroom_schedule(url, driver):
+# Extra attempts for a room whose page fails to load or parse
+MAX_RETRIES = 1
+
+DAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+REPORT_JSON = 'scrape_report.json'
+REPORT_PROM = 'scrape_metrics.prom'
+
+# Shared request budget for all workers; set in each worker by init_worker
+rate_limiter = None
+
+# This pool worker's Chrome instance, reused by every job it runs (see worker_driver)
+pool_driver = None
+pool_driver_started = None
+
+
+def init_worker(profile_config, limiter):
+    """Pool initializer: install the profiling config and the shared rate limiter."""
+    global rate_limiter
+    rate_limiter = limiter
+    profiling.init_worker(profile_config)
+
+
+def make_driver():
+    """Launch a headless Chrome instance configured for scraping."""
+    chrome_options = Options()
+    chrome_options.add_argument('--headless')
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--window-size=1920,1080')
+    chrome_options.add_argument('--disable-logging')
+    chrome_options.add_argument('--log-level=3')
+    return webdriver.Chrome(options=chrome_options)
+
+
+def worker_driver(record):
     """
-    Scrape the classroom schedule from a UCLA classroom detail page using Selenium.
-    Returns a dictionary with the schedule organized by day of week.
+    This pool worker's Chrome instance, started on its first job and reused for every
+    later one, whatever room or term it is for. It is quit when the worker exits.
     """
-    try:
-        driver.get(url)
-        
+    global pool_driver, pool_driver_started
+    if pool_driver is None:
+        with timed(record, 'driver_start'):
+            pool_driver = make_driver()
+        pool_driver_started = time.perf_counter()
+        Finalize(None, quit_worker_driver, exitpriority=10)
+    return pool_driver
+
+
+def quit_worker_driver():
+    """Quit this pool worker's Chrome instance, if it has one; the next job starts a fresh one."""
+    global pool_driver, pool_driver_started
+    if pool_driver is not None:
         try:
-            WebDriverWait(driver, 6).until(EC.presence_of_element_located((By.ID, "classroomDetails")))
-        except:
+            pool_driver.quit()
+        except Exception:
             pass
+    pool_driver = pool_driver_started = None
+
+
+def fetch_classroom_page(url, driver, record=None):
+    """
+    Load a UCLA classroom detail page in the browser and wait for the calendar to render.
+    Returns the rendered page source, or None if the page could not be loaded.
+    """
+    try:
+        with timed(record, 'navigate'):
+            driver.get(url)
         
-        time.sleep(2)
+        with timed(record, 'wait_details'):
+            try:
+                WebDriverWait(driver, 6).until(EC.presence_of_element_located((By.ID, "classroomDetails")))
+            except:
+                pass
         
-        try:
-            WebDriverWait(driver, 4).until(lambda driver: len(driver.find_elements(By.CSS_SELECTOR, ".fc-event, [class*='fc-event']")) > 0)
-        except:
-            pass
+        with timed(record, 'settle'):
+            time.sleep(2)
+        
+        with timed(record, 'wait_events'):
+            try:
+                WebDriverWait(driver, 4).until(lambda driver: len(driver.find_elements(By.CSS_SELECTOR, ".fc-event, [class*='fc-event']")) > 0)
+            except:
+                pass
         
         page_source = driver.page_source
+        if record is not None:
+            record['bytes'] += len(page_source.encode('utf-8'))
+        return page_source
+        
+    except Exception:
+        return None
+
+
+def fetch_with_retries(url, driver, record):
+    """Fetch a page through the shared rate limiter, retrying failed loads up to MAX_RETRIES times."""
+    page_source = None
+    for attempt in range(MAX_RETRIES + 1):
+        if attempt > 0:
+            record['retries'] += 1
+        if rate_limiter:
+            with timed(record, 'throttle'):
+                rate_limiter.acquire()
+        navigate_before = record['phases']['navigate']
+        page_source = fetch_classroom_page(url, driver, record)
+        if rate_limiter:
+            rate_limiter.report(record['phases']['navigate'] - navigate_before, ok=page_source is not None)
+        if page_source is not None:
+            break
+    return page_source
+
+
+def scrape_classroom_schedule(url, driver, record=None):
+    """
+    Scrape the classroom schedule from a UCLA classroom detail page using Selenium.
+    Returns a dictionary with the schedule organized by day of week.
+    If a metrics record is given, phase durations and bytes fetched are added to it.
+    """
+    page_source = fetch_classroom_page(url, driver, record)
+    if page_source is None:
+        return None
+    
+    with timed(record, 'parse'):
+        return parse_classroom_page(page_source)
+
+
+def parse_classroom_page(page_source, with_characteristics=True):
+    """
+    Parse the rendered HTML of a classroom detail page.
+    Returns the same dictionary as scrape_classroom_schedule. Characteristics do not
+    change between terms, so with_characteristics=False skips them (returned as None).
+    """
+    try:
         soup = BeautifulSoup(page_source, 'html.parser')
         
         # Extract room characteristics
-        characteristics = []
-        characteristics_list = soup.find('ul', {'class': 'room-attributes', 'id': 'characteristics-list'})
+        characteristics = [] if with_characteristics else None
+        characteristics_list = soup.find('ul', {'class': 'room-attributes', 'id': 'characteristics-list'}) if with_characteristics else None
         if characteristics_list:
             for li in characteristics_list.find_all('li'):
                 # Use .string instead of .get_text() due to BeautifulSoup quirk with whitespace
@@ -68,8 +189,7 @@ def scrape_classroom_schedule(url, driver):
                 return {"no_calendar": True, "schedule": {}, "characteristics": characteristics}
             return {"no_calendar": True, "schedule": {}, "characteristics": characteristics}
         
-        days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        schedule = {day: [] for day in days}
+        schedule = {day: [] for day in DAYS}
         
         for event in calendar_data:
             start_dt_str = event.get('start', '')
@@ -168,69 +288,323 @@ def scrape_classroom_schedule(url, driver):
         return None
 
 
-def process_classroom_worker(args):
-    """Worker function for multiprocessing."""
-    classroom, index, total = args
-    driver = None
+def compact_result(result):
+    """
+    Pack a parsed result into the compact record sent between processes.
+    
+    Returns (status, characteristics, events) where status is 'success',
+    'no_calendar' or 'failed', characteristics is None when they were not
+    parsed, and events is a list of
+    (day_index, course, type, start_time, end_time, enrolled, capacity) tuples.
+    """
+    if not result:
+        return ('failed', None, None)
+    characteristics = result.get('characteristics')
+    if result.get('no_calendar', False):
+        return ('no_calendar', characteristics, None)
+    events = []
+    for day_index, day in enumerate(DAYS):
+        for event in result['schedule'].get(day, []):
+            events.append((day_index, event['course'], event['type'], event['start_time'],
+                           event['end_time'], event['enrolled'], event['capacity']))
+    return ('success', characteristics, events)
+
+
+def expand_schedule(events):
+    """Rebuild the day -> events schedule dict from compact event tuples."""
+    schedule = {day: [] for day in DAYS}
+    for day_index, course, course_type, start_time, end_time, enrolled, capacity in events:
+        schedule[DAYS[day_index]].append({
+            'course': course,
+            'type': course_type,
+            'start_time': start_time,
+            'end_time': end_time,
+            'enrolled': enrolled,
+            'capacity': capacity
+        })
+    return schedule
+
+
+def apply_result(classroom, compact, index, total, record, term=DEFAULT_TERM, primary=True):
+    """
+    Merge a compact result into its classroom record in place and print its status line.
+    Returns the stats dict used for the run totals.
+    """
+    building = classroom.get('building', 'Unknown')
+    room = classroom.get('room', 'Unknown')
+    status, characteristics, events = compact
+    stats = {'success': 0, 'no_calendar': 0, 'failed': 0}
+    
+    if characteristics is not None:
+        classroom['characteristics'] = characteristics
+    
+    if status == 'no_calendar':
+        store_term_result(classroom, term, None, True, primary)
+        stats['no_calendar'] = 1
+        record['status'] = 'no_calendar'
+        print(f"[{index}/{total}] {building} {room} ({term}): NO_CALENDAR")
+    elif status == 'success':
+        store_term_result(classroom, term, expand_schedule(events), False, primary)
+        stats['success'] = 1
+        record['status'] = 'success'
+        record['events'] = len(events)
+        print(f"[{index}/{total}] {building} {room} ({term}): OK ({len(events)} events)")
+    else:
+        store_term_result(classroom, term, None, None, primary)
+        stats['failed'] = 1
+        record['status'] = record['status'] or 'failed'
+        print(f"[{index}/{total}] {building} {room} ({term}): FAILED")
+    
+    return stats
+
+
+def process_classroom_worker(job):
+    """Worker function for multiprocessing. Jobs are (index, url, with_characteristics)."""
+    return run_profiled(scrape_classroom_task, job, label=job[0])
+
+
+def scrape_classroom_task(job):
+    """
+    Scrape one classroom with this worker's Chrome instance (see worker_driver).
+    Returns (index, compact_result, metrics_record).
+    """
+    index, url, with_characteristics = job
+    record = new_room_record(index, None, None)
+    compact = compact_result(None)
     
     try:
-        chrome_options = Options()
-        chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--disable-logging')
-        chrome_options.add_argument('--log-level=3')
-        
-        driver = webdriver.Chrome(options=chrome_options)
+        page_source = fetch_with_retries(url, worker_driver(record), record)
+        if page_source is not None:
+            with timed(record, 'parse'):
+                compact = compact_result(parse_classroom_page(page_source, with_characteristics))
         
-        building = classroom.get('building', 'Unknown')
-        room = classroom.get('room', 'Unknown')
-        url = classroom.get('url', '')
-        
-        result = scrape_classroom_schedule(url, driver)
-        
-        stats = {'success': 0, 'no_calendar': 0, 'failed': 0}
-        
-        if result:
-            schedule = result.get('schedule', {})
-            has_no_calendar = result.get('no_calendar', False)
-            characteristics = result.get('characteristics', [])
+    except Exception as e:
+        print(f"[{index}] ERROR: {e}")
+        record['status'] = 'error'
+    finally:
+        if pool_driver_started is not None:
+            record['driver_lifetime'] = time.perf_counter() - pool_driver_started
+        if record['status'] == 'error':
+            # Start a fresh browser for the next job in case this one crashed
+            quit_worker_driver()
+        record['rss_bytes'] = worker_rss_bytes()
+    
+    return (index, compact, record)
+
+
+def merge_result(all_classrooms, targets, index, compact, record, totals, run_metrics):
+    """
+    Merge one worker result into the in-memory classroom list and the run totals.
+    targets[index - 1] is the (classroom position, term, primary) the job was for.
+    """
+    position, term, primary = targets[index - 1]
+    classroom = all_classrooms[position]
+    record['building'] = classroom.get('building')
+    record['room'] = classroom.get('room')
+    record['term'] = term
+    stats = apply_result(classroom, compact, index, len(targets), record, term, primary)
+    for key in totals:
+        totals[key] += stats[key]
+    run_metrics.add(record)
+
+
+def fetch_stage(job_queue, raw_queue, profile_config, limiter):
+    """
+    Pipeline fetch worker: keeps one Chrome instance for its whole life and only
+    produces raw page sources. Jobs are (index, url, with_characteristics); a None
+    job stops the worker.
+    """
+    init_worker(profile_config, limiter)
+    state = {'driver': None, 'started': None}
+    
+    def fetch_job(job):
+        index, url, with_characteristics = job
+        record = new_room_record(index, None, None)
+        try:
+            if state['driver'] is None:
+                with timed(record, 'driver_start'):
+                    state['driver'] = make_driver()
+                state['started'] = time.perf_counter()
+            page_source = fetch_with_retries(url, state['driver'], record)
+        except Exception as e:
+            print(f"[{index}] FETCH ERROR: {e}")
+            page_source = None
+            record['status'] = 'error'
+            # Start a fresh browser for the next job in case this one crashed
+            if state['driver'] is not None:
+                try:
+                    state['driver'].quit()
+                except Exception:
+                    pass
+            state['driver'] = None
+        if state['started'] is not None:
+            record['driver_lifetime'] = time.perf_counter() - state['started']
+        record['rss_bytes'] = worker_rss_bytes()
+        return (index, page_source, record, with_characteristics)
+    
+    try:
+        for job in iter(job_queue.get, None):
+            raw_queue.put(run_profiled(fetch_job, job, label=f"fetch{job[0]}"))
+    finally:
+        if state['driver'] is not None:
+            state['driver'].quit()
+
+
+def parse_stage(raw_queue, result_queue, profile_config):
+    """Pipeline parse worker: turns raw page sources into parsed results until it receives None."""
+    profiling.init_worker(profile_config)
+    
+    def parse_job(item):
+        index, page_source, record, with_characteristics = item
+        compact = compact_result(None)
+        if page_source is not None:
+            with timed(record, 'parse'):
+                compact = compact_result(parse_classroom_page(page_source, with_characteristics))
+        return (index, compact, record)
+    
+    for item in iter(raw_queue.get, None):
+        result_queue.put(run_profiled(parse_job, item, label=f"parse{item[0]}"))
+
+
+def run_probe(jobs, all_classrooms, targets, totals, run_metrics, limiter, workers):
+    """
+    Pre-probe every job with a plain HTTP GET. Rooms whose calendar payload is
+    empty are merged as NO_CALENDAR right away; returns the jobs that still need
+    the browser (has events or unknown).
+    """
+    print(f"Probing {len(jobs)} pages...")
+    results = probe_classrooms([url for _, url, _ in jobs], workers=workers, limiter=limiter)
+    
+    remaining = []
+    counts = {EMPTY: 0, HAS_EVENTS: 0, UNKNOWN: 0}
+    for (index, url, with_characteristics), (status, characteristics, size, seconds) in zip(jobs, results):
+        counts[status] += 1
+        if status != EMPTY:
+            remaining.append((index, url, with_characteristics))
+            continue
+        record = new_room_record(index, None, None)
+        record['phases']['probe'] = seconds
+        record['bytes'] = size
+        compact = ('no_calendar', characteristics if with_characteristics else None, None)
+        merge_result(all_classrooms, targets, index, compact, record, totals, run_metrics)
+    
+    print(f"Probe: {counts[EMPTY]} empty | {counts[HAS_EVENTS]} with events | {counts[UNKNOWN]} unknown\n")
+    return remaining
+
+
+def run_pool(jobs, all_classrooms, targets, totals, run_metrics,
+             num_processes, batch_size, profile_config, limiter):
+    """
+    Scrape with one Pool task per (classroom, term), saving after every batch. Each worker
+    keeps one Chrome instance for all the jobs it runs, across terms.
+    """
+    total_classrooms = len(jobs)
+    
+    pool = Pool(processes=num_processes, initializer=init_worker, initargs=(profile_config, limiter))
+    try:
+        for batch_start in range(0, total_classrooms, batch_size):
+            batch_end = min(batch_start + batch_size, total_classrooms)
+            
+            print(f"Batch [{batch_start + 1}-{batch_end}/{total_classrooms}]")
             
-            classroom['characteristics'] = characteristics
+            for index, compact, record in pool.imap_unordered(process_classroom_worker, jobs[batch_start:batch_end]):
+                merge_result(all_classrooms, targets, index, compact, record, totals, run_metrics)
             
-            if has_no_calendar:
-                classroom['schedule'] = None
-                classroom['no_calendar'] = True
-                stats['no_calendar'] = 1
-                print(f"[{index}/{total}] {building} {room}: NO_CALENDAR")
-            else:
-                classroom['schedule'] = schedule
-                classroom['no_calendar'] = False
-                total_events = sum(len(events) for events in schedule.values())
-                stats['success'] = 1
-                print(f"[{index}/{total}] {building} {room}: OK ({total_events} events)")
-        else:
-            classroom['schedule'] = None
-            classroom['no_calendar'] = None
-            stats['failed'] = 1
-            print(f"[{index}/{total}] {building} {room}: FAILED")
+            with open('classrooms.json', 'w') as f:
+                json.dump(all_classrooms, f, indent=4)
+            
+            rate_info = f" | Rate: {limiter.rate:.2f}/s" if limiter else ""
+            print(f"Saved: {batch_end}/{total_classrooms} | Success: {totals['success']} | No calendar: {totals['no_calendar']} | Failed: {totals['failed']}{rate_info}\n")
+    except BaseException:
+        pool.terminate()
+        raise
+    # close() and join() rather than terminate(), so every worker exits normally and quits its Chrome
+    pool.close()
+    pool.join()
+
+
+def run_pipeline(jobs, all_classrooms, targets, totals, run_metrics,
+                 fetch_processes, parse_processes, batch_size, profile_config, limiter):
+    """
+    Scrape with separate fetch and parse stages connected by bounded queues.
+    
+    Fetch workers each keep one browser and only return page sources, parse
+    workers turn them into compact results, and this process is the single
+    writer that merges them into all_classrooms and saves every batch_size rooms.
+    """
+    total_classrooms = len(jobs)
+    job_queue = Queue()
+    raw_queue = Queue(maxsize=2 * parse_processes)
+    result_queue = Queue(maxsize=2 * parse_processes)
+    
+    for job in jobs:
+        job_queue.put(job)
+    for _ in range(fetch_processes):
+        job_queue.put(None)
+    
+    fetchers = [Process(target=fetch_stage, args=(job_queue, raw_queue, profile_config, limiter))
+                for _ in range(fetch_processes)]
+    parsers = [Process(target=parse_stage, args=(raw_queue, result_queue, profile_config))
+               for _ in range(parse_processes)]
+    for process in fetchers + parsers:
+        process.start()
+    
+    received = 0
+    parsers_stopped = False
+    while received < total_classrooms:
+        try:
+            index, compact, record = result_queue.get(timeout=5)
+        except queue.Empty:
+            # Once every fetcher has exited, nothing more can enter the parse stage
+            if not parsers_stopped and not any(p.is_alive() for p in fetchers):
+                for _ in parsers:
+                    raw_queue.put(None)
+                parsers_stopped = True
+            if parsers_stopped and not any(p.is_alive() for p in parsers) and result_queue.empty():
+                print(f"WARNING: pipeline stopped after {received}/{total_classrooms} results")
+                break
+            continue
         
-        return (index, classroom, stats)
+        received += 1
+        merge_result(all_classrooms, targets, index, compact, record, totals, run_metrics)
         
-    except Exception as e:
-        print(f"[{index}/{total}] ERROR: {e}")
-        classroom['schedule'] = None
-        classroom['no_calendar'] = None
-        return (index, classroom, {'success': 0, 'no_calendar': 0, 'failed': 1})
-    finally:
-        if driver:
-            driver.quit()
+        if received % batch_size == 0 or received == total_classrooms:
+            with open('classrooms.json', 'w') as f:
+                json.dump(all_classrooms, f, indent=4)
+            rate_info = f" | Rate: {limiter.rate:.2f}/s" if limiter else ""
+            print(f"Saved: {received}/{total_classrooms} | Success: {totals['success']} | No calendar: {totals['no_calendar']} | Failed: {totals['failed']}{rate_info}\n")
+    
+    if not parsers_stopped:
+        for _ in parsers:
+            raw_queue.put(None)
+    for process in fetchers + parsers:
+        process.join()
 
 
-def main(limit=None, num_processes=4, batch_size=None):
-    """Main function to scrape schedules from all classrooms using multiprocessing"""
+def main(limit=None, num_processes=4, batch_size=None, profile=None, trace_malloc=False,
+         rate=None, max_rate=8.0, pipeline=False, parse_processes=2, terms=None,
+         probe=False, all_rooms=False, probe_workers=8):
+    """
+    Main function to scrape schedules from all classrooms using multiprocessing.
+    profile ('cprofile' or 'sample') and trace_malloc turn on per-worker profiling.
+    rate is the starting request rate (requests/second) shared by all workers; it
+    adapts to server latency up to max_rate. The default, one request per second per
+    worker, is more than the workers reach unthrottled (a page load takes over 2s), so
+    a run starts as fast as before and only slows down when the server does. Pass
+    rate=0 to disable the limiter.
+    With pipeline=True, num_processes fetch workers feed parse_processes parse workers.
+    terms lists the term codes to scrape (default: [DEFAULT_TERM]); all (room, term)
+    jobs share one worker pool and the first term is stored as the primary schedule.
+    With probe=True, a plain HTTP GET per page first settles rooms with an empty
+    calendar so only the rest go to Chrome. all_rooms=True scrapes every room in
+    the catalog, not only the offered ones.
+    """
+    terms = terms or [DEFAULT_TERM]
+    profile_config = make_config(profile, trace_malloc)
+    prepare_output_dir(profile_config)
+    rate = float(num_processes) if rate is None else rate
+    limiter = AdaptiveRateLimiter(initial_rate=rate, max_rate=max(max_rate, rate)) if rate else None
+    
     with open('classrooms.json', 'r') as f:
         all_classrooms = json.load(f)
     
@@ -242,56 +616,51 @@ def main(limit=None, num_processes=4, batch_size=None):
         print("ERROR: No classrooms found in classrooms.json")
         return
     
-    # Filter for only offered classrooms and track their indices in the original list
-    classrooms_to_scrape = []
-    original_indices = []
-    for i, classroom in enumerate(all_classrooms):
-        if classroom.get('offered', False):
-            classrooms_to_scrape.append(classroom)
-            original_indices.append(i)
+    # Track the classrooms to scrape by their indices in the original list; workers
+    # only see (index, url, with_characteristics) jobs, one per room and term, and
+    # results are merged back into all_classrooms
+    original_indices = [i for i, classroom in enumerate(all_classrooms)
+                        if classroom.get('url') and (all_rooms or classroom.get('offered', False))]
     
     if limit and limit > 0:
-        classrooms_to_scrape = classrooms_to_scrape[:limit]
         original_indices = original_indices[:limit]
     
-    total_classrooms = len(classrooms_to_scrape)
+    jobs = []
+    targets = []
+    for original in original_indices:
+        classroom = all_classrooms[original]
+        for term_position, term in enumerate(terms):
+            primary = term_position == 0
+            url = classroom.get('urls', {}).get(term) or term_url(classroom['url'], term)
+            # Characteristics are the same in every term, so only the primary term parses them
+            jobs.append((len(jobs) + 1, url, primary))
+            targets.append((original, term, primary))
+    total_classrooms = len(jobs)
     
     if batch_size is None:
         batch_size = num_processes
     
-    print(f"Total: {total_classrooms} | Processes: {num_processes} | Batch size: {batch_size}")
+    if pipeline:
+        print(f"Total: {total_classrooms} | Fetch processes: {num_processes} | Parse processes: {parse_processes} | Save every: {batch_size}")
+    else:
+        print(f"Total: {total_classrooms} | Processes: {num_processes} | Batch size: {batch_size}")
+    print(f"Terms: {', '.join(terms)} | Rooms: {len(original_indices)}")
     print("="*80)
     
-    total_success = 0
-    total_no_calendar = 0
-    total_failed = 0
+    totals = {'success': 0, 'no_calendar': 0, 'failed': 0}
+    run_metrics = RunMetrics()
     
-    work_items = [(classroom, i+1, total_classrooms) for i, classroom in enumerate(classrooms_to_scrape)]
+    if probe:
+        jobs = run_probe(jobs, all_classrooms, targets, totals, run_metrics, limiter, probe_workers)
     
     print(f"Starting parallel execution...\n")
     
-    with Pool(processes=num_processes) as pool:
-        for batch_start in range(0, total_classrooms, batch_size):
-            batch_end = min(batch_start + batch_size, total_classrooms)
-            batch_items = work_items[batch_start:batch_end]
-            
-            print(f"Batch [{batch_start + 1}-{batch_end}/{total_classrooms}]")
-            
-            batch_results = pool.map(process_classroom_worker, batch_items)
-            
-            for index, classroom_data, stats in batch_results:
-                # Update both the filtered list and the original list
-                classrooms_to_scrape[index - 1] = classroom_data
-                all_classrooms[original_indices[index - 1]] = classroom_data
-                
-                total_success += stats['success']
-                total_no_calendar += stats['no_calendar']
-                total_failed += stats['failed']
-            
-            with open('classrooms.json', 'w') as f:
-                json.dump(all_classrooms, f, indent=4)
-            
-            print(f"Saved: {batch_end}/{total_classrooms} | Success: {total_success} | No calendar: {total_no_calendar} | Failed: {total_failed}\n")
+    if pipeline:
+        run_pipeline(jobs, all_classrooms, targets, totals, run_metrics,
+                     num_processes, parse_processes, batch_size, profile_config, limiter)
+    else:
+        run_pool(jobs, all_classrooms, targets, totals, run_metrics,
+                 num_processes, batch_size, profile_config, limiter)
     
     print("\n" + "="*80)
     print("COMPLETE")
@@ -300,9 +669,20 @@ def main(limit=None, num_processes=4, batch_size=None):
         json.dump(all_classrooms, f, indent=4)
     
     print(f"Total processed: {total_classrooms}")
-    print(f"Success: {total_success}")
-    print(f"No calendar: {total_no_calendar}")
-    print(f"Failed: {total_failed}")
+    print(f"Success: {totals['success']}")
+    print(f"No calendar: {totals['no_calendar']}")
+    print(f"Failed: {totals['failed']}")
+    
+    run_metrics.finish()
+    run_metrics.write_json(REPORT_JSON)
+    run_metrics.write_prometheus(REPORT_PROM)
+    print(f"Time by phase: {run_metrics.format_breakdown()}")
+    if limiter:
+        limiter_state = limiter.snapshot()
+        print(f"Final rate: {limiter_state['rate']:.2f}/s (increases: {limiter_state['increases']}, decreases: {limiter_state['decreases']})")
+    print(f"Run report: {REPORT_JSON} | Metrics: {REPORT_PROM}")
+    for path in merge_profiles(profile_config):
+        print(f"Profile: {path}")
     print("="*80)
 
 
@@ -312,23 +692,73 @@ if __name__ == "__main__":
     limit = None
     num_processes = 4
     batch_size = None
+    profile = None
+    trace_malloc = False
+    rate = None
+    max_rate = 8.0
+    pipeline = False
+    parse_processes = 2
+    terms = None
+    probe = False
+    all_rooms = False
+    
+    # Options (--name or --name=value) may appear anywhere; the rest are positional
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    for option in (arg for arg in sys.argv[1:] if arg.startswith('--')):
+        name, _, value = option.partition('=')
+        if name == '--profile':
+            profile = value or 'cprofile'
+            if profile not in profiling.PROFILE_MODES:
+                print(f"ERROR: Unknown --profile mode {value!r} (expected one of: {', '.join(profiling.PROFILE_MODES)})")
+                print("Usage: python scrape.py [limit] [num_processes] [batch_size] [--profile[=cprofile|sample]] [--tracemalloc]\n"
+                      "                        [--pipeline[=parse_processes]] [--terms=25F,26W] [--probe] [--all]\n"
+                      "                        [--rate=N] [--max-rate=N] [--no-rate-limit]")
+                sys.exit(1)
+        elif name == '--tracemalloc':
+            trace_malloc = True
+        elif name == '--pipeline':
+            pipeline = True
+            if value:
+                try:
+                    parse_processes = int(value)
+                except ValueError:
+                    print("ERROR: Invalid --pipeline value, using default (2 parse processes)")
+        elif name == '--terms':
+            terms = [term.strip() for term in value.split(',') if term.strip()] or None
+        elif name == '--probe':
+            probe = True
+        elif name == '--all':
+            all_rooms = True
+        elif name == '--no-rate-limit':
+            rate = 0
+        elif name in ('--rate', '--max-rate'):
+            try:
+                if name == '--rate':
+                    rate = float(value)
+                else:
+                    max_rate = float(value)
+            except ValueError:
+                print(f"ERROR: Invalid {name} value, using default")
+        else:
+            print(f"ERROR: Unknown option {option}")
     
-    if len(sys.argv) > 1:
+    if len(args) > 0:
         try:
-            limit = int(sys.argv[1])
+            limit = int(args[0])
         except ValueError:
             print("ERROR: Invalid limit argument")
     
-    if len(sys.argv) > 2:
+    if len(args) > 1:
         try:
-            num_processes = int(sys.argv[2])
+            num_processes = int(args[1])
         except ValueError:
             print("ERROR: Invalid num_processes argument, using default (4)")
     
-    if len(sys.argv) > 3:
+    if len(args) > 2:
         try:
-            batch_size = int(sys.argv[3])
+            batch_size = int(args[2])
         except ValueError:
             print("ERROR: Invalid batch_size argument, using default (same as num_processes)")
     
-    main(limit, num_processes, batch_size)
+    main(limit, num_processes, batch_size, profile, trace_malloc, rate, max_rate, pipeline, parse_processes, terms,
+         probe, all_rooms)
@@ -0,0 +1,396 @@
+"""
+Schedule of Classes Listing Ingestion
+
+Builds room schedules from the registrar's Schedule of Classes results pages
+(one listing per subject area) instead of loading one ClassroomDetail page per
+room. Every section row already carries its days, times and location, so the
+sections are inverted into per-room schedules in the same format that
+scrape.scrape_classroom_schedule returns. A few hundred subject requests cover
+every room in classrooms.json, including the rooms that are not offered.
+
+Subject areas default to the subject prefixes of course names already present
+in classrooms.json; pass --subjects to override.
+
+Nothing is written if any subject could not be fetched (or, when replaying,
+was never recorded) or if no meetings were parsed at all, e.g. because the
+markup changed. Otherwise the listings are taken as complete: every room gets
+this term's schedule replaced, and a room without meetings (all its sections
+cancelled or moved) gets an empty one.
+
+Pages can be recorded and replayed so the parser can be developed and re-run
+against a local stand-in instead of the live registrar:
+
+    python soc_listings.py 25F --record=recorded_pages    # fetch live, save pages
+    python soc_listings.py 25F --replay=recorded_pages    # read saved pages only
+    python soc_listings.py 25F --base-url=http://localhost:8000   # local server
+
+Usage:
+    python soc_listings.py TERM [--subjects="COM SCI,MATH"] [--workers=4] [--dry-run]
+
+Parsing assumes the registrar's results markup: section rows are elements that
+contain sectionColumn/dayColumn/timeColumn/locationColumn cells under an h3
+course heading.
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from bs4 import BeautifulSoup
+
+from availability import DAYS, schedule_for, store_term_result
+from generate_urls import DEFAULT_TERM
+from rate_limit import AdaptiveRateLimiter
+from room_keys import building_aliases, canonical_building, parse_room_name, room_key
+
+SOC_RESULTS_URL = 'https://sa.ucla.edu/ro/Public/SOC/Results'
+MAX_PAGES = 20
+USER_AGENT = 'StudySpace schedule ingestion (educational use)'
+
+DAY_CODES = {'M': 'Monday', 'T': 'Tuesday', 'W': 'Wednesday', 'R': 'Thursday', 'F': 'Friday', 'S': 'Saturday', 'U': 'Sunday'}
+
+TIME_RANGE_RE = re.compile(r'(\d{1,2})(?::(\d{2}))?\s*(am|pm)\s*-\s*(\d{1,2})(?::(\d{2}))?\s*(am|pm)', re.IGNORECASE)
+ENROLLED_RE = re.compile(r'(\d+)\s*of\s*(\d+)\s*Enrolled', re.IGNORECASE)
+CLASS_FULL_RE = re.compile(r'Class\s+Full\s*\((\d+)\)', re.IGNORECASE)
+COURSE_NUMBER_RE = re.compile(r'^(.*\S)\s+([A-Z]*\d+[A-Z0-9]*)$')
+WHITESPACE_RE = re.compile(r'\s+')
+DAY_PATTERN_RE = re.compile(r'^[MTWRFSU]+$')
+
+
+class PageSource:
+    """
+    Fetches listing pages from the registrar, a local stand-in server, or a
+    directory of recorded pages.
+
+    Args:
+        base_url: Results URL to query (point it at a local server to test)
+        record_dir: Save every fetched page here
+        replay_dir: Only read pages recorded earlier; never touch the network
+        limiter: Optional AdaptiveRateLimiter shared by all fetch threads
+    """
+
+    def __init__(self, base_url=SOC_RESULTS_URL, record_dir=None, replay_dir=None, limiter=None):
+        self.base_url = base_url
+        self.record_dir = record_dir
+        self.replay_dir = replay_dir
+        self.limiter = limiter
+        self.requests = 0
+        if record_dir:
+            os.makedirs(record_dir, exist_ok=True)
+
+    @staticmethod
+    def page_name(params):
+        """File name of a recorded page, derived from its query parameters."""
+        query = urllib.parse.urlencode(sorted(params.items()))
+        return hashlib.sha1(query.encode('utf-8')).hexdigest()[:16] + '.html'
+
+    def fetch(self, params):
+        """Return the HTML for one results page, or None if it is unavailable."""
+        name = self.page_name(params)
+        if self.replay_dir:
+            path = os.path.join(self.replay_dir, name)
+            if not os.path.exists(path):
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                return f.read()
+
+        url = f"{self.base_url}?{urllib.parse.urlencode(params)}"
+        if self.limiter:
+            self.limiter.acquire()
+        started = time.monotonic()
+        try:
+            request = urllib.request.Request(url, headers={'User-Agent': USER_AGENT})
+            with urllib.request.urlopen(request, timeout=30) as response:
+                html = response.read().decode('utf-8', errors='replace')
+        except Exception as e:
+            print(f"FETCH ERROR {url}: {e}")
+            if self.limiter:
+                self.limiter.report(time.monotonic() - started, ok=False)
+            return None
+        if self.limiter:
+            self.limiter.report(time.monotonic() - started, ok=True)
+        self.requests += 1
+
+        if self.record_dir:
+            with open(os.path.join(self.record_dir, name), 'w', encoding='utf-8') as f:
+                f.write(html)
+        return html
+
+
+def subject_params(term, subject, page=1):
+    """Query parameters for one page of a subject area's results."""
+    params = {'t': term, 'sBy': 'subject', 'subj': subject}
+    if page > 1:
+        params['pageNumber'] = str(page)
+    return params
+
+
+def split_course_name(course):
+    """Split 'COM SCI 31' (or registrar-padded 'HIST    149A') into ('COM SCI', '31')."""
+    course = WHITESPACE_RE.sub(' ', course or '').strip()
+    match = COURSE_NUMBER_RE.match(course)
+    if not match:
+        return course, ''
+    return match.group(1), match.group(2)
+
+
+def subjects_from_classrooms(classrooms):
+    """Subject area codes of every course already present in the scraped data."""
+    subjects = set()
+    for classroom in classrooms:
+        schedules = [classroom.get('schedule')] + [t.get('schedule') for t in (classroom.get('terms') or {}).values()]
+        for schedule in schedules:
+            for events in (schedule or {}).values():
+                for event in events:
+                    subject, number = split_course_name(event.get('course'))
+                    if subject and number:
+                        subjects.add(subject)
+    return sorted(subjects)
+
+
+def format_time(hour, minute, meridiem):
+    """Format registrar time parts as the '%I:%M %p' strings used in classrooms.json."""
+    return f"{int(hour):02d}:{int(minute or 0):02d} {meridiem.upper()}"
+
+
+def minutes_of(time_str):
+    """Minutes after midnight for an '%I:%M %p' string."""
+    clock, meridiem = time_str.split(' ')
+    hour, minute = (int(part) for part in clock.split(':'))
+    hour = hour % 12 + (12 if meridiem == 'PM' else 0)
+    return hour * 60 + minute
+
+
+def _cell_text(row, column):
+    cell = row.find(class_=column)
+    return WHITESPACE_RE.sub(' ', cell.get_text(' ', strip=True)).strip() if cell else ''
+
+
+def parse_listing_page(html, subject):
+    """
+    Parse one results page into section meetings.
+    Returns a list of dicts with course, type, days, start_time, end_time,
+    location, enrolled and capacity.
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    meetings = []
+
+    for section_cell in soup.find_all(class_='sectionColumn'):
+        row = section_cell.parent
+        if row is None or row.find(class_='locationColumn') is None:
+            continue
+
+        time_match = TIME_RANGE_RE.search(_cell_text(row, 'timeColumn'))
+        day_text = _cell_text(row, 'dayColumn').replace(' ', '')
+        days = [DAY_CODES[code] for code in day_text] if DAY_PATTERN_RE.match(day_text) else []
+        location = _cell_text(row, 'locationColumn')
+        if not time_match or not days or not location:
+            continue
+
+        heading = row.find_previous('h3')
+        title = heading.get_text(' ', strip=True).split(' - ')[0] if heading else ''
+        title = WHITESPACE_RE.sub(' ', title).strip()
+        course = title if title.upper().startswith(subject.upper()) else f"{subject} {title}".strip()
+
+        status = _cell_text(row, 'statusColumn')
+        enrolled = capacity = None
+        enrolled_match = ENROLLED_RE.search(status)
+        full_match = CLASS_FULL_RE.search(status)
+        if enrolled_match:
+            enrolled, capacity = int(enrolled_match.group(1)), int(enrolled_match.group(2))
+        elif full_match:
+            enrolled = capacity = int(full_match.group(1))
+
+        start_hour, start_minute, start_meridiem, end_hour, end_minute, end_meridiem = time_match.groups()
+        meetings.append({
+            'course': course,
+            'type': _cell_text(row, 'sectionColumn').upper(),
+            'days': days,
+            'start_time': format_time(start_hour, start_minute, start_meridiem),
+            'end_time': format_time(end_hour, end_minute, end_meridiem),
+            'location': location,
+            'enrolled': enrolled,
+            'capacity': capacity,
+        })
+
+    return meetings
+
+
+def fetch_subject(source, term, subject):
+    """
+    Fetch and parse every results page of one subject area.
+
+    Returns:
+        List of meetings, or None if a page could not be fetched (a network error or,
+        when replaying, a page that was never recorded)
+    """
+    meetings = []
+    seen_pages = set()
+    for page in range(1, MAX_PAGES + 1):
+        html = source.fetch(subject_params(term, subject, page))
+        if html is None:
+            return None
+        page_meetings = parse_listing_page(html, subject)
+        # Stop when a page adds nothing new (past the last page the registrar repeats or empties)
+        signature = tuple((m['course'], m['type'], m['location']) for m in page_meetings)
+        if not page_meetings or signature in seen_pages:
+            break
+        seen_pages.add(signature)
+        meetings.extend(page_meetings)
+    return meetings
+
+
+def location_key(location, building_codes=()):
+    """
+    Turn a listing location such as 'Boelter Hall 2444' into the canonical
+    'BUILDING|room' key from room_keys.parse_room_name. Returns None for online,
+    TBA or unrecognized locations (buildings neither aliased nor in building_codes).
+    """
+    key = parse_room_name(location.split('/')[0])
+    if key is None:
+        return None
+    building = key.partition('|')[0]
+    if building not in building_aliases() and building not in building_codes:
+        return None
+    return key
+
+
+def invert_meetings(meetings, building_codes=()):
+    """
+    Invert section meetings into per-room results keyed by 'BUILDING|room'.
+    Each value has the same shape as scrape_classroom_schedule's return value;
+    characteristics are not part of the listings and are returned as None.
+    Also returns the set of locations that could not be matched to a room.
+    """
+    rooms = {}
+    unmatched = set()
+    seen = set()
+    for meeting in meetings:
+        key = location_key(meeting['location'], building_codes=building_codes)
+        if key is None:
+            unmatched.add(meeting['location'])
+            continue
+        schedule = rooms.setdefault(key, {day: [] for day in DAYS})
+        for day in meeting['days']:
+            # Cross-listed courses show the same meeting under several subjects
+            identity = (key, day, meeting['course'], meeting['type'], meeting['start_time'])
+            if identity in seen:
+                continue
+            seen.add(identity)
+            schedule[day].append({
+                'course': meeting['course'],
+                'type': meeting['type'],
+                'start_time': meeting['start_time'],
+                'end_time': meeting['end_time'],
+                'enrolled': meeting['enrolled'],
+                'capacity': meeting['capacity']
+            })
+
+    results = {}
+    for key, schedule in rooms.items():
+        for day in schedule:
+            schedule[day].sort(key=lambda event: minutes_of(event['start_time']))
+        results[key] = {"no_calendar": False, "schedule": schedule, "characteristics": None}
+    return results, unmatched
+
+
+def main(term=DEFAULT_TERM, subjects=None, workers=4, base_url=SOC_RESULTS_URL,
+         record_dir=None, replay_dir=None, dry_run=False):
+    """Fetch listings for every subject, invert them into room schedules and merge into classrooms.json."""
+    with open('classrooms.json', 'r') as f:
+        all_classrooms = json.load(f)
+
+    subjects = subjects or subjects_from_classrooms(all_classrooms)
+    if not subjects:
+        print("ERROR: No subject areas given and none found in classrooms.json")
+        return
+
+    limiter = None if replay_dir else AdaptiveRateLimiter(initial_rate=2.0, max_rate=8.0)
+    source = PageSource(base_url, record_dir, replay_dir, limiter)
+
+    print(f"Term: {term} | Subjects: {len(subjects)} | Workers: {workers}")
+    print("="*80)
+
+    meetings = []
+    failed = []
+    empty = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for subject, subject_meetings in zip(subjects, executor.map(lambda s: fetch_subject(source, term, s), subjects)):
+            if subject_meetings is None:
+                print(f"{subject}: FAILED")
+                failed.append(subject)
+                continue
+            print(f"{subject}: {len(subject_meetings)} meetings")
+            if not subject_meetings:
+                empty.append(subject)
+            meetings.extend(subject_meetings)
+
+    classrooms = [c for c in all_classrooms if c.get('building')]
+    building_codes = {canonical_building(c['building']) for c in classrooms}
+    room_results, unmatched = invert_meetings(meetings, building_codes)
+
+    results = [(classroom, room_results.get(room_key(classroom['building'], classroom['room'])))
+               for classroom in classrooms]
+    matched = sum(1 for _, result in results if result)
+    # Rooms that had classes this term and have none in the listings (all sections cancelled or moved)
+    cleared = sum(1 for classroom, result in results if not result and any((schedule_for(classroom, term) or {}).values()))
+
+    print("="*80)
+    print(f"Requests: {source.requests} | Meetings: {len(meetings)} | Rooms with classes: {matched}/{len(classrooms)} | "
+          f"Cleared: {cleared}")
+    print(f"Subjects: {len(subjects) - len(failed)}/{len(subjects)} fetched | Without meetings: {len(empty)}"
+          + (f" ({', '.join(empty[:10])})" if empty else ''))
+    if unmatched:
+        print(f"Unmatched locations: {len(unmatched)} (e.g. {', '.join(sorted(unmatched)[:5])})")
+
+    if failed:
+        print(f"ERROR: {len(failed)} subjects failed ({', '.join(failed)}); classrooms.json not modified")
+        return
+    if not meetings:
+        print("ERROR: No meetings parsed; classrooms.json not modified")
+        return
+
+    # The listings are complete, so a room without meetings has no classes this term
+    for classroom, result in results:
+        schedule = result['schedule'] if result else {day: [] for day in DAYS}
+        store_term_result(classroom, term, schedule, False, classroom.get('term', term) == term)
+
+    if dry_run:
+        print("Dry run: classrooms.json not modified")
+        return
+
+    with open('classrooms.json', 'w') as f:
+        json.dump(all_classrooms, f, indent=4)
+    print("✓ Saved to classrooms.json")
+
+
+if __name__ == "__main__":
+    import sys
+
+    options = {}
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    for option in (arg for arg in sys.argv[1:] if arg.startswith('--')):
+        name, _, value = option.partition('=')
+        options[name] = value
+
+    subjects = [s.strip() for s in options['--subjects'].split(',') if s.strip()] if options.get('--subjects') else None
+    try:
+        workers = int(options.get('--workers') or 4)
+    except ValueError:
+        print("ERROR: Invalid --workers value, using default (4)")
+        workers = 4
+
+    main(
+        term=args[0] if args else DEFAULT_TERM,
+        subjects=subjects,
+        workers=workers,
+        base_url=options.get('--base-url') or SOC_RESULTS_URL,
+        record_dir=options.get('--record') or None,
+        replay_dir=options.get('--replay') or None,
+        dry_run='--dry-run' in options,
+    )
@@ -0,0 +1,73 @@
+"""
+Tests for api_server's /free query handling, through AvailabilityAPI.get on a
+small classrooms.json in a temporary directory.
+
+Usage:
+    python -m pytest tests
+"""
+
+import contextlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from http import HTTPStatus
+
+from api_server import NEAR_LIMIT, AvailabilityAPI
+
+NEAR = '34.0694,-118.4430'
+
+
+def record(building, number, capacity):
+    return {'text': f"{building:<8} {number}", 'building': building, 'room': number, 'offered': True,
+            'capacity': capacity, 'schedule': {}, 'no_calendar': True}
+
+
+class FreeLimitTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.dir = tempfile.mkdtemp()
+        path = os.path.join(cls.dir, 'classrooms.json')
+        classrooms = [record('BOELTER', str(2400 + n), 20 + n) for n in range(12)] + [record('MS', '5200', 100)]
+        with open(path, 'w') as f:
+            json.dump(classrooms, f)
+        with contextlib.redirect_stdout(io.StringIO()):
+            cls.api = AvailabilityAPI(path)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.dir)
+
+    def free(self, query):
+        status, body, _, _ = self.api.get(f"/free?day=Monday&start=10:00AM&end=11:00AM{query}")
+        return status, json.loads(body)
+
+    def rooms(self, query):
+        status, data = self.free(query)
+        self.assertEqual(status, HTTPStatus.OK)
+        return data['rooms']
+
+    def test_same_limit_in_both_modes(self):
+        for limit in [0, 1, 5, 20]:
+            with self.subTest(limit=limit):
+                self.assertEqual(len(self.rooms(f"&limit={limit}")), min(limit, 13))
+                self.assertEqual(len(self.rooms(f"&limit={limit}&near={NEAR}")), min(limit, 13))
+
+    def test_default_limit(self):
+        self.assertEqual(len(self.rooms('')), 13)
+        self.assertEqual(len(self.rooms(f"&near={NEAR}")), NEAR_LIMIT)
+        self.assertEqual(len(self.rooms(f"&limit=&near={NEAR}")), NEAR_LIMIT)
+
+    def test_bad_limit(self):
+        for query in ['&limit=-1', f"&limit=-1&near={NEAR}", '&limit=ten', f"&limit=ten&near={NEAR}"]:
+            with self.subTest(query=query):
+                status, data = self.free(query)
+                self.assertEqual(status, HTTPStatus.BAD_REQUEST)
+                self.assertIn('error', data)
+
+
+if __name__ == '__main__':
+    unittest.main()
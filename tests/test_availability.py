@@ -0,0 +1,168 @@
+"""
+Tests for availability: time parsing, interval merging and the RoomAvailability
+and AvailabilityIndex queries, on a small hand-made schedule.
+
+Usage:
+    python -m pytest tests
+"""
+
+import contextlib
+import io
+import unittest
+
+from availability import DAY_END, DAY_START, AvailabilityIndex, RoomAvailability, event_minutes, parse_time
+
+
+def event(start, end, course='COM SCI 31'):
+    return {'course': course, 'type': 'LEC 1', 'start_time': start, 'end_time': end, 'enrolled': 10, 'capacity': 20}
+
+
+def record(number, capacity=None, schedule=None):
+    return {'text': f"BOELTER  {number}", 'building': 'BOELTER', 'room': number, 'offered': True,
+            'capacity': capacity, 'schedule': schedule or {}, 'no_calendar': not schedule}
+
+
+# Monday: 9:00-10:00 and 10:00-10:50 touch (9:00-10:50), 1:00-2:00 and 1:30-3:00 overlap (1:00-3:00).
+# Tuesday has no classes; Wednesday to Sunday are missing from the schedule.
+SCHEDULE = {
+    'Monday': [event('01:30 PM', '03:00 PM'), event('09:00 AM', '10:00 AM'), event('10:00 AM', '10:50 AM'),
+               event('01:00 PM', '02:00 PM')],
+    'Tuesday': [],
+}
+
+
+class ParseTimeTest(unittest.TestCase):
+
+    def test_formats(self):
+        self.assertEqual(parse_time('02:00 PM'), 14 * 60)
+        self.assertEqual(parse_time('2:00pm'), 14 * 60)
+        self.assertEqual(parse_time('12:30 AM'), 30)
+        self.assertEqual(parse_time('12:30 PM'), 12 * 60 + 30)
+        self.assertEqual(parse_time('14:00'), 14 * 60)
+        self.assertEqual(parse_time('1400'), 14 * 60)
+        self.assertEqual(parse_time('23:59'), 23 * 60 + 59)
+        self.assertEqual(parse_time(600), 600)
+
+    def test_out_of_range(self):
+        for value in ['13:00 PM', '10:99', '2500', '24:00', '12:60 AM', '', 'noon']:
+            with self.subTest(value=value), self.assertRaises(ValueError):
+                parse_time(value)
+
+    def test_unusable_events_are_skipped(self):
+        self.assertIsNone(event_minutes(event('13:00 PM', '02:00 PM')))
+        self.assertIsNone(event_minutes(event('10:00 AM', '')))
+        self.assertIsNone(event_minutes(event('10:00 AM', '09:00 AM')))
+        room = RoomAvailability(record('2444', schedule={'Monday': [event('10:99', '11:00 AM'),
+                                                                    event('10:00 AM', '11:00 AM')]}))
+        self.assertEqual(room.days['Monday'], ([600], [660]))
+        self.assertEqual(room.skipped, 1)
+
+
+class RoomAvailabilityTest(unittest.TestCase):
+
+    def setUp(self):
+        self.room = RoomAvailability(record('2444', schedule=SCHEDULE))
+
+    def test_touching_and_overlapping_classes_merge(self):
+        self.assertEqual(self.room.days['Monday'], ([540, 780], [650, 900]))
+        self.assertEqual(self.room.days['Tuesday'], ([], []))
+        self.assertEqual(self.room.days['Sunday'], ([], []))
+
+    def test_is_free(self):
+        self.assertTrue(self.room.is_free('Monday', 480, 540))  # ends exactly at a class start
+        self.assertTrue(self.room.is_free('Monday', 650, 700))  # starts exactly at a class end
+        self.assertTrue(self.room.is_free('Monday', 650, 780))
+        self.assertFalse(self.room.is_free('Monday', 480, 541))
+        self.assertFalse(self.room.is_free('Monday', 649, 700))
+        self.assertFalse(self.room.is_free('Monday', 600, 610))
+        self.assertFalse(self.room.is_free('Monday', 500, 1000))  # spans both classes
+        self.assertTrue(self.room.is_free('Tuesday', DAY_START, DAY_END))
+        self.assertTrue(self.room.is_free('Wednesday', 600, 700))
+
+    def test_free_until(self):
+        self.assertEqual(self.room.free_until('Monday', 480), 540)
+        self.assertIsNone(self.room.free_until('Monday', 540))  # a class starts now
+        self.assertIsNone(self.room.free_until('Monday', 649))
+        self.assertEqual(self.room.free_until('Monday', 650), 780)  # a class just ended
+        self.assertEqual(self.room.free_until('Monday', 900), DAY_END)
+        self.assertEqual(self.room.free_until('Tuesday', 600), DAY_END)
+        self.assertEqual(self.room.free_until('Wednesday', 600), DAY_END)
+        self.assertEqual(self.room.free_until('Monday', 23 * 60), 23 * 60)  # past DAY_END
+
+    def test_next_change(self):
+        self.assertEqual(self.room.next_change('Monday', 539), (False, 540))
+        self.assertEqual(self.room.next_change('Monday', 540), (True, 650))
+        self.assertEqual(self.room.next_change('Monday', 600), (True, 650))
+        self.assertEqual(self.room.next_change('Monday', 650), (False, 780))
+        self.assertEqual(self.room.next_change('Monday', 900), (False, None))
+        self.assertEqual(self.room.next_change('Monday', 23 * 60), (False, None))
+        self.assertEqual(self.room.next_change('Tuesday', 600), (False, None))
+
+    def test_next_free_slot(self):
+        self.assertEqual(self.room.next_free_slot('Monday', 480), (480, 540))
+        self.assertEqual(self.room.next_free_slot('Monday', 480, 90), (650, 780))  # 8:00-9:00 is too short
+        self.assertEqual(self.room.next_free_slot('Monday', 540, 30), (650, 780))
+        self.assertEqual(self.room.next_free_slot('Monday', 600, 200), (900, DAY_END))
+        self.assertEqual(self.room.next_free_slot('Monday', 900, 60), (900, DAY_END))
+        self.assertIsNone(self.room.next_free_slot('Monday', 480, 24 * 60))
+        self.assertIsNone(self.room.next_free_slot('Monday', DAY_END))
+        self.assertIsNone(self.room.next_free_slot('Monday', 23 * 60))  # past DAY_END
+        self.assertEqual(self.room.next_free_slot('Tuesday', 480, 60), (480, DAY_END))
+        self.assertEqual(self.room.next_free_slot('Wednesday', 600), (600, DAY_END))
+
+    def test_free_slots(self):
+        self.assertEqual(self.room.free_slots('Monday'), [(480, 540), (650, 780), (900, DAY_END)])
+        self.assertEqual(self.room.free_slots('Monday', 540, 780), [(650, 780)])
+        self.assertEqual(self.room.free_slots('Monday', 600, 800), [(650, 780)])
+        self.assertEqual(self.room.free_slots('Monday', 660, 700), [(660, 700)])
+        self.assertEqual(self.room.free_slots('Monday', 800, 850), [])
+        self.assertEqual(self.room.free_slots('Monday', 23 * 60), [])  # past DAY_END
+        self.assertEqual(self.room.free_slots('Tuesday'), [(DAY_START, DAY_END)])
+        self.assertEqual(self.room.free_slots('Wednesday'), [(DAY_START, DAY_END)])
+
+
+class AvailabilityIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        classrooms = [
+            record('2444', 80, SCHEDULE),
+            record('2760', 20),
+            record('3400', None),
+            record('5249', 40, {'Monday': [event('10:00 AM', '11:00 AM')]}),
+            dict(record('4283', 30), offered=False),
+        ]
+        self.index = AvailabilityIndex(classrooms)
+
+    def free(self, day='Monday', start='11:00 AM', end='12:00 PM', **filters):
+        return [result['id'] for result in self.index.free_rooms(day, start, end, **filters)]
+
+    def test_free_rooms(self):
+        self.assertEqual(sorted(self.index.rooms), ['boelter-2444', 'boelter-2760', 'boelter-3400', 'boelter-5249'])
+        # Ranked by how long each room stays free, then smallest capacity
+        self.assertEqual(self.free(), ['boelter-3400', 'boelter-2760', 'boelter-5249', 'boelter-2444'])
+        self.assertEqual(self.free(start='10:00 AM', end='10:30 AM'), ['boelter-3400', 'boelter-2760'])
+        self.assertEqual(self.free(start='10:50 AM', end='11:00 AM'), ['boelter-3400', 'boelter-2760', 'boelter-2444'])
+
+    def test_capacity_filters(self):
+        # An unknown capacity passes a maximum but fails a minimum
+        self.assertEqual(self.free(min_cap=30), ['boelter-5249', 'boelter-2444'])
+        self.assertEqual(self.free(max_cap=40), ['boelter-3400', 'boelter-2760', 'boelter-5249'])
+        self.assertEqual(self.free(min_cap=30, max_cap=40), ['boelter-5249'])
+        self.assertEqual(self.free(min_cap=100), [])
+
+    def test_building_and_unknown_room(self):
+        self.assertEqual(self.free(building='Boelter Hall', min_cap=50), ['boelter-2444'])
+        self.assertEqual(self.free(building='MS'), [])
+        self.assertEqual(self.index.free_until('boelter-2444', 'Monday', '09:30 AM'), None)
+        self.assertEqual(self.index.next_free_slot('boelter-2444', 'Monday', '09:30 AM', 60), (650, 780))
+        with self.assertRaises(KeyError):
+            self.index.free_until('boelter-9999', 'Monday', '09:30 AM')
+
+    def test_unusable_times_are_reported(self):
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            AvailabilityIndex([record('2444', 80, {'Monday': [event('10:00 AM', '')]})])
+        self.assertIn('ignored 1 events', output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
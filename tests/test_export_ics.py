@@ -0,0 +1,96 @@
+"""
+Tests for export_ics: one room feed, written by export_calendars and parsed
+back, against the term dates in data/terms.json. Skipped when icalendar is not
+installed.
+
+Usage:
+    python -m pytest tests
+"""
+
+import datetime
+import os
+import shutil
+import tempfile
+import unittest
+from zoneinfo import ZoneInfo
+
+try:
+    import icalendar
+except ImportError:
+    icalendar = None
+
+import catalog
+from export_ics import TIMEZONE, export_calendars
+
+
+def event(course, start, end):
+    return {'course': course, 'type': 'LEC 1', 'start_time': start, 'end_time': end, 'enrolled': 60, 'capacity': 80}
+
+
+TUE_THU = event('COM SCI 31', '02:00 PM', '03:50 PM')
+MON_WED = event('COM SCI 32', '10:00 AM', '11:50 AM')
+# Primary term 25F, which is listed again under 'terms' with the same schedule, plus 26W
+RECORD = {
+    'text': 'BOELTER  2444', 'building': 'BOELTER', 'room': '2444', 'offered': True, 'term': '25F',
+    'schedule': {'Tuesday': [TUE_THU], 'Thursday': [TUE_THU]},
+    'terms': {
+        '25F': {'schedule': {'Tuesday': [TUE_THU], 'Thursday': [TUE_THU]}, 'no_calendar': False},
+        '26W': {'schedule': {'Monday': [MON_WED], 'Wednesday': [MON_WED]}, 'no_calendar': False},
+    },
+}
+# (term, SUMMARY, weekdays) of the sections the feed should hold
+EXPECTED = [('25F', 'COM SCI 31 LEC 1', {1, 3}), ('26W', 'COM SCI 32 LEC 1', {0, 2})]
+
+
+@unittest.skipIf(icalendar is None, "icalendar is not installed")
+class RoomFeedTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.dir = tempfile.mkdtemp()
+        export_calendars([RECORD], cls.dir)
+        with open(os.path.join(cls.dir, 'rooms', 'boelter-2444.ics'), 'rb') as f:
+            cls.events = icalendar.Calendar.from_ical(f.read()).walk('VEVENT')
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.dir)
+
+    def test_one_event_per_section_and_term(self):
+        uids = [str(component['UID']) for component in self.events]
+        self.assertEqual(len(uids), len(set(uids)))
+        self.assertEqual([str(component['SUMMARY']) for component in self.events],
+                         [summary for _, summary, _ in EXPECTED])
+
+    def test_recurrence_matches_term_dates(self):
+        dates = catalog.term_dates()
+        for component, (term, _, weekdays) in zip(self.events, EXPECTED):
+            with self.subTest(term=term):
+                start = datetime.date.fromisoformat(dates[term]['start'])
+                end = datetime.date.fromisoformat(dates[term]['end'])
+                holidays = [datetime.date.fromisoformat(day) for day in dates[term]['holidays']]
+
+                first = component.decoded('DTSTART')
+                self.assertEqual(str(first.tzinfo), TIMEZONE)
+                self.assertEqual(first.date(), min(start + datetime.timedelta(offset) for offset in range(7)
+                                                   if (start + datetime.timedelta(offset)).weekday() in weekdays))
+
+                rrule = component['RRULE']
+                self.assertEqual(rrule['FREQ'], ['WEEKLY'])
+                self.assertEqual({['MO', 'TU', 'WE', 'TH', 'FR', 'SA', 'SU'].index(day) for day in rrule['BYDAY']},
+                                 weekdays)
+                until, = rrule['UNTIL']
+                self.assertEqual(until.utcoffset(), datetime.timedelta(0))
+                self.assertEqual(until.astimezone(ZoneInfo(TIMEZONE)).replace(tzinfo=None),
+                                 datetime.datetime.combine(end, datetime.time(23, 59, 59)))
+
+                exdates = component.get('EXDATE')
+                exdates = exdates if isinstance(exdates, list) else [exdates] if exdates else []
+                excluded = [value.dt for exdate in exdates for value in exdate.dts]
+                self.assertEqual([day.date() for day in excluded],
+                                 [day for day in holidays if day.weekday() in weekdays])
+                self.assertTrue(all(day.time() == first.time() for day in excluded))
+
+
+if __name__ == '__main__':
+    unittest.main()
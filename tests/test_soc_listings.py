@@ -0,0 +1,164 @@
+"""
+Replay tests for soc_listings against results pages in tests/fixtures/soc.
+
+The fixtures are stored the way --record saves them (file names from
+PageSource.page_name) for term 25F:
+
+    COM SCI  page 1: COM SCI 31 (LEC 1, DIS 1A, an unscheduled DIS 1B) and 32 (LEC 1, online LEC 2)
+             page 2: COM SCI 33; page 3 repeats page 2, which ends the subject
+    MATH     page 1: MATH 31A; page 2 has no sections
+    HIST     page 1: HIST 149A LEC 1, moved to MS 5200, and a cancelled LEC 2; page 2 has no sections
+
+Usage:
+    python -m pytest tests
+"""
+
+import contextlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from availability import DAYS
+from soc_listings import PageSource, fetch_subject, invert_meetings, main, parse_listing_page, subject_params
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'soc')
+TERM = '25F'
+
+COM_SCI_PAGE_1 = [
+    {'course': 'COM SCI 31', 'type': 'LEC 1', 'days': ['Monday', 'Wednesday'], 'start_time': '02:00 PM',
+     'end_time': '03:50 PM', 'location': 'Boelter Hall 2444', 'enrolled': 112, 'capacity': 160},
+    {'course': 'COM SCI 31', 'type': 'DIS 1A', 'days': ['Friday'], 'start_time': '10:00 AM',
+     'end_time': '11:50 AM', 'location': 'Boelter Hall 2760', 'enrolled': 30, 'capacity': 30},
+    {'course': 'COM SCI 32', 'type': 'LEC 1', 'days': ['Tuesday', 'Thursday'], 'start_time': '10:00 AM',
+     'end_time': '11:50 AM', 'location': 'Mathematical Sciences 5200', 'enrolled': None, 'capacity': None},
+    {'course': 'COM SCI 32', 'type': 'LEC 2', 'days': ['Tuesday', 'Thursday'], 'start_time': '04:00 PM',
+     'end_time': '05:50 PM', 'location': 'Online - Recorded', 'enrolled': 40, 'capacity': 200},
+]
+COM_SCI_PAGE_2 = [
+    {'course': 'COM SCI 33', 'type': 'LEC 1', 'days': ['Monday', 'Wednesday', 'Friday'], 'start_time': '09:00 AM',
+     'end_time': '09:50 AM', 'location': 'Boelter Hall 3400', 'enrolled': 150, 'capacity': 150},
+]
+MATH_PAGE_1 = [
+    {'course': 'MATH 31A', 'type': 'LEC 1', 'days': ['Monday', 'Wednesday', 'Friday'], 'start_time': '08:00 AM',
+     'end_time': '08:50 AM', 'location': 'Boelter Hall 2444', 'enrolled': 201, 'capacity': 240},
+]
+
+
+def read_fixture(subject, page=1):
+    with open(os.path.join(FIXTURES, PageSource.page_name(subject_params(TERM, subject, page))), 'r',
+              encoding='utf-8') as f:
+        return f.read()
+
+
+def room(building, number, schedule=None):
+    return {'text': f"{building:<8} {number}", 'building': building, 'room': number, 'offered': True,
+            'schedule': schedule or {day: [] for day in DAYS}, 'no_calendar': schedule is None}
+
+
+class ParseListingPageTest(unittest.TestCase):
+
+    def test_section_rows(self):
+        self.assertEqual(parse_listing_page(read_fixture('COM SCI'), 'COM SCI'), COM_SCI_PAGE_1)
+
+    def test_page_without_sections(self):
+        self.assertEqual(parse_listing_page(read_fixture('MATH', 2), 'MATH'), [])
+
+
+class ReplayTest(unittest.TestCase):
+
+    def setUp(self):
+        self.source = PageSource(replay_dir=FIXTURES)
+
+    def test_follows_pages_until_one_repeats(self):
+        self.assertEqual(fetch_subject(self.source, TERM, 'COM SCI'), COM_SCI_PAGE_1 + COM_SCI_PAGE_2)
+
+    def test_stops_at_an_empty_page(self):
+        self.assertEqual(fetch_subject(self.source, TERM, 'MATH'), MATH_PAGE_1)
+
+    def test_cancelled_section_is_skipped(self):
+        self.assertEqual([(m['course'], m['type'], m['location']) for m in fetch_subject(self.source, TERM, 'HIST')],
+                         [('HIST 149A', 'LEC 1', 'Mathematical Sciences 5200')])
+
+    def test_unrecorded_subject_fails(self):
+        self.assertIsNone(fetch_subject(self.source, TERM, 'PHYSICS'))
+
+    def test_invert_meetings(self):
+        meetings = fetch_subject(self.source, TERM, 'COM SCI') + fetch_subject(self.source, TERM, 'MATH')
+        results, unmatched = invert_meetings(meetings, {'BOELTER', 'MS'})
+        self.assertEqual(sorted(results), ['BOELTER|2444', 'BOELTER|2760', 'BOELTER|3400', 'MS|5200'])
+        self.assertEqual(unmatched, {'Online - Recorded'})
+        monday = results['BOELTER|2444']['schedule']['Monday']
+        self.assertEqual([(event['course'], event['start_time']) for event in monday],
+                         [('MATH 31A', '08:00 AM'), ('COM SCI 31', '02:00 PM')])
+        self.assertEqual(results['BOELTER|2444']['schedule']['Tuesday'], [])
+
+
+class MainTest(unittest.TestCase):
+    """main() against a small classrooms.json in a temporary working directory."""
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.dir = tempfile.mkdtemp()
+        os.chdir(self.dir)
+        old_class = {'course': 'HIST    149A', 'type': 'LEC 1', 'start_time': '02:00 PM', 'end_time': '03:15 PM',
+                     'enrolled': 76, 'capacity': 80}
+        self.classrooms = [
+            room('BOELTER', '02444', {'Monday': [old_class], 'Wednesday': [old_class]}),
+            room('BOELTER', '02808', {'Tuesday': [old_class]}),
+            room('MS', '5200'),
+        ]
+        with open('classrooms.json', 'w') as f:
+            json.dump(self.classrooms, f, indent=4)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.dir)
+
+    def run_main(self, subjects, replay_dir=FIXTURES):
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            main(term=TERM, subjects=subjects, workers=2, replay_dir=replay_dir)
+        with open('classrooms.json', 'r') as f:
+            return json.load(f), output.getvalue()
+
+    def test_complete_fetch_replaces_every_room(self):
+        classrooms, output = self.run_main(['COM SCI', 'MATH', 'HIST'])
+        boelter_2444, boelter_2808, ms_5200 = classrooms
+        self.assertEqual([event['course'] for event in boelter_2444['schedule']['Monday']], ['MATH 31A', 'COM SCI 31'])
+        self.assertEqual(boelter_2444['term'], TERM)
+        # HIST 149A moved to MS 5200, which leaves BOELTER 2808 without classes
+        self.assertEqual(boelter_2808['schedule'], {day: [] for day in DAYS})
+        self.assertEqual((boelter_2808['term'], boelter_2808['no_calendar']), (TERM, False))
+        self.assertEqual([event['course'] for event in ms_5200['schedule']['Monday']], ['HIST 149A'])
+        self.assertEqual([event['course'] for event in ms_5200['schedule']['Tuesday']], ['COM SCI 32'])
+        self.assertFalse(ms_5200['no_calendar'])
+        self.assertIn('Rooms with classes: 2/3 | Cleared: 1', output)
+
+    def test_other_term_is_stored_under_terms(self):
+        self.classrooms[1]['term'] = '25S'
+        with open('classrooms.json', 'w') as f:
+            json.dump(self.classrooms, f)
+        classrooms, _ = self.run_main(['COM SCI', 'MATH', 'HIST'])
+        self.assertEqual(classrooms[1]['schedule'], self.classrooms[1]['schedule'])
+        self.assertEqual(classrooms[1]['terms'][TERM], {'schedule': {day: [] for day in DAYS}, 'no_calendar': False})
+
+    def test_failed_subject_writes_nothing(self):
+        classrooms, output = self.run_main(['COM SCI', 'PHYSICS'])
+        self.assertEqual(classrooms, self.classrooms)
+        self.assertIn('ERROR: 1 subjects failed (PHYSICS)', output)
+
+    def test_no_meetings_writes_nothing(self):
+        # Markup the parser does not recognise: every page parses to nothing
+        replay_dir = os.path.join(self.dir, 'pages')
+        os.makedirs(replay_dir)
+        with open(os.path.join(replay_dir, PageSource.page_name(subject_params(TERM, 'MATH'))), 'w') as f:
+            f.write(read_fixture('MATH').replace('Column', 'Cell'))
+        classrooms, output = self.run_main(['MATH'], replay_dir)
+        self.assertEqual(classrooms, self.classrooms)
+        self.assertIn('ERROR: No meetings parsed', output)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+"""
+Tests for utilization's campus and building aggregates on a small hand-made
+schedule. Skipped when NumPy is not installed.
+
+Usage:
+    python -m pytest tests
+"""
+
+import unittest
+
+try:
+    import numpy  # noqa: F401
+except ImportError:
+    numpy = None
+
+from availability import AvailabilityIndex
+
+if numpy is not None:
+    from utilization import compute_utilization
+
+
+def record(number, capacity, events):
+    return {'text': f"BOELTER  {number}", 'building': 'BOELTER', 'room': number, 'offered': True,
+            'capacity': capacity, 'schedule': {'Monday': events}}
+
+
+def event(start, end, enrolled):
+    return {'course': 'COM SCI 31', 'type': 'LEC 1', 'start_time': start, 'end_time': end,
+            'enrolled': enrolled, 'capacity': None}
+
+
+@unittest.skipIf(numpy is None, "requires NumPy")
+class ComputeUtilizationTest(unittest.TestCase):
+
+    def test_rooms_without_capacity_are_left_out_of_loads(self):
+        report = compute_utilization(AvailabilityIndex([
+            record('2444', 100, [event('10:00 AM', '11:00 AM', 50)]),
+            record('3400', None, [event('10:00 AM', '11:00 AM', 300)]),
+        ]))
+        # Monday 10:00-11:00: both rooms are booked; only the one with a capacity counts towards the load
+        self.assertEqual(report['campus']['booked'][0][10], 1.0)
+        self.assertEqual(report['campus']['load'][0][10], 0.5)
+        building = report['buildings']['BOELTER']
+        self.assertEqual(building['load_by_hour'][0][10], 0.5)
+        self.assertEqual(building['booked'][0][10], 1.0)
+        self.assertEqual(building['load'], round(50 * 60 / (100 * report['open_minutes']), 3))
+        self.assertEqual([room['load'] for room in report['rooms']], [building['load'], None])
+
+    def test_no_rooms(self):
+        report = compute_utilization(AvailabilityIndex([]))
+        self.assertEqual(report['buildings'], {})
+        self.assertEqual(report['rooms'], [])
+        self.assertTrue(all(value is None for row in report['campus']['booked'] for value in row))
+        self.assertTrue(all(value is None for row in report['campus']['load'] for value in row))
+
+    def test_no_capacities(self):
+        report = compute_utilization(AvailabilityIndex([record('3400', None, [event('10:00 AM', '11:00 AM', 30)])]))
+        self.assertEqual(report['campus']['booked'][0][10], 1.0)
+        self.assertIsNone(report['campus']['load'][0][10])
+        self.assertIsNone(report['buildings']['BOELTER']['load'])
+
+
+if __name__ == '__main__':
+    unittest.main()
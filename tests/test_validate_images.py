@@ -0,0 +1,141 @@
+"""
+Tests for validate_images against a local http.server stand-in, reached
+through --base-url's rebasing exactly as a manual run would be.
+
+Usage:
+    python -m pytest tests
+"""
+
+import http.server
+import socket
+import threading
+import unittest
+
+from validate_images import DEAD, OK, UNREACHABLE, apply_results, validate_urls
+
+# Path -> (status, content type, body); HEAD gets the same status and headers without the body
+ROUTES = {
+    '/photos/ok.jpg': (200, 'image/jpeg', b'\xff\xd8\xff\xe0 jpeg'),
+    '/photos/page.jpg': (200, 'text/html; charset=utf-8', b'<html>Not found</html>'),
+    '/photos/empty.jpg': (200, 'image/jpeg', b''),
+    '/photos/missing.jpg': (404, 'text/html', b'Not Found'),
+    '/photos/removed.jpg': (410, 'text/html', b'Gone'),
+    '/photos/throttled.jpg': (429, 'text/plain', b'Too Many Requests'),
+    '/photos/timeout.jpg': (408, 'text/plain', b'Request Timeout'),
+    '/photos/forbidden.jpg': (403, 'text/plain', b'Forbidden'),
+    '/photos/broken.jpg': (503, 'text/plain', b'Service Unavailable'),
+}
+GET_ONLY = '/photos/get-only.png'
+
+
+class StandInHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def respond(self, send_body):
+        if self.path == GET_ONLY:
+            status, content_type, body = (200, 'image/png', b'\x89PNG') if send_body else (405, 'text/plain', b'')
+        else:
+            status, content_type, body = ROUTES.get(self.path, (404, 'text/plain', b'Not Found'))
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def do_HEAD(self):
+        self.respond(False)
+
+    def do_GET(self):
+        self.respond(True)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def original_url(path):
+    return f"https://dts.ucla.edu{path}"
+
+
+class ValidateUrlsTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), StandInHandler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def validate(self, paths, cache, base_url=None):
+        results, requests = validate_urls([original_url(path) for path in paths], workers=4, cache=cache,
+                                          base_url=base_url or self.base_url)
+        return {path: results[original_url(path)] for path in paths}, requests
+
+    def test_verdicts_and_caching(self):
+        cache = {}
+        results, requests = self.validate(list(ROUTES) + [GET_ONLY], cache)
+        self.assertEqual(requests, len(ROUTES) + 1)
+        self.assertEqual({path: result['status'] for path, result in results.items()}, {
+            '/photos/ok.jpg': OK,
+            GET_ONLY: OK,
+            '/photos/page.jpg': DEAD,
+            '/photos/empty.jpg': DEAD,
+            '/photos/missing.jpg': DEAD,
+            '/photos/removed.jpg': DEAD,
+            '/photos/throttled.jpg': UNREACHABLE,
+            '/photos/timeout.jpg': UNREACHABLE,
+            '/photos/forbidden.jpg': UNREACHABLE,
+            '/photos/broken.jpg': UNREACHABLE,
+        })
+        self.assertEqual(results['/photos/throttled.jpg']['http_status'], 429)
+        self.assertEqual(results['/photos/page.jpg']['content_type'], 'text/html')
+
+        # Cached under the original URLs: ok and dead verdicts only
+        self.assertEqual(sorted(cache), sorted(original_url(path) for path in [
+            '/photos/ok.jpg', GET_ONLY, '/photos/page.jpg', '/photos/empty.jpg', '/photos/missing.jpg',
+            '/photos/removed.jpg']))
+        _, requests = self.validate(list(ROUTES), cache)
+        self.assertEqual(requests, 4)  # only the unreachable ones are checked again
+
+    def test_unreachable_replaces_a_cached_verdict(self):
+        cache = {original_url('/photos/throttled.jpg'): {'status': DEAD, 'http_status': 404, 'content_type': None,
+                                                          'bytes': None, 'checked_at': 0}}
+        results, _ = self.validate(['/photos/throttled.jpg'], cache)
+        self.assertEqual(results['/photos/throttled.jpg']['status'], UNREACHABLE)
+        self.assertEqual(cache, {})
+
+    def test_connection_refused(self):
+        with socket.socket() as closed:
+            closed.bind(('127.0.0.1', 0))
+            port = closed.getsockname()[1]
+        cache = {}
+        results, _ = self.validate(['/photos/ok.jpg'], cache, base_url=f"http://127.0.0.1:{port}")
+        self.assertEqual(results['/photos/ok.jpg']['status'], UNREACHABLE)
+        self.assertIsNone(results['/photos/ok.jpg']['http_status'])
+        self.assertIn('error', results['/photos/ok.jpg'])
+        self.assertEqual(cache, {})
+
+    def test_only_dead_images_are_dropped(self):
+        paths = ['/photos/ok.jpg', '/photos/missing.jpg', '/photos/page.jpg', '/photos/throttled.jpg']
+        results, _ = self.validate(paths, {})
+        results = {original_url(path): result for path, result in results.items()}
+        rooms = [{'text': path, 'image_url': original_url(path), 'image': {'src': 'x'}} for path in paths]
+
+        dead = apply_results(rooms, results)
+        self.assertEqual([(room['text'], error) for room, error in dead],
+                         [('/photos/missing.jpg', 'HTTP 404'), ('/photos/page.jpg', 'not an image (text/html)')])
+        self.assertEqual([room['text'] for room in rooms if 'image_url' in room],
+                         ['/photos/ok.jpg', '/photos/throttled.jpg'])
+
+        rooms = [{'text': path, 'image_url': original_url(path)} for path in paths]
+        apply_results(rooms, results, flag=True)
+        self.assertEqual([room.get('image_error') for room in rooms], [None, 'HTTP 404', 'not an image (text/html)', None])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,191 @@
+"""
+Campus Utilization Heatmaps
+
+Aggregates the scraped schedules across rooms for facilities reporting:
+booked minutes and seat load per room, per building and per hour of the week.
+
+Built on the occupancy matrix from occupancy.py (rooms x 5-minute week
+slots), plus a parallel matrix of enrolled students per slot, so every
+aggregate is a reshape and a sum rather than another pass over the time
+strings. Minutes are counted in whole slots, like the matrix itself:
+
+    booked share   fraction of the time (and rooms) with a class in progress
+    seat load      enrolled seat-minutes / room seat-minutes, counting empty
+                   time as zero load; rooms without a capacity are left out
+
+A room's utilization is its booked minutes between DAY_START and DAY_END on
+OPEN_DAYS, divided by those open minutes. The hour-of-week tables cover all
+7 x 24 hours, so weekend and evening classes still show up.
+
+Outputs (values rounded to 3 decimals; a share or load with nothing to divide
+by, e.g. no rooms with a capacity, is null / empty):
+    utilization.json         {'days', 'hours', 'open_minutes', 'campus': {'booked', 'load'},
+                              'buildings': {CODE: {'rooms', 'utilization', 'load', 'booked', 'load_by_hour'}},
+                              'rooms': [{'id', 'building', 'capacity', 'booked_minutes', 'utilization', 'load'}]}
+                             'booked' / 'load' / 'load_by_hour' are [day][hour] tables
+    utilization_rooms.csv    one row per room
+    utilization_hours.csv    one row per (building or CAMPUS, day, hour)
+
+Requires NumPy (pip install numpy).
+
+Usage:
+    python utilization.py [--term=26W] [--out=.]
+"""
+
+import csv
+import json
+import os
+
+import numpy as np
+
+from availability import DAY_END, DAY_START, DAYS, AvailabilityIndex, event_minutes, schedule_for
+from occupancy import OccupancyMatrix
+
+OPEN_DAYS = DAYS[:5]
+JSON_FILE = 'utilization.json'
+ROOMS_CSV = 'utilization_rooms.csv'
+HOURS_CSV = 'utilization_hours.csv'
+
+
+def enrolled_matrix(index, matrix):
+    """Rooms x week-slots float matrix of students in class (overlapping sections add up)."""
+    enrolled = np.zeros(matrix.busy.shape, dtype=np.float32)
+    for row, rid in enumerate(matrix.ids):
+        schedule = schedule_for(index.rooms[rid].record, index.term) or {}
+        for day_number, day in enumerate(DAYS):
+            offset = day_number * matrix.slots_per_day
+            for event in schedule.get(day) or []:
+                minutes = event_minutes(event)
+                if minutes is None:
+                    continue  # Left out of the busy matrix too (see AvailabilityIndex)
+                first, last = matrix.slot_range(*minutes)
+                enrolled[row, offset + first:offset + last] += event.get('enrolled') or 0
+    return enrolled
+
+
+def ratio(numerator, denominator):
+    """Elementwise numerator / denominator with NaN where the denominator is 0."""
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(denominator > 0, numerator / denominator, np.nan)
+
+
+def table(values):
+    """Nested lists rounded to 3 decimals, NaN as None, for compact JSON."""
+    return np.vectorize(lambda v: None if np.isnan(v) else round(float(v), 3), otypes=[object])(values).tolist()
+
+
+def compute_utilization(index):
+    """
+    Per-room, per-building and campus-wide utilization for an AvailabilityIndex.
+
+    Returns:
+        The utilization.json document (see module docstring)
+    """
+    matrix = OccupancyMatrix(index)
+    rooms, slots = matrix.busy.shape
+    per_hour = 60 // matrix.slot_minutes
+    busy = matrix.busy.astype(np.float32)
+    enrolled = enrolled_matrix(index, matrix)
+
+    # (rooms, day, hour): booked minutes and enrolled seat-minutes in each hour of the week
+    booked_hours = busy.reshape(rooms, len(DAYS), 24, per_hour).sum(axis=3) * matrix.slot_minutes
+    seat_hours = enrolled.reshape(rooms, len(DAYS), 24, per_hour).sum(axis=3) * matrix.slot_minutes
+    capacity = np.nan_to_num(matrix.capacity)
+    has_capacity = (capacity > 0).astype(np.float32)
+    # Seat-minutes of rooms with a capacity: the only ones a load can be computed for
+    counted_seat_hours = seat_hours * has_capacity[:, None, None]
+
+    # Booked minutes inside the open hours, for the utilization ratio
+    open_slots = np.zeros(slots, dtype=bool)
+    for day in OPEN_DAYS:
+        offset = DAYS.index(day) * matrix.slots_per_day
+        open_slots[offset + DAY_START // matrix.slot_minutes:offset + DAY_END // matrix.slot_minutes] = True
+    open_minutes = int(open_slots.sum()) * matrix.slot_minutes
+    booked_open = busy[:, open_slots].sum(axis=1) * matrix.slot_minutes
+    seats_open = enrolled[:, open_slots].sum(axis=1) * matrix.slot_minutes
+    booked_week = busy.sum(axis=1) * matrix.slot_minutes
+
+    # One-hot building membership turns every per-building sum into a matrix product
+    codes = sorted(matrix.building_codes, key=matrix.building_codes.get)
+    membership = (matrix.building[None, :] == np.arange(len(codes))[:, None]).astype(np.float32)
+    building_rooms = membership.sum(axis=1)
+    building_booked = np.tensordot(membership, booked_hours, axes=1)
+    building_seats = np.tensordot(membership, counted_seat_hours, axes=1)
+    building_capacity = membership @ capacity
+
+    return {
+        'days': DAYS,
+        'hours': list(range(24)),
+        'open_minutes': open_minutes,
+        'campus': {
+            'booked': table(ratio(booked_hours.sum(axis=0), rooms * 60)),
+            'load': table(ratio(counted_seat_hours.sum(axis=0), capacity.sum() * 60)),
+        },
+        'buildings': {
+            code: {
+                'rooms': int(building_rooms[b]),
+                'utilization': table(membership[b] @ booked_open / (building_rooms[b] * open_minutes)),
+                'load': table(ratio(membership[b] @ (seats_open * has_capacity), building_capacity[b] * open_minutes)),
+                'booked': table(building_booked[b] / (building_rooms[b] * 60)),
+                'load_by_hour': table(ratio(building_seats[b], building_capacity[b] * 60)),
+            }
+            for b, code in enumerate(codes)
+        },
+        'rooms': [
+            {
+                'id': rid,
+                'building': codes[matrix.building[row]],
+                'capacity': index.rooms[rid].record.get('capacity'),
+                'booked_minutes': int(booked_week[row]),
+                'utilization': table(booked_open[row] / open_minutes),
+                'load': table(ratio(seats_open[row], capacity[row] * open_minutes)),
+            }
+            for row, rid in enumerate(matrix.ids)
+        ],
+    }
+
+
+def write_outputs(report, out_dir='.'):
+    """Write utilization.json and the two CSV exports; returns their paths."""
+    json_path = os.path.join(out_dir, JSON_FILE)
+    with open(json_path, 'w') as f:
+        json.dump(report, f, separators=(',', ':'))
+
+    rooms_path = os.path.join(out_dir, ROOMS_CSV)
+    with open(rooms_path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=['id', 'building', 'capacity', 'booked_minutes', 'utilization', 'load'])
+        writer.writeheader()
+        writer.writerows(report['rooms'])
+
+    hours_path = os.path.join(out_dir, HOURS_CSV)
+    with open(hours_path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['building', 'day', 'hour', 'booked_share', 'seat_load'])
+        tables = [('CAMPUS', report['campus']['booked'], report['campus']['load'])]
+        tables += [(code, b['booked'], b['load_by_hour']) for code, b in report['buildings'].items()]
+        for name, booked, load in tables:
+            for d, day in enumerate(report['days']):
+                for hour in report['hours']:
+                    writer.writerow([name, day, hour, booked[d][hour], load[d][hour]])
+    return json_path, rooms_path, hours_path
+
+
+def main(term=None, out_dir='.'):
+    index = AvailabilityIndex.from_file('classrooms.json', term=term)
+    report = compute_utilization(index)
+    paths = write_outputs(report, out_dir)
+
+    print(f"{len(report['rooms'])} rooms | {len(report['buildings'])} buildings | "
+          f"open hours: {', '.join(OPEN_DAYS)} {DAY_START // 60}:00-{DAY_END // 60}:00")
+    busiest = sorted(report['buildings'].items(), key=lambda item: -(item[1]['utilization'] or 0))
+    for code, building in busiest:
+        load = f"{building['load']:.0%}" if building['load'] is not None else '?'
+        print(f"  {code:<10} {building['rooms']:>3} rooms  utilization {building['utilization']:.0%}  seat load {load}")
+    print(f"Wrote {', '.join(paths)}")
+
+
+if __name__ == "__main__":
+    import sys
+
+    options = dict(arg.partition('=')[::2] for arg in sys.argv[1:] if arg.startswith('--'))
+    main(term=options.get('--term') or None, out_dir=options.get('--out') or '.')
@@ -0,0 +1,206 @@
+"""
+Image URL Validation
+
+Checks every image_url in classrooms.json before publishing, so dead photos
+are removed at build time instead of being requested (and hidden by onerror)
+on every visitor's device.
+
+Each distinct URL gets one HEAD request (GET when the server rejects HEAD)
+from a thread pool over keep-alive connections. The HTTP status, content type
+and size are recorded, and the verdict is cached in image_check_cache.json for
+CACHE_TTL:
+
+    ok           - 200 with an image content type
+    dead         - 404 or 410, or a 200 that is not an image
+    unreachable  - network error, 5xx, throttling (408, 429, 403 from a CDN)
+                   or any other status; never cached and never dropped, since
+                   it is usually temporary
+
+Dead images are dropped from their rooms (image_url and image), or with --flag
+kept and marked with 'image_error', which the frontend also skips.
+
+Usage:
+    python validate_images.py [--workers=16] [--flag] [--refresh] [--dry-run]
+    python validate_images.py --base-url=http://localhost:8000   # local stand-in server
+"""
+
+import json
+import os
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+from http_pool import PooledHTTP
+
+CACHE_PATH = 'image_check_cache.json'
+CACHE_TTL = 24 * 3600
+
+OK = 'ok'
+DEAD = 'dead'
+UNREACHABLE = 'unreachable'
+
+# Statuses that mean the image is gone; anything else that is not a 200 may be temporary
+GONE_STATUSES = (404, 410)
+
+
+def rebase_url(url, base_url):
+    """Point url at another scheme and host (e.g. a local test server), keeping path and query."""
+    parts = urllib.parse.urlsplit(url)
+    base = urllib.parse.urlsplit(base_url)
+    return urllib.parse.urlunsplit((base.scheme, base.netloc, base.path.rstrip('/') + parts.path, parts.query, ''))
+
+
+def check_url(url, client):
+    """
+    Request one image URL and classify it.
+
+    Returns:
+        Dictionary with 'status' (OK, DEAD or UNREACHABLE), 'http_status',
+        'content_type', 'bytes' and 'checked_at'
+    """
+    result = {'status': UNREACHABLE, 'http_status': None, 'content_type': None, 'bytes': None,
+              'checked_at': time.time()}
+    try:
+        response = client.head(url)
+        if response.status in (405, 501):
+            # HEAD not supported: fall back to GET
+            response = client.get(url)
+    except Exception as e:
+        result['error'] = str(e)
+        return result
+
+    content_type = response.headers.get('content-type', '').split(';')[0].strip().lower()
+    length = response.headers.get('content-length')
+    result['http_status'] = response.status
+    result['content_type'] = content_type or None
+    result['bytes'] = int(length) if length and length.isdigit() else (len(response.body) or None)
+
+    if response.status in GONE_STATUSES:
+        result['status'] = DEAD
+    elif response.status != 200:
+        result['status'] = UNREACHABLE
+    elif not content_type.startswith('image/') or result['bytes'] == 0:
+        result['status'] = DEAD
+    else:
+        result['status'] = OK
+    return result
+
+
+def load_cache(path=CACHE_PATH):
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def save_cache(cache, path=CACHE_PATH):
+    with open(path, 'w') as f:
+        json.dump(cache, f, indent=4)
+
+
+def validate_urls(urls, workers=16, cache=None, max_age=CACHE_TTL, base_url=None, client=None):
+    """
+    Check many image URLs concurrently, reusing cached verdicts younger than max_age.
+
+    Args:
+        urls: Image URLs to check
+        cache: {url: result} from an earlier run; updated in place
+        base_url: Send the requests to this scheme and host instead (results stay keyed by the original URL)
+
+    Returns:
+        {url: result} for every URL, and the number of requests sent
+    """
+    cache = {} if cache is None else cache
+    client = client or PooledHTTP(timeout=15)
+    now = time.time()
+
+    results = {}
+    pending = []
+    for url in dict.fromkeys(urls):
+        cached = cache.get(url)
+        if cached and now - cached['checked_at'] < max_age:
+            results[url] = cached
+        else:
+            pending.append(url)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        checked = executor.map(lambda url: check_url(rebase_url(url, base_url) if base_url else url, client), pending)
+        for url, result in zip(pending, checked):
+            results[url] = result
+            if result['status'] == UNREACHABLE:
+                cache.pop(url, None)
+            else:
+                cache[url] = result
+    return results, len(pending)
+
+
+def apply_results(classrooms, results, flag=False):
+    """
+    Drop dead images from their rooms, or with flag=True mark them with 'image_error'.
+
+    Returns:
+        List of (room, error) for rooms whose image is dead
+    """
+    dead = []
+    for room in classrooms:
+        result = results.get(room.get('image_url'))
+        if result is None:
+            continue
+        if result['status'] != DEAD:
+            room.pop('image_error', None)
+            continue
+        error = f"HTTP {result['http_status']}" if result['http_status'] != 200 else f"not an image ({result['content_type']})"
+        dead.append((room, error))
+        if flag:
+            room['image_error'] = error
+        else:
+            room.pop('image_url', None)
+            room.pop('image', None)
+            room.pop('image_error', None)
+    return dead
+
+
+def main(workers=16, flag=False, refresh=False, dry_run=False, base_url=None):
+    with open('classrooms.json', 'r') as f:
+        classrooms = json.load(f)
+
+    cache = load_cache()
+    urls = [room['image_url'] for room in classrooms if room.get('image_url')]
+    started = time.perf_counter()
+    results, requests = validate_urls(urls, workers, cache, 0 if refresh else CACHE_TTL, base_url)
+    save_cache(cache)
+
+    counts = {OK: 0, DEAD: 0, UNREACHABLE: 0}
+    for result in results.values():
+        counts[result['status']] += 1
+    print(f"Checked {len(results)} image URLs ({requests} requests, {len(results) - requests} cached) "
+          f"in {time.perf_counter() - started:.1f}s | OK: {counts[OK]} | Dead: {counts[DEAD]} | "
+          f"Unreachable: {counts[UNREACHABLE]}")
+    for url, result in sorted(results.items()):
+        if result['status'] == UNREACHABLE:
+            print(f"  UNREACHABLE {url}: {result.get('error') or result['http_status']}")
+
+    dead = apply_results(classrooms, results, flag)
+    for room, error in dead:
+        print(f"  DEAD {room['text']}: {error}")
+
+    if dry_run:
+        print("Dry run: classrooms.json not modified")
+        return
+    with open('classrooms.json', 'w') as f:
+        json.dump(classrooms, f, indent=4)
+    print(f"{'Flagged' if flag else 'Dropped'} {len(dead)} dead images in classrooms.json")
+
+
+if __name__ == "__main__":
+    import sys
+
+    options = dict(arg.partition('=')[::2] for arg in sys.argv[1:] if arg.startswith('--'))
+    main(workers=int(options.get('--workers') or 16),
+         flag='--flag' in options,
+         refresh='--refresh' in options,
+         dry_run='--dry-run' in options,
+         base_url=options.get('--base-url') or None)